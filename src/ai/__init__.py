@@ -0,0 +1,8 @@
+"""
+Search-based AI player built on the game engine.
+"""
+
+from .player import AIPlayer, HeuristicWeights
+from .transposition import TranspositionTable
+
+__all__ = ['AIPlayer', 'HeuristicWeights', 'TranspositionTable']
@@ -0,0 +1,262 @@
+import random
+import time
+from typing import FrozenSet, NamedTuple, Optional, Sequence, Tuple
+from src.engine.game_state import GameState
+from src.engine.placements import Placement, placements_from_masks
+from src.engine.tetromino import Tetromino
+from src.engine.zobrist import MASK64, row_multiplier, splitmix64
+from .transposition import TranspositionTable
+
+Rows = Tuple[int, ...]
+
+
+class HeuristicWeights(NamedTuple):
+    """Weights of the board evaluation features; higher totals are better."""
+    aggregate_height: float = -0.510066
+    holes: float = -0.35663
+    bumpiness: float = -0.184483
+    lines_cleared: float = 0.760666
+
+
+def board_features(rows: Sequence[int], width: int) -> Tuple[int, int, int]:
+    """Return (aggregate height, holes, bumpiness) of a row-mask board."""
+    height = len(rows)
+    heights = [0] * width
+    covered = 0
+    holes = 0
+    for y, row in enumerate(rows):
+        new = row & ~covered
+        while new:
+            bit = new & -new
+            heights[bit.bit_length() - 1] = height - y
+            new ^= bit
+        covered |= row
+        holes += bin(covered & ~row).count('1')
+    bumpiness = sum(abs(heights[x] - heights[x + 1]) for x in range(width - 1))
+    return sum(heights), holes, bumpiness
+
+
+def _mask_key(row: int) -> int:
+    """Return the hash of a row mask; empty rows hash to 0."""
+    return splitmix64(row) if row else 0
+
+
+def rows_hash(rows: Sequence[int]) -> int:
+    """Return the 64-bit occupancy hash of a row-mask board.
+
+    Built like ``Board.hash`` (row hashes positioned by powers of
+    ``ROW_BASE``), but from which cells are filled rather than their
+    colours, which the evaluation ignores. Searched boards exist only as
+    row masks, so this is the hash the transposition table is keyed on.
+    """
+    value = 0
+    for y, row in enumerate(rows):
+        if row:
+            value += _mask_key(row) * row_multiplier(y)
+    return value & MASK64
+
+
+def lock_piece(rows: Rows, width: int, shape_name: str, rotation: int,
+               x: int, y: int,
+               position_hash: Optional[int] = None) -> Optional[Tuple[Rows, int, int]]:
+    """Lock a piece into a row-mask board and clear full lines.
+
+    Returns the new rows, the number of lines cleared and the new rows'
+    ``rows_hash``, or None if the piece would lock partly above the top of
+    the board. ``position_hash`` is the hash of ``rows``, computed when not
+    given; the new hash is then updated for the piece's rows only, and
+    recomputed only when lines clear.
+    """
+    row_masks = Tetromino.ROTATIONS[shape_name][rotation].row_masks
+    if y + row_masks[0][0] < 0:
+        return None
+    if position_hash is None:
+        position_hash = rows_hash(rows)
+    new_rows = list(rows)
+    for dy, mask in row_masks:
+        old = new_rows[y + dy]
+        new = new_rows[y + dy] = old | (mask << x if x >= 0 else mask >> -x)
+        position_hash += (_mask_key(new) - _mask_key(old)) * row_multiplier(y + dy)
+    full_row = (1 << width) - 1
+    kept = [row for row in new_rows if row != full_row]
+    lines = len(new_rows) - len(kept)
+    if lines:
+        # Cleared lines move every row above them; rehash
+        kept = [0] * lines + kept
+        return tuple(kept), lines, rows_hash(kept)
+    return tuple(kept), lines, position_hash & MASK64
+
+
+class AIPlayer:
+    """Placement-search AI with beam lookahead and a transposition table.
+
+    Candidate placements of the current piece are scored with the
+    heuristic; the best ``beam_width`` are then expanded with every
+    placement of ``next_piece``. The budget is checked before every
+    placement is scored, at either depth, so search stops within one
+    placement of the per-move node or time budget running out.
+
+    Positions are cached by their ``rows_hash``. A cached expansion is
+    charged the nodes it took to compute, so with a node budget the move
+    chosen does not depend on what earlier moves or games left in the
+    table. A time budget makes decisions depend on machine speed and load,
+    so only node-budgeted search is reproducible.
+    """
+
+    def __init__(self, weights: Optional[HeuristicWeights] = None,
+                 depth: int = 2, beam_width: int = 8,
+                 node_budget: Optional[int] = None,
+                 time_budget: Optional[float] = None,
+                 table_size: int = 100_000):
+        """Configure the search.
+
+        ``depth`` is 1 (current piece only) or 2 (also ``next_piece``).
+        ``time_budget`` is in seconds per move.
+        """
+        if depth not in (1, 2):
+            raise ValueError("depth must be 1 or 2")
+        self.weights = weights or HeuristicWeights()
+        self.depth = depth
+        self.beam_width = beam_width
+        self.node_budget = node_budget
+        self.time_budget = time_budget
+        self.table = TranspositionTable(table_size)
+        self.nodes = 0
+        self._deadline = None
+        self._plan_piece = -1
+        self._plan_cells: Optional[FrozenSet[Tuple[int, int]]] = None
+
+    def _out_of_budget(self) -> bool:
+        """Return True once this move's node or time budget is spent."""
+        if self.node_budget is not None and self.nodes >= self.node_budget:
+            return True
+        return self._deadline is not None and time.perf_counter() >= self._deadline
+
+    def evaluate(self, rows: Rows, width: int,
+                 position_hash: Optional[int] = None) -> float:
+        """Score a board with the heuristic, using the transposition table.
+
+        ``position_hash`` is the board's ``rows_hash``, computed when not given.
+        """
+        key = rows_hash(rows) if position_hash is None else position_hash
+        value = self.table.get(key)
+        if value is None:
+            aggregate_height, holes, bumpiness = board_features(rows, width)
+            w = self.weights
+            value = (w.aggregate_height * aggregate_height + w.holes * holes +
+                     w.bumpiness * bumpiness)
+            self.table.put(key, value)
+        return value
+
+    def _best_for_piece(self, rows: Rows, width: int, shape_name: str,
+                        position_hash: int) -> float:
+        """Return the best one-piece value of spawning ``shape_name`` on ``rows``."""
+        key = (position_hash, shape_name)
+        cached = self.table.get(key)
+        if cached is not None:
+            value, nodes = cached
+            # A search the budget would cut short is redone, not charged in full
+            if self.node_budget is None or self.nodes + nodes <= self.node_budget:
+                self.nodes += nodes
+                return value
+        spawn_x = (width - Tetromino.ROTATIONS[shape_name][0].width) // 2
+        value = float('-inf')
+        nodes = 0
+        for placement in placements_from_masks(rows, width, shape_name, 0, spawn_x, 0):
+            if self._out_of_budget():
+                # Best so far; cut short, so it is not cached
+                return value
+            self.nodes += 1
+            nodes += 1
+            locked = lock_piece(rows, width, shape_name, placement.rotation,
+                                placement.x, placement.y, position_hash)
+            if locked is not None:
+                new_rows, lines, new_hash = locked
+                value = max(value, self.weights.lines_cleared * lines +
+                            self.evaluate(new_rows, width, new_hash))
+        self.table.put(key, (value, nodes))
+        return value
+
+    def choose(self, game_state: GameState) -> Optional[Placement]:
+        """Pick the best placement for the current piece, or None if there is none."""
+        piece = game_state.current_piece
+        if game_state.game_over or piece is None:
+            return None
+        self.nodes = 0
+        self._deadline = (time.perf_counter() + self.time_budget
+                          if self.time_budget is not None else None)
+
+        width = game_state.board.width
+        rows = tuple(game_state.board.get_row_masks())
+        position_hash = rows_hash(rows)
+        scored = []
+        for placement in game_state.get_placements():
+            if scored and self._out_of_budget():
+                break
+            self.nodes += 1
+            locked = lock_piece(rows, width, piece.shape_name, placement.rotation,
+                                placement.x, placement.y, position_hash)
+            if locked is None:
+                scored.append((float('-inf'), placement, None, 0, 0))
+                continue
+            new_rows, lines, new_hash = locked
+            line_value = self.weights.lines_cleared * lines
+            scored.append((line_value + self.evaluate(new_rows, width, new_hash),
+                           placement, new_rows, new_hash, line_value))
+        if not scored:
+            return None
+        scored.sort(key=lambda item: item[0], reverse=True)
+
+        next_piece = game_state.next_piece
+        if self.depth == 1 or next_piece is None:
+            return scored[0][1]
+
+        best_value, best = float('-inf'), None
+        for _, placement, new_rows, new_hash, line_value in scored[:self.beam_width]:
+            if best is not None and self._out_of_budget():
+                break
+            if new_rows is None:
+                continue
+            total = line_value + self._best_for_piece(new_rows, width,
+                                                      next_piece.shape_name, new_hash)
+            if best is None or total > best_value:
+                best_value, best = total, placement
+        return best if best is not None else scored[0][1]
+
+    def play_piece(self, game_state: GameState) -> bool:
+        """Choose a placement and apply its inputs, locking the piece."""
+        placement = self.choose(game_state)
+        if placement is None:
+            return False
+        for action in placement.path:
+            game_state.apply_action(action)
+        return True
+
+    def __call__(self, game_state: GameState, rng: random.Random) -> str:
+        """Return the next action toward the chosen placement.
+
+        Makes the player usable as a step-by-step policy (for example with
+        ``src.sim.selfplay``), re-planning when a new piece spawns.
+        """
+        placements = game_state.get_placements()
+        if self._plan_piece != game_state.pieces_placed or self._plan_cells is None:
+            target = self.choose(game_state)
+            self._plan_piece = game_state.pieces_placed
+            self._plan_cells = self._cells(game_state, target) if target else None
+        for placement in placements:
+            if self._cells(game_state, placement) == self._plan_cells:
+                return placement.path[0]
+        # Gravity moved the piece past the planned route; plan again
+        self._plan_cells = None
+        target = self.choose(game_state)
+        if target is None:
+            return 'hard_drop'
+        self._plan_cells = self._cells(game_state, target)
+        return target.path[0]
+
+    @staticmethod
+    def _cells(game_state: GameState,
+               placement: Placement) -> FrozenSet[Tuple[int, int]]:
+        """Return the board cells a placement of the current piece covers."""
+        state = game_state.current_piece.states[placement.rotation]
+        return frozenset((placement.x + dx, placement.y + dy) for dx, dy in state.cells)
@@ -0,0 +1,44 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+class TranspositionTable:
+    """Bounded cache of evaluated positions with least-recently-used eviction.
+
+    Keys are position hashes, optionally paired with a piece name, so a
+    lookup costs a dictionary probe on a small key rather than hashing and
+    comparing a whole board.
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        """Create an empty table holding at most ``max_entries`` positions."""
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key`` and mark it recently used."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache ``value`` for ``key``, evicting the oldest entry if full."""
+        entries = self._entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached position."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
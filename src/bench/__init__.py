@@ -0,0 +1,7 @@
+"""
+Benchmarks for the engine and renderer hot paths.
+"""
+
+from .suite import BENCHMARKS, BenchResult, Regression, compare, run_benchmarks
+
+__all__ = ['BENCHMARKS', 'BenchResult', 'Regression', 'compare', 'run_benchmarks']
@@ -0,0 +1,86 @@
+"""
+Deterministic board and game fixtures for the benchmarks.
+
+Every fixture is built through the public engine API (``place_piece``,
+placements and actions), so derived state such as column tops, row masks
+and hashes is exactly what a real game would have.
+"""
+
+import copy
+import random
+from typing import Callable, List
+from src.engine.board import Board
+from src.engine.game_state import GameState
+from src.engine.randomizer import PieceGenerator
+from src.engine.tetromino import Tetromino
+
+BoardFactory = Callable[[], Board]
+
+
+def drop(board: Board, piece: Tetromino, column: int) -> None:
+    """Drop ``piece`` with its leftmost cell in ``column`` and place it."""
+    x = column - min(dx for dx, _ in piece.cells)
+    y = -min(dy for _, dy in piece.cells)
+    board.place_piece(piece, x, board.get_ghost_position(piece, x, y))
+
+
+def tetris_ready_board(board_factory: BoardFactory = Board, seed: int = 0,
+                       stack_pieces: int = 6) -> Board:
+    """Return a board with four full bottom rows under a ragged stack.
+
+    ``clear_lines`` on it clears a Tetris and shifts the stack down.
+    """
+    board = board_factory()
+    rng = random.Random(seed)
+    vertical_i = Tetromino('I')
+    vertical_i.rotate()
+    for column in range(board.width):
+        drop(board, vertical_i, column)
+
+    names = sorted(Tetromino.SHAPES)
+    for _ in range(stack_pieces):
+        piece = Tetromino(rng.choice(names))
+        piece.rotation = rng.randrange(4)
+        width = piece.get_width()
+        drop(board, piece, rng.randrange(board.width - width + 1))
+    return board
+
+
+def tall_stack_board(board_factory: BoardFactory = Board, rows: int = 8000,
+                     seed: int = 0) -> Board:
+    """Return a board under a stack of ``rows`` garbage rows.
+
+    The holes are random except in the bottom four rows, which share a
+    well in column 0 that a vertical I fills to clear them.
+    """
+    board = board_factory()
+    rng = random.Random(seed)
+    board.add_garbage([rng.randrange(1, board.width) for _ in range(rows - 4)]
+                      + [0] * 4)
+    return board
+
+
+def midgame(board_factory: BoardFactory = Board, seed: int = 0,
+            pieces: int = 25) -> GameState:
+    """Return a game ``pieces`` pieces in, stacked by a seeded player.
+
+    The player picks a random placement among those resting lowest,
+    which keeps the stack low and fairly flat, as in real play.
+    """
+    game = GameState(board=board_factory(),
+                     randomizer=PieceGenerator(seed, 'bag'))
+    rng = random.Random(seed)
+    while game.pieces_placed < pieces and not game.game_over:
+        placements = game.get_placements()
+        lowest = max(p.y + game.current_piece.states[p.rotation].height
+                     for p in placements)
+        candidates = [p for p in placements
+                      if p.y + game.current_piece.states[p.rotation].height == lowest]
+        for action in rng.choice(candidates).path:
+            game.apply_action(action)
+    return game
+
+
+def copies(obj, number: int) -> List:
+    """Return ``number`` independent deep copies of ``obj``."""
+    return [copy.deepcopy(obj) for _ in range(number)]
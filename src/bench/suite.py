@@ -0,0 +1,381 @@
+"""
+Benchmarks for the engine and renderer hot paths.
+
+Every benchmark runs on fixed seeds and fixtures, so runs are comparable
+across commits and machines. Results are written as JSON; ``--compare``
+checks them against a stored baseline and exits non-zero on regressions.
+
+Run from the project root:
+    python -m src.bench.suite --output bench.json
+    python -m src.bench.suite --compare bench.json --threshold 0.15
+"""
+
+import argparse
+import copy
+import importlib.util
+import json
+import os
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.engine.bitboard import BitBoard
+from src.engine.board import Board
+from src.engine.game_state import GameState
+from src.engine.randomizer import PieceGenerator
+from src.engine.tetromino import Tetromino
+from src.net.rollback import RollbackSession
+from src.net.versus import VersusMatch
+from src.sim.selfplay import play_game
+from .fixtures import copies, midgame, tall_stack_board, tetris_ready_board
+
+# A benchmark times ``number`` operations and returns the elapsed seconds
+Benchmark = Callable[[int], float]
+
+BENCHMARKS: Dict[str, Tuple[Benchmark, int]] = {}
+
+BOARD_TYPES = (('Board', Board), ('BitBoard', BitBoard))
+
+
+class BenchResult(NamedTuple):
+    """Timing of one benchmark: the best of ``repeats`` runs."""
+    name: str
+    ns_per_op: float
+    ops_per_sec: float
+    number: int
+    repeats: int
+
+
+class Regression(NamedTuple):
+    """A benchmark that got slower than the baseline allows."""
+    name: str
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def ratio(self) -> float:
+        """Return how many times slower the current run is."""
+        return self.current_ns / self.baseline_ns
+
+
+def benchmark(name: str, number: int) -> Callable[[Benchmark], Benchmark]:
+    """Register a benchmark timing ``number`` operations per run by default."""
+    def register(func: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = (func, number)
+        return func
+    return register
+
+
+def _register_board_benchmarks(label: str, board_factory) -> None:
+    """Register the board and game benchmarks for one board type."""
+
+    @benchmark(f'board.is_valid_move[{label}]', 20_000)
+    def is_valid_move(number):
+        board = midgame(board_factory).board
+        piece = Tetromino('T')
+        positions = [(x, y) for y in range(-1, board.height)
+                     for x in range(-1, board.width - 1)]
+        positions = (positions * (number // len(positions) + 1))[:number]
+        check = board.is_valid_move
+        start = time.perf_counter()
+        for x, y in positions:
+            check(piece, x, y)
+        return time.perf_counter() - start
+
+    @benchmark(f'board.place_piece[{label}]', 2_000)
+    def place_piece(number):
+        boards = copies(midgame(board_factory).board, number)
+        piece = Tetromino('L')
+        start = time.perf_counter()
+        for board in boards:
+            board.place_piece(piece, 4, 2)
+        return time.perf_counter() - start
+
+    @benchmark(f'board.clear_lines[{label}]', 2_000)
+    def clear_lines(number):
+        boards = copies(tetris_ready_board(board_factory), number)
+        start = time.perf_counter()
+        for board in boards:
+            board.clear_lines()
+        return time.perf_counter() - start
+
+    @benchmark(f'board.add_garbage[{label}]', 2_000)
+    def add_garbage(number):
+        boards = copies(midgame(board_factory).board, number)
+        start = time.perf_counter()
+        for i, board in enumerate(boards):
+            board.add_garbage((i % board.width,))
+        return time.perf_counter() - start
+
+    @benchmark(f'board.get_ghost_position[{label}]', 20_000)
+    def get_ghost_position(number):
+        board = midgame(board_factory).board
+        pieces = []
+        for name in sorted(Tetromino.SHAPES):
+            for rotation in range(4):
+                piece = Tetromino(name)
+                piece.rotation = rotation
+                for x in range(board.width - piece.get_width() + 1):
+                    pieces.append((piece, x - min(dx for dx, _ in piece.cells)))
+        pieces = (pieces * (number // len(pieces) + 1))[:number]
+        ghost = board.get_ghost_position
+        start = time.perf_counter()
+        for piece, x in pieces:
+            ghost(piece, x, 0)
+        return time.perf_counter() - start
+
+    @benchmark(f'game.drop_piece[{label}]', 2_000)
+    def drop_piece(number):
+        games = copies(midgame(board_factory), number)
+        start = time.perf_counter()
+        for game in games:
+            game.drop_piece()
+        return time.perf_counter() - start
+
+    @benchmark(f'game.hard_drop[{label}]', 1_000)
+    def hard_drop(number):
+        games = copies(midgame(board_factory), number)
+        start = time.perf_counter()
+        for game in games:
+            game.hard_drop()
+        return time.perf_counter() - start
+
+    @benchmark(f'game.rotate_piece[{label}]', 20_000)
+    def rotate_piece(number):
+        game = midgame(board_factory)
+        rotate = game.rotate_piece
+        start = time.perf_counter()
+        for _ in range(number):
+            rotate(True)
+        return time.perf_counter() - start
+
+    @benchmark(f'game.snapshot[{label}]', 20_000)
+    def snapshot(number):
+        game = midgame(board_factory)
+        take = game.snapshot
+        start = time.perf_counter()
+        for _ in range(number):
+            take()
+        return time.perf_counter() - start
+
+    @benchmark(f'game.restore[{label}]', 10_000)
+    def restore(number):
+        # Alternate between boards so every restore rebuilds the board
+        game = midgame(board_factory)
+        snapshots = [game.snapshot()]
+        game.hard_drop()
+        snapshots.append(game.snapshot())
+        put_back = game.restore
+        start = time.perf_counter()
+        for i in range(number):
+            put_back(snapshots[i & 1])
+        return time.perf_counter() - start
+
+
+for _label, _factory in BOARD_TYPES:
+    _register_board_benchmarks(_label, _factory)
+
+
+@benchmark('game.hard_drop[BitBoard 64x10000]', 1_000)
+def tall_hard_drop(number):
+    """Time hard drops on a board far larger than the standard one."""
+    game = GameState(board=BitBoard(64, 10_000), randomizer=PieceGenerator(0, 'bag'))
+    start = time.perf_counter()
+    for _ in range(number):
+        game.hard_drop()
+    return time.perf_counter() - start
+
+
+@benchmark('board.clear_lines[BitBoard 64x10000 tall stack]', 1_000)
+def tall_clear_lines(number):
+    """Time Tetrises cleared at the bottom of an 8000-row stack.
+
+    Garbage pushed in after each clear re-opens the well, untimed, so
+    every clear lifts out rows from under the whole stack.
+    """
+    board = tall_stack_board(lambda: BitBoard(64, 10_000))
+    vertical_i = Tetromino('I')
+    vertical_i.rotate()
+    x = -min(dx for dx, _ in vertical_i.cells)
+    y = board.height - 4 - min(dy for _, dy in vertical_i.cells)
+    elapsed = 0.0
+    for _ in range(number):
+        start = time.perf_counter()
+        board.place_piece(vertical_i, x, y)
+        board.clear_lines()
+        elapsed += time.perf_counter() - start
+        board.add_garbage([0] * 4)
+    return elapsed
+
+
+@benchmark('headless.game', 5)
+def headless_game(number):
+    """Time complete random-policy headless games on seeds 0..number-1."""
+    start = time.perf_counter()
+    for seed in range(number):
+        play_game(seed)
+    return time.perf_counter() - start
+
+
+@benchmark('net.rollback[8 ticks]', 1_000)
+def rollback(number):
+    """Time rolling back eight mispredicted ticks and re-simulating them."""
+    rng = random.Random(0)
+    actions = ('noop', 'move_left', 'move_right', 'rotate_clockwise', 'soft_drop')
+    elapsed = 0.0
+    session = None
+    for i in range(number):
+        if session is None or session.match.game_over:
+            session = RollbackSession(VersusMatch(i), 0)
+            for _ in range(session.max_rollback):
+                session.advance()
+        # The oldest predicted input was wrong, so every predicted tick replays
+        session.add_remote_input(session.confirmed_tick + 1,
+                                 'move_left' if i & 1 else 'move_right')
+        session.add_local_input(rng.choice(actions))
+        start = time.perf_counter()
+        session.advance()
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def _render_frames(number: int) -> List[GameState]:
+    """Return ``number`` successive states of a seeded random game."""
+    game = midgame(Board, pieces=10)
+    rng = random.Random(0)
+    states = []
+    for _ in range(number):
+        if game.game_over:
+            game = midgame(Board, pieces=10)
+        game.apply_action(rng.choice(('move_left', 'move_right',
+                                      'rotate_clockwise', 'soft_drop')))
+        if rng.random() < 0.05:
+            game.hard_drop()
+        states.append(copy.deepcopy(game))
+    return states
+
+
+def _render_benchmark(renderer_name: str) -> Benchmark:
+    """Return a benchmark rendering successive game states offscreen."""
+    def run(number):
+        # No window is needed: SDL's dummy driver renders to memory
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        from src.ui import renderer, retained_renderer
+        renderer_class = (renderer.Renderer if renderer_name == 'Renderer'
+                          else retained_renderer.RetainedRenderer)
+        frame_renderer = renderer_class((800, 600))
+        states = _render_frames(number)
+        frame_renderer.render(states[0])
+        start = time.perf_counter()
+        for state in states:
+            frame_renderer.render(state)
+        return time.perf_counter() - start
+    return run
+
+
+def _register_render_benchmarks() -> None:
+    """Register renderer benchmarks if pygame is available."""
+    # Looked up rather than imported, so importing the suite stays cheap
+    if importlib.util.find_spec('pygame') is None:
+        return
+    for name in ('Renderer', 'RetainedRenderer'):
+        benchmark(f'render.frame[{name}]', 300)(_render_benchmark(name))
+
+
+_register_render_benchmarks()
+
+
+def run_benchmarks(names: Optional[List[str]] = None, repeats: int = 5,
+                   scale: float = 1.0) -> Iterator[BenchResult]:
+    """Run the selected benchmarks (all by default), yielding their results.
+
+    Each benchmark runs ``repeats`` times and reports its fastest run,
+    which is the least disturbed by other load on the machine. ``scale``
+    multiplies the number of operations per run.
+    """
+    for name in names if names is not None else list(BENCHMARKS):
+        func, number = BENCHMARKS[name]
+        number = max(1, int(number * scale))
+        best = min(func(number) for _ in range(repeats))
+        ns_per_op = best / number * 1e9
+        yield BenchResult(name, ns_per_op, 1e9 / ns_per_op if ns_per_op else 0.0,
+                          number, repeats)
+
+
+def to_json(results: List[BenchResult]) -> Dict[str, object]:
+    """Return results with details of the machine that produced them."""
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': {result.name: result._asdict() for result in results},
+    }
+
+
+def compare(baseline: Dict[str, object], results: List[BenchResult],
+            threshold: float = 0.10) -> List[Regression]:
+    """Return benchmarks more than ``threshold`` (a fraction) slower than baseline.
+
+    Benchmarks missing from the baseline are ignored.
+    """
+    regressions = []
+    stored = baseline['results']
+    for result in results:
+        if result.name not in stored:
+            continue
+        baseline_ns = stored[result.name]['ns_per_op']
+        if result.ns_per_op > baseline_ns * (1 + threshold):
+            regressions.append(Regression(result.name, baseline_ns, result.ns_per_op))
+    return regressions
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark engine and renderer hot paths.")
+    parser.add_argument('--output', metavar='PATH',
+                        help="write results to PATH as JSON")
+    parser.add_argument('--compare', metavar='PATH',
+                        help="compare against a baseline JSON file; exit 1 on regressions")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="allowed slowdown as a fraction of the baseline (default: 0.10)")
+    parser.add_argument('--filter', default='',
+                        help="only run benchmarks whose name contains this text")
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="multiply operations per run (e.g. 0.1 for a quick pass)")
+    parser.add_argument('--list', action='store_true', help="list benchmarks and exit")
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    if args.list:
+        print('\n'.join(names))
+        return
+
+    results = []
+    for result in run_benchmarks(names, args.repeats, args.scale):
+        print(f"{result.name:<40} {result.ns_per_op:>14,.0f} ns/op "
+              f"{result.ops_per_sec:>14,.1f} ops/s")
+        results.append(result)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(to_json(results), f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, results, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression.name}: {regression.baseline_ns:,.0f} -> "
+                  f"{regression.current_ns:,.0f} ns/op ({regression.ratio:.2f}x)")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,18 @@ Game engine components including board logic, piece management, and game state.
 """
 
 from .board import Board
+from .bitboard import BitBoard
 from .tetromino import Tetromino
 from .game_state import GameState
+from .headless import HeadlessGame
+from .instrumentation import FrameStats, Instrumentation
+from .placements import Placement, enumerate_placements
+from .randomizer import PieceGenerator
+from .replay import Replay, ReplayArchive, ReplayPlayer, ReplayRecorder
+from .snapshot import GameSnapshot, SnapshotRing
 
-__all__ = ['Board', 'Tetromino', 'GameState']
\ No newline at end of file
+__all__ = ['Board', 'BitBoard', 'Tetromino', 'GameState', 'HeadlessGame',
+           'FrameStats', 'Instrumentation', 'Placement', 'enumerate_placements',
+           'PieceGenerator',
+           'Replay', 'ReplayArchive', 'ReplayPlayer', 'ReplayRecorder',
+           'GameSnapshot', 'SnapshotRing']
\ No newline at end of file
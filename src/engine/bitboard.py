@@ -0,0 +1,103 @@
+from .board import Board, RowView
+
+
+class BitBoard(Board):
+    """Tetris board that mirrors each row as an integer bitmask.
+
+    Bit ``x`` of ``rows[y]`` is set when column ``x`` of row ``y`` is filled.
+    The masks are kept by slot like the rows, and the colour grid inherited
+    from ``Board`` is kept in sync so that ``get_grid_copy`` and the
+    renderer keep working unchanged.
+    """
+
+    def __init__(self, width=Board.WIDTH, height=Board.HEIGHT):
+        """Initialize an empty board with empty row masks."""
+        super().__init__(width, height)
+        self.full_row = (1 << width) - 1
+        self._masks = self._pad([0] * height, 0)
+        self._slot_lists.append(self._masks)
+
+    @property
+    def rows(self):
+        """Return the row masks, top to bottom, as a live list-like view."""
+        return RowView(self, '_masks')
+
+    def snapshot(self):
+        """Return an immutable snapshot of the board, reused until it changes."""
+        if self._snapshot is None:
+            base = self._base
+            masks = tuple(self._masks[base:base + self.height])
+            self._snapshot = super().snapshot()._replace(rows=masks)
+        return self._snapshot
+
+    def restore(self, snapshot):
+        """Put the board back to a snapshot taken with ``snapshot()``."""
+        if snapshot is self._snapshot:
+            return
+        super().restore(snapshot)
+        base = self._base
+        self._masks[base:base + self.height] = snapshot.rows
+
+    def set_cell(self, x, y, color):
+        """Set one cell, keeping the row masks in step too."""
+        super().set_cell(x, y, color)
+        if color != self.EMPTY_CELL:
+            self._masks[self._base + y] |= 1 << x
+        else:
+            self._masks[self._base + y] &= ~(1 << x)
+
+    def is_valid_move(self, piece, offset_x, offset_y):
+        """Check if the piece can move to the specified position."""
+        masks, base = self._masks, self._base
+        for dy, mask in piece.get_row_masks():
+            if offset_x >= 0:
+                mask <<= offset_x
+            elif mask & ((1 << -offset_x) - 1):
+                return False
+            else:
+                mask >>= -offset_x
+            if mask > self.full_row:
+                return False
+            y = dy + offset_y
+            if y >= self.height:
+                return False
+            if y >= 0 and masks[base + y] & mask:
+                return False
+        return True
+
+    def place_piece(self, piece, pos_x, pos_y):
+        """Place a piece on the board at the specified position."""
+        super().place_piece(piece, pos_x, pos_y)
+        masks, base = self._masks, self._base
+        for dy, mask in piece.get_row_masks():
+            y = dy + pos_y
+            if 0 <= y < self.height:
+                masks[base + y] |= (mask << pos_x if pos_x >= 0
+                                    else mask >> -pos_x)
+
+    def clear_lines(self):
+        """Clear completed lines and return the number of lines cleared."""
+        changed = self._changed_rows()
+        base = self._base
+        masks = self._masks[base + changed.start:base + changed.stop]
+        full = [y for y, mask in zip(changed, masks) if mask == self.full_row]
+        if full:
+            self._remove_rows(full)
+        return len(full)
+
+    def add_garbage(self, holes):
+        """Push garbage rows in under the stack, lifting it one row per hole."""
+        overflow = super().add_garbage(holes)
+        bottom = self._base + self.height - len(holes)
+        for slot, hole in enumerate(holes, bottom):
+            self._masks[slot] = self.full_row & ~(1 << hole)
+        return overflow
+
+    def is_game_over(self):
+        """Check if any column in the top row is filled."""
+        return self._masks[self._base] != 0
+
+    def get_row_masks(self):
+        """Return each row as a bitmask with bit x set for filled column x."""
+        base = self._base
+        return self._masks[base:base + self.height]
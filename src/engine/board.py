@@ -1,54 +1,425 @@
+from collections.abc import Sequence
+from .snapshot import BoardSnapshot
+from .zobrist import (CELL_KEYS, GARBAGE_COLOR, MASK64, MAX_WIDTH, block_key,
+                      row_divisor, row_key, shift_rows)
+
+
+class RowView(Sequence):
+    """Live, top-to-bottom view of one of a board's slot lists.
+
+    Indexing and slicing are by board row, like a list of the rows;
+    slices return plain lists.
+    """
+
+    __slots__ = ('_board', '_name')
+
+    def __init__(self, board, name):
+        """View the slot list stored as ``name`` on ``board``."""
+        self._board = board
+        self._name = name
+
+    def __len__(self):
+        return self._board.height
+
+    def _slot(self, index):
+        """Return the slot holding board row ``index``."""
+        height = self._board.height
+        if index < 0:
+            index += height
+        if not 0 <= index < height:
+            raise IndexError("row index out of range")
+        return self._board._base + index
+
+    def __getitem__(self, index):
+        values = getattr(self._board, self._name)
+        if isinstance(index, slice):
+            base = self._board._base
+            rows = range(self._board.height)[index]
+            if rows.step == 1:
+                return values[base + rows.start:base + rows.stop]
+            return [values[base + y] for y in rows]
+        return values[self._slot(index)]
+
+    def __setitem__(self, index, value):
+        getattr(self._board, self._name)[self._slot(index)] = value
+
+    def __iter__(self):
+        base = self._board._base
+        return iter(getattr(self._board, self._name)[base:base + self._board.height])
+
+    def __eq__(self, other):
+        if isinstance(other, (RowView, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 class Board:
-    """Represents the Tetris game board."""
+    """Represents the Tetris game board.
+
+    Rows live in the slots of a buffer three boards tall, with the top
+    row at slot ``_base``; ``grid`` views them top to bottom. Line clears
+    and garbage move the window of slots or the few rows next to the
+    change rather than the whole table, recycling freed rows so no cells
+    are copied. The hash is kept per slot, so rows that keep their slot
+    are never rehashed.
+
+    Boards default to the standard ``WIDTH`` x ``HEIGHT`` but may be any
+    size up to ``MAX_WIDTH`` columns; moves, clears, garbage and drops
+    cost in proportion to the rows they touch, not the board's area.
+    """
     
     WIDTH = 10
     HEIGHT = 20
+    MAX_WIDTH = MAX_WIDTH
     EMPTY_CELL = 0
+    GARBAGE_CELL = GARBAGE_COLOR
 
-    def __init__(self):
-        """Initialize an empty board."""
-        self.grid = [[self.EMPTY_CELL for _ in range(self.WIDTH)] 
-                    for _ in range(self.HEIGHT)]
+    def __init__(self, width=WIDTH, height=HEIGHT):
+        """Initialize an empty ``width`` x ``height`` board."""
+        if not 4 <= width <= self.MAX_WIDTH:
+            raise ValueError(f"width must be between 4 and {self.MAX_WIDTH}")
+        if height < 4:
+            raise ValueError("height must be at least 4")
+        self.width = width
+        self.height = height
+        # Slot of the top row; the free slots either side let the window move
+        self._set_base(height)
+        self._rows = self._pad([[self.EMPTY_CELL for _ in range(width)]
+                                for _ in range(height)], None)
         self.current_piece = None
         self.game_over = False
+        # Row index of the highest filled cell per column (height if empty)
+        self.column_tops = [height] * width
+        # Zobrist row hashes by slot, and their sum positioned by slot
+        # rather than by row (see ``hash``)
+        self._row_hashes = self._pad([0] * height, 0)
+        self._slot_hash = 0
+        # Per-row int lists kept by slot beside the rows, each holding 0 for
+        # an empty row; subclasses add their own
+        self._slot_lists = [self._row_hashes]
+        # Snapshot of the current contents, dropped on every change
+        self._snapshot = None
+        # Rows changed since the last clear, the only ones that can be full
+        self._changed_top = height
+        self._changed_bottom = -1
+
+    def _set_base(self, base):
+        """Put the top row at slot ``base``."""
+        self._base = base
+        # Turns the slot-positioned hash into the row-positioned one
+        self._base_divisor = row_divisor(base)
+
+    def _pad(self, rows, blank):
+        """Return a board's worth of per-row values laid out in slots."""
+        return [blank] * self.height + list(rows) + [blank] * self.height
+
+    @property
+    def grid(self):
+        """Return the rows, top to bottom, as a live list-like view."""
+        return RowView(self, '_rows')
+
+    @property
+    def hash(self):
+        """Return the 64-bit Zobrist hash of the board contents."""
+        return (self._slot_hash * self._base_divisor) & MASK64
+
+    def compute_hash(self):
+        """Recompute the board hash from every cell."""
+        board_hash = 0
+        for y, row in enumerate(self.grid):
+            row_hash = 0
+            for x, cell in enumerate(row):
+                row_hash ^= CELL_KEYS[x][cell]
+            board_hash += row_key(row_hash, y)
+        return board_hash & MASK64
+
+    def snapshot(self):
+        """Return an immutable snapshot of the board, reused until it changes."""
+        if self._snapshot is None:
+            base, height = self._base, self.height
+            self._snapshot = BoardSnapshot(tuple(map(tuple, self._rows[base:base + height])),
+                                           tuple(self.column_tops),
+                                           tuple(self._row_hashes[base:base + height]),
+                                           self.hash)
+        return self._snapshot
+
+    def restore(self, snapshot):
+        """Put the board back to a snapshot taken with ``snapshot()``.
+
+        Snapshots are taken between moves, after lines were cleared, so a
+        restored board has no rows waiting to be checked for clears.
+        """
+        if snapshot is self._snapshot:
+            return
+        base, height = self._base, self.height
+        self._rows[base:base + height] = map(list, snapshot.grid)
+        self.column_tops = list(snapshot.column_tops)
+        self._row_hashes[base:base + height] = snapshot.row_hashes
+        self._slot_hash = shift_rows(snapshot.hash, base)
+        self._snapshot = snapshot
+        self._changed_top, self._changed_bottom = self.height, -1
+
+    def _recenter(self):
+        """Move the window back to the middle slots; O(height), and rare."""
+        base, height = self._base, self.height
+        rows = self._rows
+        rows[:] = self._pad(rows[base:base + height], None)
+        for values in self._slot_lists:
+            values[:] = self._pad(values[base:base + height], 0)
+        self._slot_hash = shift_rows(self._slot_hash, height - base)
+        self._set_base(height)
+
+    def set_cell(self, x, y, color):
+        """Set one cell, keeping column tops and the hash in step.
+
+        For building test and research positions; play goes through
+        ``place_piece``.
+        """
+        self._snapshot = None
+        slot = self._base + y
+        row = self._rows[slot]
+        old_hash = self._row_hashes[slot]
+        new_hash = old_hash ^ CELL_KEYS[x][row[x]] ^ CELL_KEYS[x][color]
+        row[x] = color
+        self._row_hashes[slot] = new_hash
+        self._slot_hash = (self._slot_hash + row_key(new_hash, slot) -
+                           row_key(old_hash, slot)) & MASK64
+        if color != self.EMPTY_CELL:
+            self.column_tops[x] = min(self.column_tops[x], y)
+        elif self.column_tops[x] == y:
+            rows, base = self._rows, self._base
+            top = y
+            while top < self.height and rows[base + top][x] == self.EMPTY_CELL:
+                top += 1
+            self.column_tops[x] = top
+        self._changed_top = min(self._changed_top, y)
+        self._changed_bottom = max(self._changed_bottom, y)
 
     def is_valid_move(self, piece, offset_x, offset_y):
         """Check if the piece can move to the specified position."""
-        for y, row in enumerate(piece.shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    new_x = x + offset_x
-                    new_y = y + offset_y
-                    if (new_x < 0 or new_x >= self.WIDTH or
-                        new_y >= self.HEIGHT or
-                        (new_y >= 0 and self.grid[new_y][new_x] != self.EMPTY_CELL)):
-                        return False
+        rows, base = self._rows, self._base
+        for x, y in piece.cells:
+            new_x = x + offset_x
+            new_y = y + offset_y
+            if (new_x < 0 or new_x >= self.width or
+                new_y >= self.height or
+                (new_y >= 0 and rows[base + new_y][new_x] != self.EMPTY_CELL)):
+                return False
         return True
 
     def place_piece(self, piece, pos_x, pos_y):
         """Place a piece on the board at the specified position."""
-        for y, row in enumerate(piece.shape):
-            for x, cell in enumerate(row):
-                if cell and 0 <= y + pos_y < self.HEIGHT:
-                    self.grid[y + pos_y][x + pos_x] = piece.color
+        self._snapshot = None
+        color = piece.color
+        rows, base = self._rows, self._base
+        row_hashes = self._row_hashes
+        column_tops = self.column_tops
+        height = self.height
+        slot_hash = self._slot_hash
+        for x, y in piece.cells:
+            y += pos_y
+            if 0 <= y < height:
+                x += pos_x
+                if y < column_tops[x]:
+                    column_tops[x] = y
+                slot = base + y
+                row = rows[slot]
+                old_hash = row_hashes[slot]
+                new_hash = old_hash ^ CELL_KEYS[x][row[x]] ^ CELL_KEYS[x][color]
+                row[x] = color
+                row_hashes[slot] = new_hash
+                slot_hash += row_key(new_hash, slot) - row_key(old_hash, slot)
+        self._slot_hash = slot_hash & MASK64
+        top = max(pos_y, 0)
+        if top < self._changed_top:
+            self._changed_top = top
+        bottom = min(pos_y + piece.states[piece.rotation].height, height) - 1
+        if bottom > self._changed_bottom:
+            self._changed_bottom = bottom
+
+    def _changed_rows(self):
+        """Return the rows changed since the last clear and reset the record."""
+        rows = range(self._changed_top, self._changed_bottom + 1)
+        self._changed_top, self._changed_bottom = self.height, -1
+        return rows
 
     def clear_lines(self):
-        """Clear completed lines and return the number of lines cleared."""
-        lines_cleared = 0
-        y = self.HEIGHT - 1
-        while y >= 0:
-            if all(cell != self.EMPTY_CELL for cell in self.grid[y]):
-                lines_cleared += 1
-                # Move all lines above down
-                for move_y in range(y, 0, -1):
-                    self.grid[move_y] = self.grid[move_y - 1][:]
-                self.grid[0] = [self.EMPTY_CELL] * self.WIDTH
+        """Clear completed lines and return the number of lines cleared.
+
+        Only rows changed since the last clear are checked.
+        """
+        changed = self._changed_rows()
+        base = self._base
+        rows = self._rows[base + changed.start:base + changed.stop]
+        full = [y for y, row in zip(changed, rows) if self.EMPTY_CELL not in row]
+        if full:
+            self._remove_rows(full)
+        return len(full)
+
+    def _remove_rows(self, full):
+        """Remove the given rows (in ascending order), shifting rows above down.
+
+        Either the stack above the removed rows moves down onto them, or
+        the board's window of slots moves up over them and the rows below
+        move up to meet it, whichever moves fewer rows; every other row
+        keeps its slot and its share of the hash. Clearing k rows costs
+        O(k) plus the rows between them plus the smaller of those two
+        moves, so clears at the top of the stack or near the floor stay
+        flat however tall the stack is.
+        """
+        self._snapshot = None
+        stack_top = min(self.column_tops)
+        full_set = set(full)
+        self._update_column_tops(full, full_set)
+        highest, lowest, freed = full[0], full[-1], len(full)
+        height = self.height
+        moving_stack = lowest + 1 - stack_top <= height - highest
+        if not moving_stack and self._base < freed:
+            self._recenter()
+        base = self._base
+        rows, row_hashes = self._rows, self._row_hashes
+
+        # Removed rows are emptied and reused; being empty, they hash to 0
+        empty = [self.EMPTY_CELL] * self.width
+        cleared = [rows[base + y] for y in full]
+        for row in cleared:
+            row[:] = empty
+        zeros = [0] * freed
+        slot_lists = [(rows, cleared, None)]
+        slot_lists += [(values, zeros, 0) for values in self._slot_lists]
+        # Surviving rows between the removed ones
+        between = ([base + y for y in range(highest + 1, lowest) if y not in full_set]
+                   if lowest - highest >= freed else [])
+
+        # The survivors between the removed rows move to new slots one by
+        # one, the block of rows outside them moves as a whole
+        slot_hash = self._slot_hash
+        for y in full:
+            slot_hash -= row_key(row_hashes[base + y], base + y)
+        if moving_stack:
+            start, stop = base + stack_top, base + lowest + 1
+            block, shift = (start, base + highest), freed
+            landing = base + highest + freed
+        else:
+            start, stop = base + highest, base + height
+            block, shift = (base + lowest + 1, stop), -freed
+            landing = base + highest
+        for slot, new_slot in zip(between, range(landing, landing + len(between))):
+            slot_hash += row_key(row_hashes[slot], new_slot) - row_key(row_hashes[slot], slot)
+        if block[0] < block[1]:
+            block_hash = block_key(row_hashes[block[0]:block[1]], block[0])
+            slot_hash += shift_rows(block_hash, shift) - block_hash
+        for values, fill, blank in slot_lists:
+            moved = [values[slot] for slot in between] if between else []
+            if moving_stack:
+                values[start:stop] = fill + values[start:base + highest] + moved
             else:
-                y -= 1
-        return lines_cleared
+                values[start:stop] = moved + values[base + lowest + 1:stop] + [blank] * freed
+                values[base - freed:base] = fill
+        self._slot_hash = slot_hash & MASK64
+        if not moving_stack:
+            self._set_base(base - freed)
+
+    def add_garbage(self, holes):
+        """Push garbage rows in under the stack, lifting it one row per hole.
+
+        Each garbage row is full except at its hole column; the last hole
+        gives the bottom row. The window of slots moves down by one slot
+        per row, so this costs O(len(holes)) rows plus a pass over the
+        columns, however tall the stack. Rows pushed off the top are lost;
+        returns True if any of them held cells.
+        """
+        count = len(holes)
+        if not count:
+            return False
+        if count > self.height:
+            raise ValueError("more garbage rows than the board holds")
+        self._snapshot = None
+        height = self.height
+        overflow = min(self.column_tops) < count
+        if self._base + height + count > len(self._rows):
+            self._recenter()
+        base = self._base
+        rows, row_hashes = self._rows, self._row_hashes
+
+        # The top rows leave the window and come back in as garbage below it
+        lost = rows[base:base + count]
+        slot_hash = self._slot_hash - block_key(row_hashes[base:base + count], base)
+        rows[base:base + count] = [None] * count
+        for values in self._slot_lists:
+            values[base:base + count] = [0] * count
+
+        garbage = [self.GARBAGE_CELL] * self.width
+        full_hash = 0
+        for x in range(self.width):
+            full_hash ^= CELL_KEYS[x][self.GARBAGE_CELL]
+        bottom = base + height
+        for slot, (row, hole) in enumerate(zip(lost, holes), bottom):
+            row[:] = garbage
+            row[hole] = self.EMPTY_CELL
+            rows[slot] = row
+            row_hashes[slot] = full_hash ^ CELL_KEYS[hole][self.GARBAGE_CELL]
+        slot_hash += block_key(row_hashes[bottom:bottom + count], bottom)
+        self._slot_hash = slot_hash & MASK64
+        base += count
+        self._set_base(base)
+
+        column_tops = self.column_tops
+        for x in range(self.width):
+            top = column_tops[x]
+            if count <= top < height:
+                column_tops[x] = top - count
+                continue
+            # Cells went off the top, or the column was empty: rescan it
+            y = 0 if top < count else height - count
+            while y < height and rows[base + y][x] == self.EMPTY_CELL:
+                y += 1
+            column_tops[x] = y
+        # Rows still to be checked for clears moved up with the stack
+        if self._changed_bottom >= 0:
+            self._changed_top = max(self._changed_top - count, 0)
+            self._changed_bottom -= count
+        return overflow
+
+    def _update_column_tops(self, full, full_set):
+        """Recompute column tops for rows about to be removed (rows not yet moved)."""
+        rows, base = self._rows, self._base
+        highest, lowest = full[0], full[-1]
+        for x, top in enumerate(self.column_tops):
+            if top > lowest:
+                continue
+            if top < highest:
+                # Its top cell survives, with every removed row below it
+                self.column_tops[x] = top + len(full)
+                continue
+            # Find the column's highest cell that survives the clear
+            y = top
+            while y < self.height and (y in full_set or rows[base + y][x] == self.EMPTY_CELL):
+                y += 1
+            if y < self.height:
+                # Every removed row below it shifts it down by one
+                y += sum(1 for full_y in full_set if full_y > y)
+            self.column_tops[x] = y
 
     def get_ghost_position(self, piece, pos_x, pos_y):
         """Calculate the landing position of the current piece."""
+        # Above the top surface of every column it covers, the piece falls
+        # until its lowest cell in some column meets that column's top
+        column_tops = self.column_tops
+        distance = self.height
+        for dx, dy in piece.state.bottoms:
+            gap = column_tops[pos_x + dx] - pos_y - dy - 1
+            if gap < 0:
+                break
+            if gap < distance:
+                distance = gap
+        else:
+            return pos_y + distance
+
+        # Below an overhang: step down one row at a time
         ghost_y = pos_y
         while self.is_valid_move(piece, pos_x, ghost_y + 1):
             ghost_y += 1
@@ -56,8 +427,13 @@ class Board:
 
     def is_game_over(self):
         """Check if any column in the top row is filled."""
-        return any(cell != self.EMPTY_CELL for cell in self.grid[0])
+        return any(cell != self.EMPTY_CELL for cell in self._rows[self._base])
+
+    def get_row_masks(self):
+        """Return each row as a bitmask with bit x set for filled column x."""
+        return [sum(1 << x for x, cell in enumerate(row) if cell != self.EMPTY_CELL)
+                for row in self.grid]
 
     def get_grid_copy(self):
         """Return a copy of the current grid."""
-        return [row[:] for row in self.grid]
\ No newline at end of file
+        return [row[:] for row in self.grid]
@@ -1,6 +1,12 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+import random
 from .tetromino import Tetromino
 from .board import Board
+from .instrumentation import Instrumentation
+from .placements import Placement, enumerate_placements
+from .randomizer import PieceGenerator
+from .snapshot import GameSnapshot
+from .zobrist import NEXT_PIECE_KEYS, PIECE_KEYS, position_key
 
 class GameState:
     """Manages the overall state of the Tetris game."""
@@ -13,45 +19,62 @@ class GameState:
         4: 800    # Tetris
     }
 
-    def __init__(self):
-        """Initialize a new game state."""
-        self.board = Board()
+    def __init__(self, board: Optional[Board] = None,
+                 rng: Optional[random.Random] = None,
+                 randomizer: Optional[PieceGenerator] = None,
+                 instrumentation: Optional[Instrumentation] = None):
+        """Initialize a new game state.
+
+        Pass a ``BitBoard`` as ``board`` to use the bitmask-backed board.
+        Pieces come from ``randomizer``; if none is given, a pure-random
+        generator is built on ``rng`` (a seeded ``random.Random`` gives a
+        reproducible sequence that shares no state with other games).
+        Spawns, locks, rotations, kicks and cleared lines are counted on
+        ``instrumentation`` when one is given.
+        """
+        self.board = board if board is not None else Board()
+        self.randomizer = (randomizer if randomizer is not None
+                           else PieceGenerator(rng=rng))
         self.score = 0
         self.level = 1
         self.lines_cleared = 0
+        self.pieces_placed = 0
         self.current_piece: Optional[Tetromino] = None
         self.next_piece: Optional[Tetromino] = None
         self.piece_position = {'x': 0, 'y': 0}
         self.game_paused = False
         self.game_over = False
-        
-        # Debug flag
-        self.debug = True
+        self.instrumentation = instrumentation
         
         # Initialize pieces
         self._spawn_new_piece()
 
     def _spawn_new_piece(self) -> bool:
         """Spawn a new piece at the top of the board."""
-        self.current_piece = self.next_piece if self.next_piece else Tetromino.get_random_piece()
-        self.next_piece = Tetromino.get_random_piece()
+        # Recycle the outgoing piece as the new preview piece
+        recycled = self.current_piece
+        self.current_piece = (self.next_piece if self.next_piece
+                              else Tetromino(self.randomizer.next()))
+        if recycled is None:
+            self.next_piece = Tetromino(self.randomizer.next())
+        else:
+            recycled.reset(self.randomizer.next())
+            self.next_piece = recycled
         
         # Calculate starting position (center-top of board)
         self.piece_position = {
-            'x': (Board.WIDTH - self.current_piece.get_width()) // 2,
+            'x': (self.board.width - self.current_piece.get_width()) // 2,
             'y': 0
         }
         
-        if self.debug:
-            print(f"Spawning new piece at position x:{self.piece_position['x']}, y:{self.piece_position['y']}")
+        if self.instrumentation is not None:
+            self.instrumentation.count('spawns')
         
         # Check if piece can be placed at starting position
         if not self.board.is_valid_move(self.current_piece, 
                                       self.piece_position['x'], 
                                       self.piece_position['y']):
             self.game_over = True
-            if self.debug:
-                print("Game Over: Can't place new piece")
             return False
         return True
 
@@ -74,26 +97,29 @@ class GameState:
         if self.game_over or self.game_paused or not self.current_piece:
             return False
 
-        # Store original shape
-        original_shape = self.current_piece.shape
+        # Store original rotation
+        original_rotation = self.current_piece.rotation
         
         # Rotate piece
-        self.current_piece.shape = (self.current_piece.rotate_clockwise() 
-                                  if clockwise 
-                                  else self.current_piece.rotate_counterclockwise())
+        self.current_piece.rotate(clockwise)
 
         # Try wall kicks
-        for dx, dy in self.current_piece.get_wall_kick_tests(self.current_piece.rotation):
+        kicks = self.current_piece.get_wall_kick_tests(self.current_piece.rotation)
+        for kick, (dx, dy) in enumerate(kicks):
             test_x = self.piece_position['x'] + dx
             test_y = self.piece_position['y'] + dy
             
             if self.board.is_valid_move(self.current_piece, test_x, test_y):
                 self.piece_position['x'] = test_x
                 self.piece_position['y'] = test_y
+                if self.instrumentation is not None:
+                    self.instrumentation.count('rotations')
+                    if kick:
+                        self.instrumentation.count('kicks')
                 return True
 
-        # If no valid rotation found, revert to original shape
-        self.current_piece.shape = original_shape
+        # If no valid rotation found, revert to original rotation
+        self.current_piece.rotation = original_rotation
         return False
 
     def drop_piece(self) -> bool:
@@ -101,49 +127,93 @@ class GameState:
         if self.move_piece(0, 1):
             return True
         
-        if self.debug:
-            print("Piece locked, placing on board")
-            
         # Lock piece and spawn new one
-        self.board.place_piece(self.current_piece, 
-                             self.piece_position['x'], 
-                             self.piece_position['y'])
-        
-        # Clear lines and update score
-        lines = self.board.clear_lines()
-        if lines > 0:
-            self.update_score(lines)
-        
+        self._lock_piece()
         return self._spawn_new_piece()
 
+    def soft_drop(self) -> bool:
+        """Move the piece down one row, scoring a point if it moved."""
+        if self.move_piece(0, 1):
+            self.score += 1
+            return True
+        return False
+
     def hard_drop(self) -> None:
         """Drop piece to the bottom instantly."""
-        if self.debug:
-            print("Starting hard drop")
-            
         # Calculate how far the piece can drop
         cells_dropped = 0
-        while self.move_piece(0, 1):
-            cells_dropped += 1
-            
-        if self.debug:
-            print(f"Dropped {cells_dropped} cells")
+        if not (self.game_over or self.game_paused) and self.current_piece:
+            ghost_y = self.get_ghost_position()['y']
+            cells_dropped = ghost_y - self.piece_position['y']
+            self.piece_position['y'] = ghost_y
             
         # Add score for the hard drop
         self.score += cells_dropped * 2
         
         # Lock the piece and spawn new one
+        self._lock_piece()
+        self._spawn_new_piece()
+
+    def _lock_piece(self) -> None:
+        """Place the current piece on the board, clear lines and score them."""
         self.board.place_piece(self.current_piece, 
                              self.piece_position['x'], 
                              self.piece_position['y'])
+        self.pieces_placed += 1
         
         # Clear lines and update score
         lines = self.board.clear_lines()
         if lines > 0:
             self.update_score(lines)
-            
-        # Spawn new piece
-        self._spawn_new_piece()
+        
+        if self.instrumentation is not None:
+            self.instrumentation.count('locks')
+            self.instrumentation.count('lines', lines)
+
+    def apply_action(self, action: str) -> bool:
+        """Apply a named movement, rotation or drop action to the piece.
+
+        Returns True if the action changed the game state.
+        """
+        if action == 'move_left':
+            return self.move_piece(-1, 0)
+        if action == 'move_right':
+            return self.move_piece(1, 0)
+        if action == 'soft_drop':
+            return self.move_piece(0, 1)
+        if action == 'rotate_clockwise':
+            return self.rotate_piece(clockwise=True)
+        if action == 'rotate_counterclockwise':
+            return self.rotate_piece(clockwise=False)
+        if action == 'hard_drop':
+            if self.game_over or self.game_paused or not self.current_piece:
+                return False
+            self.hard_drop()
+            return True
+        return False
+
+    def add_garbage(self, holes: List[int]) -> bool:
+        """Push garbage rows in under the stack; see ``Board.add_garbage``.
+
+        The falling piece is lifted by up to one row per garbage row to
+        stay clear of the rising stack. Returns False, ending the game, if
+        filled rows are pushed off the top or the piece cannot be freed.
+        """
+        if self.game_over:
+            return False
+        overflow = self.board.add_garbage(holes)
+        piece = self.current_piece
+        if piece is not None:
+            x, y = self.piece_position['x'], self.piece_position['y']
+            for lift in range(len(holes) + 1):
+                if self.board.is_valid_move(piece, x, y - lift):
+                    self.piece_position['y'] = y - lift
+                    break
+            else:
+                overflow = True
+        if overflow:
+            self.game_over = True
+        return not overflow
 
     def update_score(self, lines_cleared: int) -> None:
         """Update score based on lines cleared."""
@@ -168,10 +238,86 @@ class GameState:
             'y': ghost_y
         }
 
+    @property
+    def hash(self) -> int:
+        """Return a 64-bit hash of the board, active piece and next piece."""
+        position_hash = self.board.hash
+        piece = self.current_piece
+        if piece is not None:
+            position_hash ^= (PIECE_KEYS[piece.shape_name][piece.rotation] ^
+                              position_key(self.piece_position['x'],
+                                           self.piece_position['y']))
+        if self.next_piece is not None:
+            position_hash ^= NEXT_PIECE_KEYS[self.next_piece.shape_name]
+        return position_hash
+
+    def snapshot(self) -> GameSnapshot:
+        """Return an immutable snapshot of the whole game.
+
+        The board part is shared with earlier snapshots while the board is
+        unchanged, so snapshotting between locks costs a few attribute reads.
+        """
+        piece, next_piece = self.current_piece, self.next_piece
+        return GameSnapshot(
+            self.board.snapshot(),
+            piece.shape_name if piece else None,
+            piece.rotation if piece else 0,
+            self.piece_position['x'],
+            self.piece_position['y'],
+            next_piece.shape_name if next_piece else None,
+            self.score,
+            self.level,
+            self.lines_cleared,
+            self.pieces_placed,
+            self.game_over,
+            self.game_paused,
+            self.randomizer.snapshot(),
+        )
+
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """Put the game back exactly as it was when ``snapshot`` was taken."""
+        self.board.restore(snapshot.board)
+        self.current_piece = self._restored_piece(self.current_piece, snapshot.piece)
+        if self.current_piece is not None:
+            self.current_piece.rotation = snapshot.rotation
+        self.next_piece = self._restored_piece(self.next_piece, snapshot.next_piece)
+        self.piece_position['x'] = snapshot.x
+        self.piece_position['y'] = snapshot.y
+        self.score = snapshot.score
+        self.level = snapshot.level
+        self.lines_cleared = snapshot.lines_cleared
+        self.pieces_placed = snapshot.pieces_placed
+        self.game_over = snapshot.game_over
+        self.game_paused = snapshot.game_paused
+        self.randomizer.restore(snapshot.randomizer)
+
+    @staticmethod
+    def _restored_piece(piece: Optional[Tetromino],
+                        shape_name: Optional[str]) -> Optional[Tetromino]:
+        """Return ``piece`` reset to ``shape_name``, reusing the object if possible."""
+        if shape_name is None:
+            return None
+        if piece is None:
+            return Tetromino(shape_name)
+        piece.reset(shape_name)
+        return piece
+
+    def get_placements(self) -> List[Placement]:
+        """Get every resting placement reachable by the current piece."""
+        if self.game_over or not self.current_piece:
+            return []
+        return enumerate_placements(self.board, self.current_piece,
+                                    self.piece_position['x'],
+                                    self.piece_position['y'])
+
     def toggle_pause(self) -> None:
         """Toggle the game's pause state."""
         self.game_paused = not self.game_paused
 
     def get_drop_delay(self) -> int:
         """Calculate delay between piece drops based on level."""
-        return max(50, 800 - (self.level * 50))  # in milliseconds
\ No newline at end of file
+        return max(50, 800 - (self.level * 50))  # in milliseconds
+
+    def get_drop_ticks(self, tick_rate: int) -> int:
+        """Return the drop delay in simulation ticks at ``tick_rate`` ticks per second."""
+        return max(1, round(self.get_drop_delay() * tick_rate / 1000))
\ No newline at end of file
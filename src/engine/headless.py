@@ -0,0 +1,69 @@
+from typing import Callable, Optional, Tuple, Union
+from .board import Board
+from .game_state import GameState
+from .randomizer import PieceGenerator
+
+class HeadlessGame:
+    """Drives a GameState one discrete action at a time, without pygame.
+
+    Each ``step`` applies one action, then advances ``gravity_ticks``
+    gravity drops, so simulations run as fast as the engine allows.
+    """
+
+    # Discrete action space; integer actions index into this tuple
+    ACTIONS = (
+        'noop',
+        'move_left',
+        'move_right',
+        'soft_drop',
+        'rotate_clockwise',
+        'rotate_counterclockwise',
+        'hard_drop',
+    )
+
+    def __init__(self, gravity_ticks: int = 1,
+                 board_factory: Callable[[], Board] = Board,
+                 seed: Optional[int] = None, piece_policy: str = 'random'):
+        """Initialize the environment and start a new game."""
+        if gravity_ticks < 0:
+            raise ValueError("gravity_ticks must be non-negative")
+        self.gravity_ticks = gravity_ticks
+        self.piece_policy = piece_policy
+        self.board_factory = board_factory
+        self.game_state: Optional[GameState] = None
+        self.reset(seed)
+
+    def reset(self, seed: Optional[int] = None) -> GameState:
+        """Start a new game and return its state.
+
+        With a ``seed`` the game draws pieces from its own seeded RNG, so
+        the piece sequence is reproducible.
+        """
+        randomizer = PieceGenerator(seed, policy=self.piece_policy)
+        self.game_state = GameState(board=self.board_factory(),
+                                    randomizer=randomizer)
+        return self.game_state
+
+    def step(self, action: Union[int, str]) -> Tuple[GameState, int, bool]:
+        """Apply an action and advance gravity.
+
+        Returns the game state, the score gained during the step and
+        whether the game is over.
+        """
+        state = self.game_state
+        if state.game_over:
+            return state, 0, True
+
+        if isinstance(action, int):
+            action = self.ACTIONS[action]
+        elif action not in self.ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+
+        score_before = state.score
+        state.apply_action(action)
+        for _ in range(self.gravity_ticks):
+            if state.game_over:
+                break
+            state.drop_piece()
+
+        return state, state.score - score_before, state.game_over
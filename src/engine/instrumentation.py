@@ -0,0 +1,122 @@
+"""
+Optional event counters and per-frame phase timing.
+
+Instrumentation is off unless an ``Instrumentation`` is attached: game
+objects hold ``None`` by default and test for it before counting, so the
+disabled cost is a single attribute check per event.
+"""
+
+import json
+import time
+from collections import deque
+from typing import Deque, Dict, NamedTuple, Tuple
+
+
+class FrameStats(NamedTuple):
+    """Time spent in each phase of one frame, in milliseconds."""
+    frame: int
+    input_ms: float
+    update_ms: float
+    render_ms: float
+
+    @property
+    def total_ms(self) -> float:
+        """Return the time spent in all phases."""
+        return self.input_ms + self.update_ms + self.render_ms
+
+
+class Instrumentation:
+    """Event counters and ring buffers of recent frame timings and latencies.
+
+    Frames are timed by calling ``begin_frame``, then ``lap`` at the end
+    of each phase, then ``end_frame``. Only the last ``history`` frames
+    and input latencies are kept.
+    """
+
+    COUNTERS = ('spawns', 'locks', 'rotations', 'kicks', 'lines')
+    PHASES = ('input', 'update', 'render')
+
+    def __init__(self, history: int = 240):
+        """Start with zeroed counters and an empty frame history."""
+        if history <= 0:
+            raise ValueError("history must be positive")
+        self.counters: Dict[str, int] = dict.fromkeys(self.COUNTERS, 0)
+        self.frames: Deque[FrameStats] = deque(maxlen=history)
+        self.latencies: Deque[Tuple[str, float]] = deque(maxlen=history)
+        self.frame = 0
+        self._laps = dict.fromkeys(self.PHASES, 0.0)
+        self._last = 0.0
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add ``amount`` to the named counter."""
+        self.counters[name] += amount
+
+    def record_latency(self, action: str, latency_ms: float) -> None:
+        """Record the time from an input to the frame that first showed it."""
+        self.latencies.append((action, latency_ms))
+
+    def latency_by_action(self) -> Dict[str, Dict[str, float]]:
+        """Return the mean and worst buffered input latency of each action."""
+        samples: Dict[str, list] = {}
+        for action, latency_ms in self.latencies:
+            samples.setdefault(action, []).append(latency_ms)
+        return {action: {'mean_ms': sum(values) / len(values),
+                         'max_ms': max(values), 'count': len(values)}
+                for action, values in samples.items()}
+
+    def begin_frame(self) -> None:
+        """Start timing a new frame."""
+        for phase in self._laps:
+            self._laps[phase] = 0.0
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Charge the time since the previous lap to ``phase``."""
+        now = time.perf_counter()
+        self._laps[phase] += (now - self._last) * 1000.0
+        self._last = now
+
+    def end_frame(self) -> None:
+        """Store the finished frame in the ring buffer."""
+        laps = self._laps
+        self.frames.append(FrameStats(self.frame, laps['input'],
+                                      laps['update'], laps['render']))
+        self.frame += 1
+
+    def summary(self) -> Dict[str, float]:
+        """Return mean phase times, the worst frame time, the frame rate
+        implied by the mean frame time and the mean input latency, over the
+        buffered frames."""
+        frames = self.frames
+        latency_ms = (sum(latency for _, latency in self.latencies) / len(self.latencies)
+                      if self.latencies else 0.0)
+        if not frames:
+            return {'input_ms': 0.0, 'update_ms': 0.0, 'render_ms': 0.0,
+                    'total_ms': 0.0, 'max_ms': 0.0, 'fps': 0.0,
+                    'latency_ms': latency_ms}
+        count = len(frames)
+        summary = {
+            'input_ms': sum(f.input_ms for f in frames) / count,
+            'update_ms': sum(f.update_ms for f in frames) / count,
+            'render_ms': sum(f.render_ms for f in frames) / count,
+        }
+        summary['total_ms'] = (summary['input_ms'] + summary['update_ms'] +
+                               summary['render_ms'])
+        summary['max_ms'] = max(f.total_ms for f in frames)
+        summary['fps'] = 1000.0 / summary['total_ms'] if summary['total_ms'] else 0.0
+        summary['latency_ms'] = latency_ms
+        return summary
+
+    def to_dict(self) -> Dict[str, object]:
+        """Return the counters, summary and buffered frames as plain data."""
+        return {
+            'counters': dict(self.counters),
+            'summary': self.summary(),
+            'frames': [frame._asdict() for frame in self.frames],
+            'latency': self.latency_by_action(),
+        }
+
+    def dump_json(self, path: str) -> None:
+        """Write ``to_dict()`` to ``path`` as JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
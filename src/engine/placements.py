@@ -0,0 +1,119 @@
+"""
+Enumeration of every final resting placement reachable by the current piece.
+"""
+
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from .board import Board
+from .tetromino import Tetromino
+
+# Moves explored by the search, as (action, dx, dy, rotation step)
+_MOVES = (
+    ('move_left', -1, 0, 0),
+    ('move_right', 1, 0, 0),
+    ('rotate_clockwise', 0, 0, 1),
+    ('rotate_counterclockwise', 0, 0, -1),
+    ('soft_drop', 0, 1, 0),
+)
+
+
+class Placement(NamedTuple):
+    """A reachable resting position and the inputs that lead to it."""
+    rotation: int
+    x: int
+    y: int
+    path: Tuple[str, ...]  # Actions from the start; always ends in 'hard_drop'
+
+
+def placements_from_masks(rows: Sequence[int], width: int, shape_name: str,
+                          rotation: int, x: int, y: int) -> List[Placement]:
+    """Enumerate placements on a board given as row bitmasks.
+
+    Runs a breadth-first search over (rotation, x, y) states using the
+    same movement and wall kick rules as ``GameState``, then hard-drops
+    from every visited state. Placements that cover the same cells are
+    merged, keeping the shortest input path. Gravity is ignored, i.e.
+    moves are assumed to be faster than the drop delay.
+    """
+    states = Tetromino.ROTATIONS[shape_name]
+    height = len(rows)
+    full_row = (1 << width) - 1
+    fits_cache: Dict[Tuple[int, int, int], bool] = {}
+
+    def fits(r: int, px: int, py: int) -> bool:
+        key = (r, px, py)
+        cached = fits_cache.get(key)
+        if cached is not None:
+            return cached
+        result = True
+        for dy, mask in states[r].row_masks:
+            if px >= 0:
+                mask <<= px
+            elif mask & ((1 << -px) - 1):
+                result = False
+                break
+            else:
+                mask >>= -px
+            row_y = py + dy
+            if mask > full_row or row_y >= height or (row_y >= 0 and rows[row_y] & mask):
+                result = False
+                break
+        fits_cache[key] = result
+        return result
+
+    start = (rotation, x, y)
+    if not fits(*start):
+        return []
+
+    parents: Dict[Tuple[int, int, int], Optional[Tuple[Tuple[int, int, int], str]]] = {start: None}
+    queue = deque([start])
+    order = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        r, px, py = node
+        for action, dx, dy, turn in _MOVES:
+            if turn:
+                new_r = (r + turn) % 4
+                for kick_x, kick_y in states[new_r].kicks:
+                    if fits(new_r, px + kick_x, py + kick_y):
+                        target = (new_r, px + kick_x, py + kick_y)
+                        break
+                else:
+                    continue
+            elif fits(r, px + dx, py + dy):
+                target = (r, px + dx, py + dy)
+            else:
+                continue
+            if target not in parents:
+                parents[target] = (node, action)
+                queue.append(target)
+
+    def path_to(node: Tuple[int, int, int]) -> Tuple[str, ...]:
+        actions = []
+        while parents[node] is not None:
+            node, action = parents[node]
+            actions.append(action)
+        actions.reverse()
+        return tuple(actions)
+
+    placements = []
+    seen_cells = set()
+    for node in order:
+        r, px, py = node
+        landing_y = py
+        while fits(r, px, landing_y + 1):
+            landing_y += 1
+        cells = frozenset((px + dx, landing_y + dy) for dx, dy in states[r].cells)
+        if cells in seen_cells:
+            continue
+        seen_cells.add(cells)
+        placements.append(Placement(r, px, landing_y, path_to(node) + ('hard_drop',)))
+    return placements
+
+
+def enumerate_placements(board: Board, piece: Tetromino,
+                         x: int, y: int) -> List[Placement]:
+    """Enumerate placements of ``piece`` starting at (x, y) on ``board``."""
+    return placements_from_masks(board.get_row_masks(), board.width,
+                                 piece.shape_name, piece.rotation, x, y)
@@ -0,0 +1,76 @@
+from typing import Iterator, Optional, Tuple
+import random
+from .tetromino import Tetromino
+
+class PieceGenerator:
+    """Seedable source of piece shape names, pre-generated in blocks.
+
+    Policies:
+    - ``'random'``: every piece is drawn uniformly and independently
+    - ``'bag'``: each run of seven pieces is a shuffled set of all shapes
+    """
+
+    POLICIES = ('random', 'bag')
+    NAMES = tuple(Tetromino.SHAPES.keys())
+
+    def __init__(self, seed: Optional[int] = None, policy: str = 'random',
+                 block_size: int = 1024, rng: Optional[random.Random] = None):
+        """Create a generator from a seed, or from an existing RNG."""
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown piece policy: {policy}")
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        self.policy = policy
+        self.rng = rng if rng is not None else random.Random(seed)
+        # Bags must not straddle blocks
+        bag_size = len(self.NAMES)
+        self.block_size = (block_size if policy == 'random'
+                           else max(1, block_size // bag_size) * bag_size)
+        self._block: Tuple[str, ...] = ()
+        self._index = 0
+        # RNG state once the current block was generated; see ``snapshot``
+        self._rng_state = self.rng.getstate()
+
+    def _refill(self) -> None:
+        """Generate the next block of pieces."""
+        if self.policy == 'random':
+            self._block = tuple(self.rng.choices(self.NAMES, k=self.block_size))
+        else:
+            block = []
+            bag = list(self.NAMES)
+            for _ in range(self.block_size // len(bag)):
+                self.rng.shuffle(bag)
+                block.extend(bag)
+            self._block = tuple(block)
+        self._index = 0
+        self._rng_state = self.rng.getstate()
+
+    def next(self) -> str:
+        """Return the next piece shape name."""
+        if self._index >= len(self._block):
+            self._refill()
+        name = self._block[self._index]
+        self._index += 1
+        return name
+
+    def snapshot(self) -> Tuple[Tuple[str, ...], int, object]:
+        """Return the generator's position as an immutable tuple.
+
+        The RNG state is captured once per block, so this is cheap. Draws
+        made from a shared RNG by anything else are not part of it.
+        """
+        return self._block, self._index, self._rng_state
+
+    def restore(self, snapshot: Tuple[Tuple[str, ...], int, object]) -> None:
+        """Return to a position saved with ``snapshot()``."""
+        block, self._index, rng_state = snapshot
+        if rng_state is not self._rng_state:
+            self.rng.setstate(rng_state)
+            self._rng_state = rng_state
+        self._block = block
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        return self.next()
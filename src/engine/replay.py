@@ -0,0 +1,242 @@
+"""
+Compact binary replays of headless games.
+
+A replay is a fixed-size header followed by a stream of input records.
+Each record is one byte holding the action (low 3 bits) and the number of
+ticks since the previous record (high 5 bits). Tick deltas of 31 or more
+store 31 in the byte and the remainder as a LEB128 varint after it.
+Ticks without a record are no-ops, so idle time costs nothing.
+
+A tick is one ``HeadlessGame.step``. Archives are plain concatenations of
+replays and are read through ``mmap`` without parsing them in full.
+"""
+
+import mmap
+import struct
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
+from .headless import HeadlessGame
+from .randomizer import PieceGenerator
+
+# Bump whenever a change to the engine alters how inputs play out
+RULES_VERSION = 1
+
+MAGIC = b'TRPL'
+FORMAT_VERSION = 1
+
+# magic, format version, rules version, seed, gravity ticks, piece policy,
+# total ticks, record bytes
+_HEADER = struct.Struct('<4sBHQBBII')
+
+_ACTION_BITS = 3
+_ACTION_MASK = (1 << _ACTION_BITS) - 1
+_DELTA_ESCAPE = (1 << (8 - _ACTION_BITS)) - 1
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+class ReplayHeader(NamedTuple):
+    """Settings needed to reproduce a recorded game."""
+    seed: int
+    gravity_ticks: int
+    piece_policy: str
+    num_ticks: int
+    data_size: int
+    rules_version: int = RULES_VERSION
+
+    @property
+    def size(self) -> int:
+        """Return the total encoded size of the replay in bytes."""
+        return _HEADER.size + self.data_size
+
+    def make_game(self) -> HeadlessGame:
+        """Create a fresh game configured like the recorded one."""
+        return HeadlessGame(gravity_ticks=self.gravity_ticks, seed=self.seed,
+                            piece_policy=self.piece_policy)
+
+
+class ReplayRecorder:
+    """Records the action of every step of a headless game."""
+
+    def __init__(self, seed: int, gravity_ticks: int = 1,
+                 piece_policy: str = 'random'):
+        """Start an empty recording for a game with the given settings."""
+        if seed < 0:
+            raise ValueError("Replay seeds must be non-negative")
+        self.seed = seed
+        self.gravity_ticks = gravity_ticks
+        self.piece_policy = piece_policy
+        self.num_ticks = 0
+        self._last_tick = 0
+        self._data = bytearray()
+
+    def make_game(self) -> HeadlessGame:
+        """Create the game this recorder describes."""
+        return HeadlessGame(gravity_ticks=self.gravity_ticks, seed=self.seed,
+                            piece_policy=self.piece_policy)
+
+    def record(self, action: Union[int, str]) -> None:
+        """Record the action applied at the current tick and advance."""
+        if isinstance(action, str):
+            action = HeadlessGame.ACTIONS.index(action)
+        if action:
+            delta = self.num_ticks - self._last_tick
+            self._last_tick = self.num_ticks
+            if delta < _DELTA_ESCAPE:
+                self._data.append(action | (delta << _ACTION_BITS))
+            else:
+                self._data.append(action | (_DELTA_ESCAPE << _ACTION_BITS))
+                delta -= _DELTA_ESCAPE
+                while delta >= 0x80:
+                    self._data.append((delta & 0x7F) | 0x80)
+                    delta >>= 7
+                self._data.append(delta)
+        self.num_ticks += 1
+
+    def to_bytes(self) -> bytes:
+        """Encode the recording as a replay."""
+        header = _HEADER.pack(MAGIC, FORMAT_VERSION, RULES_VERSION, self.seed,
+                              self.gravity_ticks,
+                              PieceGenerator.POLICIES.index(self.piece_policy),
+                              self.num_ticks, len(self._data))
+        return header + bytes(self._data)
+
+
+def read_header(buffer: Buffer, offset: int = 0) -> ReplayHeader:
+    """Decode the replay header at ``offset``."""
+    (magic, version, rules_version, seed, gravity_ticks, policy,
+     num_ticks, data_size) = _HEADER.unpack_from(buffer, offset)
+    if magic != MAGIC:
+        raise ValueError(f"Not a replay at offset {offset}")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported replay format version {version}")
+    if rules_version != RULES_VERSION:
+        raise ValueError(f"Replay recorded under rules version {rules_version}, "
+                         f"this engine plays version {RULES_VERSION}")
+    return ReplayHeader(seed, gravity_ticks, PieceGenerator.POLICIES[policy],
+                        num_ticks, data_size, rules_version)
+
+
+class Replay:
+    """A zero-copy view of one encoded replay."""
+
+    def __init__(self, buffer: Buffer, offset: int = 0):
+        """Wrap the replay stored in ``buffer`` at ``offset``."""
+        self.header = read_header(buffer, offset)
+        self._buffer = buffer
+        self._start = offset + _HEADER.size
+
+    def to_bytes(self) -> bytes:
+        """Return a copy of the encoded replay, e.g. to send to another process."""
+        return bytes(self._buffer[self._start - _HEADER.size:
+                                  self._start + self.header.data_size])
+
+    def inputs(self) -> Iterator[Tuple[int, int]]:
+        """Yield (tick, action) for every recorded non-no-op input."""
+        data = self._buffer
+        tick, i, size = 0, self._start, self._start + self.header.data_size
+        while i < size:
+            byte = data[i]
+            i += 1
+            delta = byte >> _ACTION_BITS
+            if delta == _DELTA_ESCAPE:
+                shift = 0
+                while True:
+                    part = data[i]
+                    i += 1
+                    delta += (part & 0x7F) << shift
+                    shift += 7
+                    if part < 0x80:
+                        break
+            tick += delta
+            yield tick, byte & _ACTION_MASK
+
+
+class ReplayPlayer:
+    """Replays a recording through ``HeadlessGame`` as fast as possible."""
+
+    def __init__(self, replay: Replay):
+        """Load a replay, positioned at tick 0."""
+        self.replay = replay
+        self.rewind()
+
+    def rewind(self) -> None:
+        """Restart playback from the first tick."""
+        self.game = self.replay.header.make_game()
+        self.tick = 0
+        self._inputs = self.replay.inputs()
+        self._pending = next(self._inputs, None)
+
+    def seek(self, tick: int) -> HeadlessGame:
+        """Fast-forward (or rewind and replay) to the start of ``tick``."""
+        tick = min(tick, self.replay.header.num_ticks)
+        if tick < self.tick:
+            self.rewind()
+        game, pending, inputs = self.game, self._pending, self._inputs
+        while self.tick < tick:
+            action = 0
+            if pending is not None and pending[0] == self.tick:
+                action = pending[1]
+                pending = next(inputs, None)
+            game.step(action)
+            self.tick += 1
+        self._pending = pending
+        return game
+
+    def play_to_end(self) -> HeadlessGame:
+        """Replay every remaining tick."""
+        return self.seek(self.replay.header.num_ticks)
+
+
+class ReplayArchive:
+    """Read-only, memory-mapped file of concatenated replays.
+
+    Only headers are touched while indexing; records are decoded lazily
+    when a replay is played.
+    """
+
+    def __init__(self, path: str):
+        """Map the archive at ``path`` into memory."""
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            self._map = b''
+        self._offsets: Optional[List[int]] = None
+
+    def _index(self) -> List[int]:
+        """Return the offset of every replay, hopping from header to header."""
+        if self._offsets is None:
+            offsets, offset, size = [], 0, len(self._map)
+            while offset < size:
+                offsets.append(offset)
+                offset += read_header(self._map, offset).size
+            self._offsets = offsets
+        return self._offsets
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def __getitem__(self, index: int) -> Replay:
+        return Replay(self._map, self._index()[index])
+
+    def __iter__(self) -> Iterator[Replay]:
+        for offset in self._index():
+            yield Replay(self._map, offset)
+
+    def close(self) -> None:
+        """Unmap and close the archive file."""
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> 'ReplayArchive':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def append(path: str, replay: bytes) -> None:
+        """Append an encoded replay to the archive at ``path``."""
+        with open(path, 'ab') as f:
+            f.write(replay)
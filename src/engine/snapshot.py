@@ -0,0 +1,91 @@
+"""
+Immutable game snapshots and a bounded ring of recent snapshots.
+
+Snapshots are plain tuples, so taking one allocates little and they can
+be shared, hashed and compared freely. A board caches its snapshot until
+it next changes, so consecutive game snapshots between piece locks all
+share one board snapshot.
+"""
+
+from typing import List, NamedTuple, Optional, Tuple
+
+# Remaining pieces of the current block, index into it, RNG state after it
+GeneratorSnapshot = Tuple[Tuple[str, ...], int, object]
+
+
+class BoardSnapshot(NamedTuple):
+    """Cells and derived state of a board."""
+    grid: Tuple[Tuple[int, ...], ...]
+    column_tops: Tuple[int, ...]
+    row_hashes: Tuple[int, ...]
+    hash: int
+    rows: Optional[Tuple[int, ...]] = None  # Row masks of a BitBoard
+
+
+class GameSnapshot(NamedTuple):
+    """Everything needed to put a ``GameState`` back exactly as it was."""
+    board: BoardSnapshot
+    piece: Optional[str]
+    rotation: int
+    x: int
+    y: int
+    next_piece: Optional[str]
+    score: int
+    level: int
+    lines_cleared: int
+    pieces_placed: int
+    game_over: bool
+    game_paused: bool
+    randomizer: GeneratorSnapshot
+
+
+class SnapshotRing:
+    """Fixed-capacity store of snapshots keyed by tick.
+
+    Holds the snapshots of the last ``capacity`` ticks pushed; older
+    ones are overwritten in place, so memory stays bounded.
+    """
+
+    def __init__(self, capacity: int):
+        """Create an empty ring holding up to ``capacity`` snapshots."""
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._slots: List[Optional[Tuple[int, GameSnapshot]]] = [None] * capacity
+        self.newest: Optional[int] = None
+
+    def push(self, tick: int, snapshot: GameSnapshot) -> None:
+        """Store the snapshot taken at ``tick``, the newest from now on."""
+        self._slots[tick % self.capacity] = (tick, snapshot)
+        self.newest = tick
+
+    def get(self, tick: int) -> Optional[GameSnapshot]:
+        """Return the snapshot of ``tick``, or None if it is not held."""
+        if self.newest is None or tick > self.newest:
+            return None
+        slot = self._slots[tick % self.capacity]
+        if slot is None or slot[0] != tick:
+            return None
+        return slot[1]
+
+    def __contains__(self, tick: int) -> bool:
+        return self.get(tick) is not None
+
+    def __len__(self) -> int:
+        if self.newest is None:
+            return 0
+        return sum(1 for slot in self._slots
+                   if slot is not None and slot[0] <= self.newest)
+
+    def discard_after(self, tick: int) -> None:
+        """Forget snapshots newer than ``tick``."""
+        if self.newest is not None and tick < self.newest:
+            for index, slot in enumerate(self._slots):
+                if slot is not None and slot[0] > tick:
+                    self._slots[index] = None
+            self.newest = tick
+
+    def clear(self) -> None:
+        """Forget every snapshot."""
+        self._slots = [None] * self.capacity
+        self.newest = None
@@ -1,6 +1,50 @@
-from typing import List, Tuple
+from typing import List, NamedTuple, Tuple
 import random
 
+
+class RotationState(NamedTuple):
+    """Immutable, precomputed description of one rotation of a shape."""
+    cells: Tuple[Tuple[int, int], ...]      # Occupied (dx, dy) offsets
+    width: int
+    height: int
+    kicks: Tuple[Tuple[int, int], ...]      # Wall kick tests
+    row_masks: Tuple[Tuple[int, int], ...]  # (dy, column bitmask) pairs
+    matrix: Tuple[Tuple[int, ...], ...]
+    bottoms: Tuple[Tuple[int, int], ...]    # (dx, lowest dy) per column
+
+
+def _build_rotation_states(shape_name: str,
+                           matrix: List[List[int]]) -> Tuple[RotationState, ...]:
+    """Build all four clockwise rotation states of a shape matrix."""
+    # Simple wall kick tests - can be expanded to implement SRS
+    if shape_name == 'I':
+        kicks = ((0, 0), (-2, 0), (1, 0), (-2, 1), (1, -2))
+    else:
+        kicks = ((0, 0), (-1, 0), (1, 0), (0, -1))
+
+    states = []
+    current = tuple(tuple(row) for row in matrix)
+    for _ in range(4):
+        cells = tuple((x, y) for y, row in enumerate(current)
+                      for x, cell in enumerate(row) if cell)
+        row_masks = tuple((y, sum(1 << x for x, cell in enumerate(row) if cell))
+                          for y, row in enumerate(current) if any(row))
+        bottoms = tuple(sorted({x: max(y for cx, y in cells if cx == x)
+                                for x, _ in cells}.items()))
+        states.append(RotationState(cells, len(current[0]), len(current),
+                                    kicks, row_masks, current, bottoms))
+        N = len(current)
+        current = tuple(tuple(current[N - 1 - j][i] for j in range(N))
+                        for i in range(N))
+    return tuple(states)
+
+
+# Fallback for shapes drawn without an explicit RNG. It is private so
+# that nothing seeding or drawing from the global ``random`` module can
+# change, or be changed by, the pieces of a game.
+_fallback_rng = random.Random()
+
+
 class Tetromino:
     """Represents a Tetris piece with its shape and rotations."""
 
@@ -54,64 +98,90 @@ class Tetromino:
         'L': 7,  # Orange
     }
 
-    def __init__(self, shape_name: str = None):
-        """Initialize a new tetromino with a random shape if none specified."""
-        # Debug flag
-        self.debug = True
-        
+    # All rotation states of every shape, built once at import time
+    ROTATIONS = {name: _build_rotation_states(name, matrices[0])
+                 for name, matrices in SHAPES.items()}
+
+    def __init__(self, shape_name: str = None, rng: random.Random = None):
+        """Initialize a new tetromino with a random shape if none specified.
+
+        Random shapes are drawn from ``rng`` when given, otherwise from a
+        private module RNG. Games never rely on the latter: their pieces
+        come from a seedable ``PieceGenerator``.
+        """
         if shape_name is None:
-            shape_name = random.choice(list(self.SHAPES.keys()))
+            shape_name = (rng or _fallback_rng).choice(list(self.SHAPES.keys()))
         
+        self.reset(shape_name)
+
+    def reset(self, shape_name: str) -> None:
+        """Reuse this piece as a fresh, unrotated piece of the given shape.
+
+        Only references to the shared rotation tables are stored, so
+        recycling a piece allocates nothing.
+        """
         self.shape_name = shape_name
-        self.shape = self.SHAPES[shape_name][0]
+        self.states = self.ROTATIONS[shape_name]
         self.color = self.COLORS[shape_name]
         self.rotation = 0
-        
-        if self.debug:
-            print(f"\nCreating new Tetromino:")
-            print(f"Shape name: {self.shape_name}")
-            print(f"Color: {self.color}")
-            print("Shape:")
-            for row in self.shape:
-                print(row)
+
+    @property
+    def state(self) -> RotationState:
+        """Return the precomputed state for the current rotation."""
+        return self.states[self.rotation]
+
+    @property
+    def cells(self) -> Tuple[Tuple[int, int], ...]:
+        """Return the occupied (dx, dy) offsets of the current rotation."""
+        return self.states[self.rotation].cells
+
+    @property
+    def shape(self) -> List[List[int]]:
+        """Return the current rotation as a matrix of 0/1 cells."""
+        return [list(row) for row in self.states[self.rotation].matrix]
+
+    @shape.setter
+    def shape(self, matrix: List[List[int]]) -> None:
+        """Set the rotation whose matrix equals the given one."""
+        matrix = tuple(tuple(row) for row in matrix)
+        for rotation, state in enumerate(self.states):
+            if state.matrix == matrix:
+                self.rotation = rotation
+                return
+        raise ValueError(f"Not a rotation of {self.shape_name}: {matrix}")
+
+    def rotate(self, clockwise: bool = True) -> None:
+        """Rotate the piece in place by stepping the rotation index."""
+        self.rotation = (self.rotation + (1 if clockwise else -1)) % 4
 
     def rotate_clockwise(self) -> List[List[int]]:
         """Return the clockwise rotation of the current shape."""
-        N = len(self.shape)
-        return [[self.shape[N - 1 - j][i] for j in range(N)]
-                for i in range(N)]
+        return [list(row) for row in self.states[(self.rotation + 1) % 4].matrix]
 
     def rotate_counterclockwise(self) -> List[List[int]]:
         """Return the counterclockwise rotation of the current shape."""
-        N = len(self.shape)
-        return [[self.shape[j][N - 1 - i] for j in range(N)]
-                for i in range(N)]
+        return [list(row) for row in self.states[(self.rotation - 1) % 4].matrix]
+
+    def get_row_masks(self) -> Tuple[Tuple[int, int], ...]:
+        """Return (row offset, column bitmask) pairs for occupied shape rows."""
+        return self.states[self.rotation].row_masks
 
-    def get_wall_kick_tests(self, rotation: int) -> List[Tuple[int, int]]:
+    def get_wall_kick_tests(self, rotation: int) -> Tuple[Tuple[int, int], ...]:
         """Return wall kick test coordinates for rotation."""
-        # Simple wall kick tests - can be expanded to implement SRS
-        if self.shape_name == 'I':
-            return [(0, 0), (-2, 0), (1, 0), (-2, 1), (1, -2)]
-        else:
-            return [(0, 0), (-1, 0), (1, 0), (0, -1)]
+        return self.states[rotation % 4].kicks
 
     @classmethod
-    def get_random_piece(cls) -> 'Tetromino':
-        """Create a new random tetromino."""
-        piece = cls()
-        if piece.debug:
-            print("\nCreated random piece:")
-            print(f"Shape name: {piece.shape_name}")
-            print(f"Color: {piece.color}")
-        return piece
+    def get_random_piece(cls, rng: random.Random = None) -> 'Tetromino':
+        """Create a new random tetromino, drawing from ``rng`` if given."""
+        return cls(rng=rng)
 
     def get_width(self) -> int:
         """Return the width of the current piece."""
-        return len(self.shape[0])
+        return self.states[self.rotation].width
 
     def get_height(self) -> int:
         """Return the height of the current piece."""
-        return len(self.shape)
+        return self.states[self.rotation].height
 
     def __str__(self) -> str:
         """Return string representation of the piece."""
@@ -0,0 +1,264 @@
+"""
+Vectorised multi-game engine stepping N games in lockstep with NumPy.
+
+NumPy is an optional dependency; import this module directly rather than
+through ``src.engine``.
+"""
+
+from typing import Optional, Sequence, Tuple
+import numpy as np
+from .board import Board
+from .game_state import GameState
+from .headless import HeadlessGame
+from .tetromino import Tetromino
+
+
+def _build_piece_tables():
+    """Build (piece, rotation) lookup tables from the rotation states."""
+    names = tuple(Tetromino.ROTATIONS)
+    masks = np.zeros((len(names), 4, 4), dtype=np.int32)
+    cells = np.zeros((len(names), 4, 4, 2), dtype=np.int32)
+    widths = np.zeros(len(names), dtype=np.int32)
+    max_kicks = max(len(states[0].kicks) for states in Tetromino.ROTATIONS.values())
+    kicks = np.zeros((len(names), max_kicks, 2), dtype=np.int32)
+
+    for piece, name in enumerate(names):
+        states = Tetromino.ROTATIONS[name]
+        widths[piece] = states[0].width
+        for rotation, state in enumerate(states):
+            for dy, mask in state.row_masks:
+                masks[piece, rotation, dy] = mask
+            cells[piece, rotation] = state.cells
+        # Pad short kick tables by repeating the last test, which can never
+        # succeed where the previous attempt failed
+        piece_kicks = list(states[0].kicks)
+        piece_kicks += [piece_kicks[-1]] * (max_kicks - len(piece_kicks))
+        kicks[piece] = piece_kicks
+    return names, masks, cells, widths, kicks
+
+
+class VecBoard:
+    """N Tetris games held in NumPy arrays and stepped with array operations.
+
+    Each board is stored as an ``(N, HEIGHT)`` array of row bitmasks, with a
+    parallel ``(N, HEIGHT, WIDTH)`` colour array for rendering and analysis.
+    Actions are indices into ``HeadlessGame.ACTIONS``.
+    """
+
+    WIDTH = Board.WIDTH
+    HEIGHT = Board.HEIGHT
+    FULL_ROW = (1 << Board.WIDTH) - 1
+    ACTIONS = HeadlessGame.ACTIONS
+
+    PIECE_NAMES, PIECE_MASKS, PIECE_CELLS, PIECE_WIDTHS, KICKS = _build_piece_tables()
+
+    # Indexed by number of lines cleared
+    SCORING = np.array([0] + [GameState.SCORING[n] for n in range(1, 5)],
+                       dtype=np.int64)
+
+    # Per-action movement and rotation deltas
+    _ACTION_DX = np.array([{'move_left': -1, 'move_right': 1}.get(a, 0)
+                           for a in ACTIONS], dtype=np.int32)
+    _ACTION_DY = np.array([a == 'soft_drop' for a in ACTIONS], dtype=np.int32)
+    _ACTION_ROTATE = np.array([{'rotate_clockwise': 1,
+                                'rotate_counterclockwise': -1}.get(a, 0)
+                               for a in ACTIONS], dtype=np.int32)
+    _HARD_DROP = ACTIONS.index('hard_drop')
+
+    def __init__(self, num_games: int, seed: Optional[int] = None,
+                 gravity_ticks: int = 1):
+        """Initialize ``num_games`` empty boards and spawn their pieces."""
+        if num_games <= 0:
+            raise ValueError("num_games must be positive")
+        if gravity_ticks < 0:
+            raise ValueError("gravity_ticks must be non-negative")
+        self.num_games = num_games
+        self.gravity_ticks = gravity_ticks
+        self.rng = np.random.default_rng(seed)
+
+        n = num_games
+        self.rows = np.zeros((n, self.HEIGHT), dtype=np.int32)
+        self.colors = np.zeros((n, self.HEIGHT, self.WIDTH), dtype=np.uint8)
+        self.piece = np.zeros(n, dtype=np.int32)
+        self.next_piece = np.zeros(n, dtype=np.int32)
+        self.rotation = np.zeros(n, dtype=np.int32)
+        self.x = np.zeros(n, dtype=np.int32)
+        self.y = np.zeros(n, dtype=np.int32)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.level = np.ones(n, dtype=np.int64)
+        self.lines_cleared = np.zeros(n, dtype=np.int64)
+        self.game_over = np.zeros(n, dtype=bool)
+        self._row_offsets = np.arange(4, dtype=np.int32)
+        self._row_index = np.arange(self.HEIGHT)
+        self.reset()
+
+    def reset(self, games: Optional[np.ndarray] = None) -> None:
+        """Reset the selected games (a boolean mask), or all games."""
+        if games is None:
+            games = np.ones(self.num_games, dtype=bool)
+        else:
+            # Copy, since the mask may be a view of ``game_over`` itself
+            games = np.array(games, dtype=bool)
+        count = int(games.sum())
+        if not count:
+            return
+        self.rows[games] = 0
+        self.colors[games] = 0
+        self.score[games] = 0
+        self.level[games] = 1
+        self.lines_cleared[games] = 0
+        self.game_over[games] = False
+        self.next_piece[games] = self.rng.integers(0, len(self.PIECE_NAMES), count)
+        self._spawn(games)
+
+    def _collides(self, games: np.ndarray, rotation: np.ndarray,
+                  x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Return True for each selected game whose piece would collide."""
+        masks = self.PIECE_MASKS[self.piece[games], rotation]
+        x = x[:, None]
+        shifted = np.where(x >= 0, masks << np.maximum(x, 0),
+                           masks >> np.maximum(-x, 0))
+        # Bits pushed out through the left wall, or past the right wall
+        lost = (masks & ((1 << np.maximum(-x, 0)) - 1)) != 0
+        invalid = lost | (shifted > self.FULL_ROW)
+
+        row_y = y[:, None] + self._row_offsets
+        occupied = masks != 0
+        invalid |= occupied & (row_y >= self.HEIGHT)
+        on_board = (row_y >= 0) & (row_y < self.HEIGHT)
+        board_rows = np.take_along_axis(self.rows[games],
+                                        np.clip(row_y, 0, self.HEIGHT - 1), 1)
+        invalid |= on_board & ((board_rows & shifted) != 0)
+        return invalid.any(axis=1)
+
+    def _spawn(self, games: np.ndarray) -> None:
+        """Promote next pieces to current pieces for the selected games."""
+        idx = np.flatnonzero(games)
+        if not idx.size:
+            return
+        self.piece[idx] = self.next_piece[idx]
+        self.next_piece[idx] = self.rng.integers(0, len(self.PIECE_NAMES), idx.size)
+        self.rotation[idx] = 0
+        self.x[idx] = (self.WIDTH - self.PIECE_WIDTHS[self.piece[idx]]) // 2
+        self.y[idx] = 0
+        self.game_over[idx] |= self._collides(idx, self.rotation[idx],
+                                              self.x[idx], self.y[idx])
+
+    def _lock(self, games: np.ndarray) -> None:
+        """Lock pieces, clear lines, score and spawn for the selected games."""
+        idx = np.flatnonzero(games)
+        if not idx.size:
+            return
+        piece, rotation = self.piece[idx], self.rotation[idx]
+        x, y = self.x[idx], self.y[idx]
+
+        # Place row masks and colours
+        masks = self.PIECE_MASKS[piece, rotation]
+        shifted = np.where(x[:, None] >= 0, masks << np.maximum(x, 0)[:, None],
+                           masks >> np.maximum(-x, 0)[:, None])
+        row_y = y[:, None] + self._row_offsets
+        visible = (masks != 0) & (row_y >= 0) & (row_y < self.HEIGHT)
+        game_idx = np.broadcast_to(idx[:, None], row_y.shape)
+        self.rows[game_idx[visible], row_y[visible]] |= shifted[visible]
+
+        cells = self.PIECE_CELLS[piece, rotation]
+        cell_x = x[:, None] + cells[..., 0]
+        cell_y = y[:, None] + cells[..., 1]
+        visible = cell_y >= 0
+        game_idx = np.broadcast_to(idx[:, None], cell_y.shape)
+        colors = np.broadcast_to((piece + 1)[:, None], cell_y.shape)
+        self.colors[game_idx[visible], cell_y[visible], cell_x[visible]] = colors[visible]
+
+        # Clear lines: stable-sort full rows to the top, then empty them
+        rows = self.rows[idx]
+        full = rows == self.FULL_ROW
+        lines = full.sum(axis=1)
+        cleared = lines > 0
+        if cleared.any():
+            sub = idx[cleared]
+            order = np.argsort(~full[cleared], axis=1, kind='stable')
+            freed = self._row_index < lines[cleared][:, None]
+            new_rows = np.take_along_axis(rows[cleared], order, 1)
+            new_rows[freed] = 0
+            self.rows[sub] = new_rows
+            new_colors = np.take_along_axis(self.colors[sub], order[..., None], 1)
+            new_colors[freed] = 0
+            self.colors[sub] = new_colors
+
+            self.score[sub] += self.SCORING[lines[cleared]] * self.level[sub]
+            self.lines_cleared[sub] += lines[cleared]
+            self.level[sub] = self.lines_cleared[sub] // 10 + 1
+
+        self._spawn(games)
+
+    def step(self, actions: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Apply one action per game and advance gravity.
+
+        Returns the per-game score gained during the step and the
+        per-game game over flags. Finished games are left untouched.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        if actions.shape != (self.num_games,):
+            raise ValueError(f"Expected {self.num_games} actions")
+        score_before = self.score.copy()
+        active = ~self.game_over
+
+        # Shifts and soft drops
+        dx, dy = self._ACTION_DX[actions], self._ACTION_DY[actions]
+        idx = np.flatnonzero(active & ((dx != 0) | (dy != 0)))
+        if idx.size:
+            new_x, new_y = self.x[idx] + dx[idx], self.y[idx] + dy[idx]
+            ok = ~self._collides(idx, self.rotation[idx], new_x, new_y)
+            self.x[idx[ok]] = new_x[ok]
+            self.y[idx[ok]] = new_y[ok]
+
+        # Rotations with wall kicks, tested in order
+        turn = self._ACTION_ROTATE[actions]
+        idx = np.flatnonzero(active & (turn != 0))
+        if idx.size:
+            new_rotation = (self.rotation[idx] + turn[idx]) % 4
+            kicks = self.KICKS[self.piece[idx]]
+            pending = np.ones(idx.size, dtype=bool)
+            for k in range(kicks.shape[1]):
+                sub = np.flatnonzero(pending)
+                if not sub.size:
+                    break
+                test_x = self.x[idx[sub]] + kicks[sub, k, 0]
+                test_y = self.y[idx[sub]] + kicks[sub, k, 1]
+                ok = ~self._collides(idx[sub], new_rotation[sub], test_x, test_y)
+                done = idx[sub[ok]]
+                self.rotation[done] = new_rotation[sub[ok]]
+                self.x[done] = test_x[ok]
+                self.y[done] = test_y[ok]
+                pending[sub[ok]] = False
+
+        # Hard drops: fall row by row for all dropping games at once
+        dropping = active & (actions == self._HARD_DROP)
+        if dropping.any():
+            falling = dropping.copy()
+            while True:
+                idx = np.flatnonzero(falling)
+                if not idx.size:
+                    break
+                ok = ~self._collides(idx, self.rotation[idx], self.x[idx], self.y[idx] + 1)
+                self.y[idx[ok]] += 1
+                self.score[idx[ok]] += 2
+                falling[idx[~ok]] = False
+            self._lock(dropping)
+
+        # Gravity
+        for _ in range(self.gravity_ticks):
+            idx = np.flatnonzero(~self.game_over)
+            if not idx.size:
+                break
+            ok = ~self._collides(idx, self.rotation[idx], self.x[idx], self.y[idx] + 1)
+            self.y[idx[ok]] += 1
+            locked = np.zeros(self.num_games, dtype=bool)
+            locked[idx[~ok]] = True
+            self._lock(locked)
+
+        return self.score - score_before, self.game_over.copy()
+
+    def get_grid_copy(self, game: int):
+        """Return the colour grid of one game as a list of lists."""
+        return self.colors[game].tolist()
@@ -0,0 +1,94 @@
+"""
+Zobrist-style hash keys for boards and game positions.
+
+Keys come from a fixed splitmix64 sequence rather than Python's ``hash``,
+so hashes are identical across processes and machines and can be used
+for desync detection.
+
+A board hash is the sum (mod 2**64), over rows, of the row's cell-key XOR
+multiplied by ``ROW_BASE ** y``. Empty rows contribute nothing, moving a
+row only needs its row hash, not its cells, to be rehashed, and moving a
+whole block of rows by ``k`` multiplies its share of the hash by
+``ROW_BASE ** k``, so it costs O(1) however many rows the block holds.
+"""
+
+from operator import mul
+from typing import List, Sequence
+from .tetromino import Tetromino
+
+MASK64 = (1 << 64) - 1
+
+# Widest supported board
+MAX_WIDTH = 64
+
+
+def splitmix64(value: int) -> int:
+    """Return the splitmix64 mix of a 64-bit integer."""
+    value = (value + 0x9E3779B97F4A7C15) & MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK64
+    return value ^ (value >> 31)
+
+
+# Colour of garbage cells, after the piece colours
+GARBAGE_COLOR = len(Tetromino.COLORS) + 1
+
+# CELL_KEYS[x][color]; the empty colour 0 hashes to 0
+CELL_KEYS = [[splitmix64((x << 8) | color) if color else 0
+              for color in range(GARBAGE_COLOR + 1)]
+             for x in range(MAX_WIDTH)]
+
+PIECE_KEYS = {name: tuple(splitmix64(0x1000000 + (index << 4) + rotation)
+                          for rotation in range(4))
+              for index, name in enumerate(Tetromino.SHAPES)}
+
+NEXT_PIECE_KEYS = {name: splitmix64(0x2000000 + index)
+                   for index, name in enumerate(Tetromino.SHAPES)}
+
+# Odd, so every power of it is invertible mod 2**64
+ROW_BASE = splitmix64(0x3000000) | 1
+ROW_BASE_INVERSE = pow(ROW_BASE, -1, 1 << 64)
+_row_multipliers: List[int] = [1]
+_row_divisors: List[int] = [1]
+
+
+def row_multiplier(y: int) -> int:
+    """Return the multiplier that positions a row hash at row ``y``."""
+    while len(_row_multipliers) <= y:
+        _row_multipliers.append((_row_multipliers[-1] * ROW_BASE) & MASK64)
+    return _row_multipliers[y]
+
+
+def row_divisor(y: int) -> int:
+    """Return the inverse of ``row_multiplier(y)``, moving a hash up ``y`` rows."""
+    while len(_row_divisors) <= y:
+        _row_divisors.append((_row_divisors[-1] * ROW_BASE_INVERSE) & MASK64)
+    return _row_divisors[y]
+
+
+def row_key(row_hash: int, y: int) -> int:
+    """Return the contribution of a row with the given hash at row ``y``."""
+    return (row_hash * row_multiplier(y)) & MASK64
+
+
+def shift_rows(block_hash: int, dy: int) -> int:
+    """Return the hash of a block of rows after moving it down ``dy`` rows.
+
+    ``dy`` may be negative to move the block up.
+    """
+    if dy >= 0:
+        return (block_hash * row_multiplier(dy)) & MASK64
+    return (block_hash * row_divisor(-dy)) & MASK64
+
+
+def block_key(row_hashes: Sequence[int], y: int) -> int:
+    """Return the summed contributions of consecutive rows starting at row ``y``."""
+    stop = y + len(row_hashes)
+    if stop > len(_row_multipliers):
+        row_multiplier(stop)
+    return sum(map(mul, row_hashes, _row_multipliers[y:stop])) & MASK64
+
+
+def position_key(x: int, y: int) -> int:
+    """Return the key for a piece position."""
+    return splitmix64(0x4000000000000000 | ((x & 0xFFFFFFFF) << 32) | (y & 0xFFFFFFFF))
@@ -1,50 +1,288 @@
-import pygame
+import time
+
+# Startup profiling starts before any other import
+_START = time.perf_counter()
+
+import argparse
 import sys
 import os
 
-# Add the project root directory to Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if __package__ in (None, ''):
+    # Run as a script (python src/main.py): make the project root importable
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# The UI backends are imported on demand: the terminal one needs no pygame
+from src.engine.board import Board
 from src.engine.game_state import GameState
-from src.ui.renderer import Renderer
-from src.ui.input_handler import InputHandler
+from src.engine.instrumentation import Instrumentation
+from src.engine.randomizer import PieceGenerator
+from src.ui.input_pipeline import InputPipeline
+
+_IMPORTED = time.perf_counter()
+
+
+class StartupProfile:
+    """Wall-clock time spent in each phase of starting the game."""
+
+    def __init__(self, start: float):
+        """Start timing from ``start``, a ``time.perf_counter()`` reading."""
+        self.start = start
+        self.phases = []  # (name, milliseconds)
+        self._last = start
+
+    def lap(self, name, now=None):
+        """End the phase ``name`` at ``now`` (default: the current time)."""
+        now = time.perf_counter() if now is None else now
+        self.phases.append((name, (now - self._last) * 1000.0))
+        self._last = now
+
+    @property
+    def total_ms(self):
+        """Return the time from the start to the end of the last phase."""
+        return (self._last - self.start) * 1000.0
+
+    def report(self, background_ms=None):
+        """Return a printable table of the phases.
+
+        ``background_ms`` is the time spent loading fonts and caches off
+        the main thread, overlapping the phases; it is left out if None.
+        """
+        lines = ["Startup profile:"]
+        lines += [f"  {name:<24}{ms:9.1f} ms" for name, ms in self.phases]
+        lines.append(f"  {'total':<24}{self.total_ms:9.1f} ms")
+        if background_ms is not None:
+            lines.append(f"  fonts and caches (background): {background_ms:.1f} ms")
+        return "\n".join(lines)
 
 class TetrisGame:
-    """Main game class that coordinates all game components."""
-    
-    def __init__(self, window_size=(800, 600)):
-        """Initialize the game with its components."""
-        self.game_state = GameState()
-        self.renderer = Renderer(window_size)
-        self.input_handler = InputHandler()
-        self.clock = pygame.time.Clock()
-        self.last_drop_time = pygame.time.get_ticks()
+    """Main game class that coordinates all game components.
+
+    The simulation advances in fixed ticks of ``1 / tick_rate`` seconds,
+    independent of how often frames are rendered. Wall-clock time is
+    accumulated each frame and spent on as many whole ticks as it covers.
+    """
+
+    # Simulation ticks per second
+    TICK_RATE = 60
+
+    # Frame rate cap outside turbo mode
+    FRAME_RATE = 60
+
+    # Most ticks run in one frame before the simulation gives up catching up
+    MAX_FRAME_TICKS = 10
+
+    # Ticks run per loop iteration in turbo mode with rendering turned off
+    TURBO_BATCH = 64
+
+    # Seconds between input polls while waiting for the next frame
+    INPUT_POLL_INTERVAL = 0.001
+
+    BACKENDS = ('pygame', 'terminal')
+
+    def __init__(self, window_size=(800, 600), retained=False,
+                 instrumentation=None, show_stats=False, stats_path=None,
+                 tick_rate=TICK_RATE, turbo=False, render_every=1,
+                 max_ticks=None, seed=None, das_ms=167, arr_ms=33,
+                 board_size=(Board.WIDTH, Board.HEIGHT), startup_profile=None,
+                 backend='pygame'):
+        """Initialize the game with its components.
+
+        With ``retained`` the dirty-region renderer is used, which skips
+        unchanged frames and only presents the regions that changed.
+        Passing an ``Instrumentation`` times every frame and counts game
+        events; ``show_stats`` also draws them on screen, and ``stats_path``
+        names a JSON file they are written to on quit.
+
+        ``turbo`` runs ticks as fast as possible instead of in real time.
+        A frame is rendered every ``render_every`` ticks, or never when it
+        is 0. The game quits after ``max_ticks`` ticks when given, and a
+        ``seed`` makes the piece sequence reproducible. ``das_ms`` and
+        ``arr_ms`` set the delay and rate of auto-repeated shifts.
+        ``board_size`` is the (width, height) of the board in cells.
+
+        ``backend`` is 'pygame' for a window or 'terminal' to draw with
+        curses in the terminal, which never imports pygame. A pygame game
+        that never renders opens its window for input but loads nothing
+        to draw with.
+
+        Fonts and text caches load in the background while the first
+        frames are shown. A ``StartupProfile`` passed as
+        ``startup_profile`` times creating the game and the first frame,
+        and is printed once that frame is on screen.
+        """
+        if tick_rate <= 0:
+            raise ValueError("tick_rate must be positive")
+        if render_every < 0:
+            raise ValueError("render_every must be non-negative")
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        self.instrumentation = instrumentation
+        self.stats_path = stats_path
+        self.tick_rate = tick_rate
+        self.turbo = turbo
+        self.render_every = render_every
+        self.max_ticks = max_ticks
+        randomizer = PieceGenerator(seed) if seed is not None else None
+        self.game_state = GameState(board=Board(*board_size),
+                                    randomizer=randomizer,
+                                    instrumentation=instrumentation)
+        self.backend = backend
+        pipeline = InputPipeline(das_ms, arr_ms, instrumentation=instrumentation)
+        if backend == 'terminal':
+            from src.ui.terminal_input import TerminalInputHandler
+            from src.ui.terminal_renderer import TerminalRenderer
+            self.renderer = TerminalRenderer(board_size=board_size)
+            self.input_handler = TerminalInputHandler(self.renderer.window, pipeline)
+        else:
+            from src.ui.input_handler import InputHandler
+            if not render_every:
+                # Only the window, for input and quitting: no fonts or sprites
+                from src.ui.renderer import NullRenderer
+                self.renderer = NullRenderer(window_size)
+            else:
+                from src.ui.renderer import Renderer
+                from src.ui.retained_renderer import RetainedRenderer
+                renderer_class = RetainedRenderer if retained else Renderer
+                self.renderer = renderer_class(window_size, board_size, background_assets=True)
+            self.input_handler = InputHandler(pipeline)
+        if show_stats:
+            self.renderer.instrumentation = instrumentation
+        # Printed once the terminal is restored, when drawing to it
+        self._deferred_output = []
+        self.ticks = 0
+        self.gravity_ticks = 0
+        self._last_render_tick = None
+        self.startup_profile = startup_profile
+        self._first_frame_timed = False
+        if startup_profile is not None:
+            startup_profile.lap('create window and game')
+
+    def _report_startup(self, final=False):
+        """Time the first frame, then print the startup profile once.
+
+        Printing waits for the background font load so its time can be
+        reported too, unless ``final`` (the game is quitting).
+        """
+        profile = self.startup_profile
+        if self.render_every and not self._first_frame_timed:
+            profile.lap('first frame')
+            self._first_frame_timed = True
+        if final or self.renderer.assets_ready:
+            self.startup_profile = None
+            report = profile.report(self.renderer.assets_ms)
+            if self.backend == 'terminal':
+                self._deferred_output.append(report)
+            else:
+                print(report)
+
+    def update(self, tick_time):
+        """Advance the simulation by one fixed tick ending at ``tick_time``.
+
+        Inputs read before ``tick_time`` are applied first, in order.
+        """
+        self.ticks += 1
+        state = self.game_state
+        self.input_handler.pipeline.advance(state, tick_time)
+        if state.game_over or state.game_paused:
+            return
+        self.gravity_ticks += 1
+        if self.gravity_ticks >= state.get_drop_ticks(self.tick_rate):
+            state.drop_piece()
+            self.gravity_ticks = 0
+
+    def _ticks_due(self, accumulator):
+        """Return how many ticks to run this frame and the time left over."""
+        if self.turbo:
+            return self.render_every or self.TURBO_BATCH, 0.0
+        tick_seconds = 1.0 / self.tick_rate
+        ticks = int(accumulator / tick_seconds)
+        if ticks > self.MAX_FRAME_TICKS:
+            # Too far behind (e.g. the window was dragged): drop the backlog
+            return self.MAX_FRAME_TICKS, 0.0
+        return ticks, accumulator - ticks * tick_seconds
+
+    def _should_render(self):
+        """Return True if a frame should be rendered after this loop iteration."""
+        if not self.render_every:
+            return False
+        if self._last_render_tick is None:
+            return True
+        if not self.turbo and self.render_every == 1:
+            # Real time: show input applied between ticks straight away
+            return True
+        return self.ticks - self._last_render_tick >= self.render_every
+
+    def _wait_for_frame(self, frame_start):
+        """Sleep out the rest of the frame, polling input meanwhile.
+
+        Polling while waiting timestamps events close to when they
+        happened, rather than at the start of the next frame. Returns False
+        if the player quit.
+        """
+        deadline = frame_start + 1.0 / self.FRAME_RATE
+        while True:
+            if not self.input_handler.handle_input(self.game_state):
+                return False
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return True
+            time.sleep(min(remaining, self.INPUT_POLL_INTERVAL))
 
     def run(self):
         """Main game loop."""
+        stats = self.instrumentation
+        accumulator = 0.0
+        previous = time.perf_counter()
         try:
-            while True:
+            while self.max_ticks is None or self.ticks < self.max_ticks:
+                frame_start = time.perf_counter()
+                if stats is not None:
+                    stats.begin_frame()
+
                 # Handle input (returns False if game should quit)
                 if not self.input_handler.handle_input(self.game_state):
                     break
 
-                # Update game state
-                if not self.game_state.game_over and not self.game_state.game_paused:
-                    current_time = pygame.time.get_ticks()
-                    if current_time - self.last_drop_time > self.game_state.get_drop_delay():
-                        self.game_state.drop_piece()
-                        self.last_drop_time = current_time
+                if self.input_handler.resize_request:
+                    self.renderer.resize(self.input_handler.resize_request)
+                    self.input_handler.resize_request = None
+                    self._last_render_tick = None
+
+                if stats is not None:
+                    stats.lap('input')
+
+                # Run the simulation ticks that are due
+                now = time.perf_counter()
+                accumulator += now - previous
+                previous = now
+                ticks, accumulator = self._ticks_due(accumulator)
+                if self.max_ticks is not None:
+                    ticks = min(ticks, self.max_ticks - self.ticks)
+                # Each tick ends one tick length after the previous one, with
+                # the last ending where the leftover time begins
+                tick_seconds = 0.0 if self.turbo else 1.0 / self.tick_rate
+                end = now - accumulator
+                for i in range(ticks):
+                    self.update(end - (ticks - 1 - i) * tick_seconds)
 
-                    # Handle held keys for continuous movement
-                    held_keys = self.input_handler.get_held_keys()
-                    if held_keys['down']:
-                        self.game_state.score += 1  # Bonus point for soft drop
+                if stats is not None:
+                    stats.lap('update')
 
                 # Render current frame
-                self.renderer.render(self.game_state)
+                if self._should_render():
+                    self.renderer.render(self.game_state)
+                    self._last_render_tick = self.ticks
+                    self.input_handler.pipeline.presented(time.perf_counter())
+                if self.startup_profile is not None:
+                    self._report_startup()
+
+                if stats is not None:
+                    stats.lap('render')
+                    stats.end_frame()
 
                 # Maintain frame rate
-                self.clock.tick(60)
+                if not self.turbo and not self._wait_for_frame(frame_start):
+                    break
 
         except Exception as e:
             print(f"Error occurred: {e}")
@@ -54,17 +292,100 @@ class TetrisGame:
 
     def quit(self):
         """Clean up and quit the game."""
-        pygame.quit()
+        if self.instrumentation is not None and self.stats_path:
+            self.instrumentation.dump_json(self.stats_path)
+        if self.startup_profile is not None:
+            self._report_startup(final=True)
+        self.renderer.close()
+        for text in self._deferred_output:
+            print(text)
         sys.exit()
 
+def _board_size(text):
+    """Parse a WIDTHxHEIGHT board size argument."""
+    try:
+        width, height = (int(part) for part in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid board size: {text!r}") from None
+    return width, height
+
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Play Tetris.")
+    parser.add_argument('--backend', choices=TetrisGame.BACKENDS, default='pygame',
+                        help="draw in a window with pygame or in this terminal with curses "
+                             "(default: pygame)")
+    parser.add_argument('--retained', action='store_true',
+                        help="only redraw regions that changed (low-power displays)")
+    parser.add_argument('--stats', action='store_true',
+                        help="show frame timings and event counts on screen")
+    parser.add_argument('--stats-json', metavar='PATH',
+                        help="write frame timings and event counts to PATH on exit")
+    parser.add_argument('--stats-history', type=int, default=240, metavar='FRAMES',
+                        help="number of recent frames to keep stats for (default: 240)")
+    parser.add_argument('--tick-rate', type=int, default=TetrisGame.TICK_RATE,
+                        metavar='HZ',
+                        help=f"simulation ticks per second (default: {TetrisGame.TICK_RATE})")
+    parser.add_argument('--turbo', action='store_true',
+                        help="run the simulation as fast as possible")
+    parser.add_argument('--render-every', type=int, default=1, metavar='N',
+                        help="render a frame every N simulation ticks (default: 1)")
+    parser.add_argument('--no-render', action='store_true',
+                        help="never render frames")
+    parser.add_argument('--ticks', type=int, metavar='N',
+                        help="quit after N simulation ticks")
+    parser.add_argument('--seed', type=int,
+                        help="seed the piece sequence")
+    parser.add_argument('--das', type=float, default=167, metavar='MS',
+                        help="delay before a held shift repeats (default: 167)")
+    parser.add_argument('--arr', type=float, default=33, metavar='MS',
+                        help="interval between repeated shifts, 0 for instant (default: 33)")
+    parser.add_argument('--board-size', type=_board_size, default=(Board.WIDTH, Board.HEIGHT),
+                        metavar='WxH', help="board size in cells (default: 10x20)")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="print time spent in imports, init and the first frame")
+    return parser.parse_args(argv)
+
 def main():
     """Entry point of the game."""
+    args = parse_args()
+    profile = None
+    if args.profile_startup:
+        profile = StartupProfile(_START)
+        profile.lap('import game modules', _IMPORTED)
+    render_every = 0 if args.no_render else args.render_every
     try:
-        # Initialize pygame
-        pygame.init()
+        if args.backend == 'pygame':
+            import pygame
+            if profile is not None:
+                profile.lap('import pygame')
+            # Only the subsystems the game uses; audio and joysticks stay down,
+            # and fonts too when nothing is ever drawn
+            pygame.display.init()
+            if render_every:
+                pygame.font.init()
+            if profile is not None:
+                profile.lap('init display and font')
+        
+        instrumentation = None
+        if args.stats or args.stats_json:
+            instrumentation = Instrumentation(args.stats_history)
         
         # Create and run game
-        game = TetrisGame()
+        game = TetrisGame(retained=args.retained,
+                          instrumentation=instrumentation,
+                          show_stats=args.stats,
+                          stats_path=args.stats_json,
+                          tick_rate=args.tick_rate,
+                          turbo=args.turbo,
+                          render_every=render_every,
+                          max_ticks=args.ticks,
+                          seed=args.seed,
+                          das_ms=args.das,
+                          arr_ms=args.arr,
+                          board_size=args.board_size,
+                          startup_profile=profile,
+                          backend=args.backend)
         game.run()
     except Exception as e:
         print(f"Failed to start game: {e}")
@@ -0,0 +1,9 @@
+"""
+Rollback netcode for deterministic head-to-head matches.
+"""
+
+from .rollback import DesyncError, RollbackSession, predict_idle, predict_repeat
+from .versus import MatchSnapshot, VersusMatch
+
+__all__ = ['DesyncError', 'RollbackSession', 'predict_idle', 'predict_repeat',
+           'MatchSnapshot', 'VersusMatch']
@@ -0,0 +1,210 @@
+from typing import Callable, Dict, Optional
+from src.engine.headless import HeadlessGame
+from src.engine.snapshot import SnapshotRing
+from .versus import VersusMatch, match_checksum
+
+# Guesses a remote player's input from their last confirmed one
+Predictor = Callable[[str], str]
+
+
+def predict_idle(last_input: str) -> str:
+    """Predict no input.
+
+    Actions are discrete presses and most ticks carry none, so idling is
+    the guess that is most often right.
+    """
+    return 'noop'
+
+
+def predict_repeat(last_input: str) -> str:
+    """Predict the last confirmed input again, as for held buttons."""
+    return last_input
+
+
+class DesyncError(RuntimeError):
+    """Raised when a peer's checksum for a confirmed tick differs from ours."""
+
+    def __init__(self, tick: int, local: int, remote: int):
+        super().__init__(f"Desync at tick {tick}: "
+                         f"local checksum {local:016x}, remote {remote:016x}")
+        self.tick = tick
+        self.local = local
+        self.remote = remote
+
+
+class RollbackSession:
+    """One peer's view of a versus match played over a laggy link.
+
+    Each tick runs immediately with the local input and a prediction of
+    the remote one. When the remote player's real input for a tick
+    arrives and differs from what was predicted, the match is restored
+    to its snapshot from before that tick and re-simulated up to the
+    present on the next ``advance``. Prediction is bounded: the session
+    stalls rather than run more than ``max_rollback`` ticks past the last
+    confirmed remote input, which bounds the work of one rollback.
+
+    The session does no I/O. The caller sends each local input (with its
+    tick) and the checksums of confirmed ticks to the peer, and feeds
+    what it receives to ``add_remote_input`` and ``add_remote_checksum``.
+    """
+
+    def __init__(self, match: VersusMatch, local_player: int,
+                 max_rollback: int = 8, predict: Predictor = predict_idle,
+                 checksum_history: int = 256):
+        """Run ``match`` as ``local_player`` (0 or 1)."""
+        if local_player not in (0, 1):
+            raise ValueError("local_player must be 0 or 1")
+        if max_rollback <= 0:
+            raise ValueError("max_rollback must be positive")
+        self.match = match
+        self.local_player = local_player
+        self.remote_player = 1 - local_player
+        self.max_rollback = max_rollback
+        self.predict = predict
+        self.checksum_history = checksum_history
+        # Snapshots taken before each of the last ticks, oldest first to go
+        self.snapshots = SnapshotRing(max_rollback + 1)
+        # Last tick up to which every remote input is known
+        self.confirmed_tick = match.tick - 1
+        self.rollbacks = 0
+        self.resimulated_ticks = 0
+        self._local_inputs: Dict[int, str] = {}
+        self._remote_inputs: Dict[int, str] = {}
+        self._predicted: Dict[int, str] = {}  # Remote inputs guessed per tick
+        self._checksums: Dict[int, int] = {}
+        self._remote_checksums: Dict[int, int] = {}
+        self._last_remote = 'noop'
+        self._rollback_from: Optional[int] = None
+        self._pruned_tick = self.confirmed_tick
+        self._checksummed = self.confirmed_tick
+
+    @property
+    def tick(self) -> int:
+        """Return the next tick to simulate."""
+        return self.match.tick
+
+    @staticmethod
+    def _check_action(action: str) -> None:
+        if action not in HeadlessGame.ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+
+    def add_local_input(self, action: str) -> int:
+        """Set the local input of the next tick and return that tick."""
+        self._check_action(action)
+        self._local_inputs[self.tick] = action
+        return self.tick
+
+    def add_remote_input(self, tick: int, action: str) -> None:
+        """Record the remote player's real input for ``tick``.
+
+        Duplicates and inputs for ticks already confirmed are ignored, so
+        the peer may resend inputs until they are acknowledged.
+        """
+        self._check_action(action)
+        if tick <= self.confirmed_tick or tick in self._remote_inputs:
+            return
+        self._remote_inputs[tick] = action
+        predicted = self._predicted.pop(tick, None)
+        if predicted is not None and predicted != action:
+            if self._rollback_from is None or tick < self._rollback_from:
+                self._rollback_from = tick
+
+        while self.confirmed_tick + 1 in self._remote_inputs:
+            self.confirmed_tick += 1
+            self._last_remote = self._remote_inputs[self.confirmed_tick]
+
+    def advance(self) -> bool:
+        """Resolve pending rollbacks, then simulate the next tick.
+
+        Returns False, simulating nothing new, while the session is a full
+        ``max_rollback`` ticks ahead of the remote player's inputs.
+        """
+        self.synchronize()
+        if self.tick - self.confirmed_tick > self.max_rollback:
+            return False
+        self._simulate(self.tick)
+        self._record_checksums()
+        self._prune()
+        return True
+
+    def synchronize(self) -> None:
+        """Re-simulate from the first mispredicted tick, if any, and check checksums."""
+        if self._rollback_from is not None:
+            self._rollback()
+        self._record_checksums()
+        self._verify_checksums()
+
+    def _rollback(self) -> None:
+        """Restore the match to before the first mispredicted tick and replay."""
+        start, end = self._rollback_from, self.tick
+        self._rollback_from = None
+        self.match.restore(self.snapshots.get(start))
+        for tick in range(start, end):
+            self._simulate(tick)
+        self.rollbacks += 1
+        self.resimulated_ticks += end - start
+
+    def _simulate(self, tick: int) -> None:
+        """Snapshot the match, then step it through ``tick``."""
+        self.snapshots.push(tick, self.match.snapshot())
+        remote = self._remote_inputs.get(tick)
+        if remote is None:
+            remote = self._predicted[tick] = self.predict(self._last_remote)
+        local = self._local_inputs.get(tick, 'noop')
+        if self.local_player == 0:
+            self.match.step((local, remote))
+        else:
+            self.match.step((remote, local))
+
+    def _record_checksums(self) -> None:
+        """Checksum every tick that has become final since the last call.
+
+        Only final ticks are checksummed, once each, so re-simulation does
+        not pay for it. The state after a tick is the snapshot taken
+        before the next one, or the live match for the latest tick.
+        """
+        final = min(self.confirmed_tick, self.tick - 1)
+        for tick in range(self._checksummed + 1, final + 1):
+            snapshot = (self.snapshots.get(tick + 1) if tick + 1 < self.tick
+                        else self.match.snapshot())
+            self._checksums[tick] = match_checksum(snapshot)
+        self._checksummed = max(self._checksummed, final)
+
+    def _prune(self) -> None:
+        """Forget inputs no rollback can reach and checksums past the history."""
+        # Inputs may arrive ahead of the simulation; keep those
+        reached = min(self.confirmed_tick, self.tick - 1)
+        for tick in range(self._pruned_tick + 1, reached + 1):
+            self._local_inputs.pop(tick, None)
+            self._remote_inputs.pop(tick, None)
+        self._pruned_tick = max(self._pruned_tick, reached)
+        self._checksums.pop(self.tick - 1 - self.checksum_history, None)
+
+    def checksum(self, tick: int) -> Optional[int]:
+        """Return the checksum after ``tick`` once every input up to it is known.
+
+        Only these are final and worth sending to the peer; None is
+        returned for ticks still resting on predictions or long forgotten.
+        Checksums are recorded by ``advance`` and ``synchronize``.
+        """
+        return self._checksums.get(tick)
+
+    def add_remote_checksum(self, tick: int, checksum: int) -> None:
+        """Record the peer's checksum for ``tick`` and compare it when final.
+
+        Raises ``DesyncError`` as soon as a confirmed tick's checksums differ.
+        """
+        self._remote_checksums[tick] = checksum
+        self._verify_checksums()
+
+    def _verify_checksums(self) -> None:
+        """Compare the peer's checksums with ours for every final tick."""
+        if not self._remote_checksums:
+            return
+        for tick in [tick for tick in self._remote_checksums
+                     if self.checksum(tick) is not None
+                     or tick < self.tick - self.checksum_history]:
+            remote = self._remote_checksums.pop(tick)
+            local = self.checksum(tick)
+            if local is not None and local != remote:
+                raise DesyncError(tick, local, remote)
@@ -0,0 +1,110 @@
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+from src.engine.bitboard import BitBoard
+from src.engine.board import Board
+from src.engine.game_state import GameState
+from src.engine.randomizer import PieceGenerator
+from src.engine.snapshot import GameSnapshot
+from src.engine.tetromino import Tetromino
+from src.engine.zobrist import MASK64, splitmix64
+
+# Stable small integers for shape names, which ``hash`` would not give
+_SHAPE_CODES = {name: code for code, name in enumerate(Tetromino.SHAPES, 1)}
+_SHAPE_CODES[None] = 0
+_FNV_PRIME = 0x100000001B3
+
+
+class MatchSnapshot(NamedTuple):
+    """Everything needed to put a ``VersusMatch`` back exactly as it was."""
+    tick: int
+    games: Tuple[GameSnapshot, ...]
+    gravity: Tuple[int, ...]
+
+
+def match_checksum(snapshot: MatchSnapshot) -> int:
+    """Return a 64-bit checksum of a match snapshot.
+
+    Mixes the tick, each board's Zobrist hash, the pieces, counters and
+    gravity with fixed functions only, so the checksum is identical on
+    every machine and can be compared between peers to detect desyncs.
+    """
+    value = snapshot.tick
+    for game, gravity in zip(snapshot.games, snapshot.gravity):
+        value = splitmix64(value ^ game.board.hash)
+        for part in (_SHAPE_CODES[game.piece], game.rotation, game.x, game.y,
+                     _SHAPE_CODES[game.next_piece], game.score, game.level,
+                     game.lines_cleared, game.pieces_placed, game.game_over,
+                     gravity):
+            value = (value * _FNV_PRIME ^ part) & MASK64
+    return splitmix64(value)
+
+
+class VersusMatch:
+    """Two games played side by side, stepped one fixed tick at a time.
+
+    Both players get the same piece sequence from ``seed``. A tick applies
+    at most one action per player, then that player's gravity, counted in
+    ticks as in the real-time game loop. Nothing else feeds the match, so
+    the same seed and inputs always give the same states and checksums.
+    """
+
+    PLAYERS = 2
+
+    def __init__(self, seed: int, tick_rate: int = 60, piece_policy: str = 'bag',
+                 board_factory: Callable[[], Board] = BitBoard):
+        """Start a match with both games drawing pieces from ``seed``."""
+        if tick_rate <= 0:
+            raise ValueError("tick_rate must be positive")
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.games = [GameState(board=board_factory(),
+                                randomizer=PieceGenerator(seed, piece_policy))
+                      for _ in range(self.PLAYERS)]
+        self.gravity: List[int] = [0] * self.PLAYERS
+        self.tick = 0
+
+    def step(self, inputs: Sequence[str]) -> None:
+        """Advance one tick with one action name per player ('noop' for none)."""
+        for player, game in enumerate(self.games):
+            if game.game_over:
+                continue
+            action = inputs[player]
+            if action == 'soft_drop':
+                game.soft_drop()
+            elif action != 'noop':
+                game.apply_action(action)
+            if game.game_over:
+                continue
+            self.gravity[player] += 1
+            if self.gravity[player] >= game.get_drop_ticks(self.tick_rate):
+                self.gravity[player] = 0
+                game.drop_piece()
+        self.tick += 1
+
+    @property
+    def game_over(self) -> bool:
+        """Return True once either player's game has ended."""
+        return any(game.game_over for game in self.games)
+
+    @property
+    def winner(self) -> Optional[int]:
+        """Return the player still standing once the other has topped out."""
+        standing = [player for player, game in enumerate(self.games)
+                    if not game.game_over]
+        return standing[0] if len(standing) == 1 else None
+
+    def checksum(self) -> int:
+        """Return the checksum of the current state; see ``match_checksum``."""
+        return match_checksum(self.snapshot())
+
+    def snapshot(self) -> MatchSnapshot:
+        """Return an immutable snapshot of the match."""
+        return MatchSnapshot(self.tick,
+                             tuple(game.snapshot() for game in self.games),
+                             tuple(self.gravity))
+
+    def restore(self, snapshot: MatchSnapshot) -> None:
+        """Put the match back exactly as it was when ``snapshot`` was taken."""
+        self.tick = snapshot.tick
+        for game, game_snapshot in zip(self.games, snapshot.games):
+            game.restore(game_snapshot)
+        self.gravity[:] = snapshot.gravity
@@ -0,0 +1,9 @@
+"""
+Asyncio game server hosting many sessions over TCP or Unix sockets.
+"""
+
+from .client import GameClient
+from .server import GameServer
+from .timer_wheel import TimerWheel
+
+__all__ = ['GameClient', 'GameServer', 'TimerWheel']
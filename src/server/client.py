@@ -0,0 +1,123 @@
+"""
+Local client stand-in for the game server.
+
+``GameClient`` speaks the server protocol over TCP or a Unix socket and
+keeps the latest state it was sent. Run as a script, it joins a game and
+plays random actions, printing the final score.
+
+Run from the project root:
+    python -m src.server.client --port 7777 --actions 500
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from typing import Optional
+
+from src.engine.headless import HeadlessGame
+from .protocol import LineDecoder, Message, encode
+
+
+class GameClient:
+    """Connection to a game server and the latest state it reported."""
+
+    def __init__(self):
+        """Create an unconnected client."""
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.session: Optional[int] = None
+        self.state: Optional[Message] = None
+        self.grid: Optional[str] = None
+        self.seq = 0
+        self._decoder = LineDecoder(max_line=1 << 20)
+
+    async def connect(self, host: str = '127.0.0.1', port: int = 7777,
+                      path: Optional[str] = None) -> None:
+        """Connect over TCP, or to the Unix socket at ``path`` if given."""
+        if path:
+            self.reader, self.writer = await asyncio.open_unix_connection(path)
+        else:
+            self.reader, self.writer = await asyncio.open_connection(host, port)
+
+    async def receive(self) -> Message:
+        """Wait for the next message, tracking the session and latest state."""
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                raise ConnectionError("Server closed the connection")
+            for message in self._decoder.feed(line):
+                kind = message.get('type')
+                if kind == 'joined':
+                    self.session = message['session']
+                elif kind == 'state':
+                    if 'grid' in message:
+                        self.grid = message['grid']
+                    self.state = message
+                elif kind == 'error':
+                    raise RuntimeError(message.get('message'))
+                return message
+
+    async def join(self, seed: Optional[int] = None) -> int:
+        """Start a game and return the session id."""
+        self.writer.write(encode({'type': 'join', 'seed': seed}))
+        while True:
+            message = await self.receive()
+            if message.get('type') == 'joined':
+                return message['session']
+
+    def send_action(self, action: str) -> int:
+        """Send an action and return its sequence number."""
+        self.seq += 1
+        self.writer.write(encode({'type': 'action', 'action': action, 'seq': self.seq}))
+        return self.seq
+
+    async def wait_for_ack(self, seq: int) -> Message:
+        """Wait for a state that reflects action ``seq``."""
+        while self.state is None or self.state['ack'] < seq:
+            await self.receive()
+        return self.state
+
+    async def close(self) -> None:
+        """Leave the game and close the connection."""
+        if self.writer is not None:
+            if not self.writer.is_closing():
+                self.writer.write(encode({'type': 'leave'}))
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def play(args: argparse.Namespace) -> Message:
+    """Join a game and play random actions, waiting for each to apply."""
+    client = GameClient()
+    await client.connect(args.host, args.port, args.unix)
+    await client.join(args.seed)
+    rng = random.Random(args.seed)
+    try:
+        for _ in range(args.actions):
+            state = await client.wait_for_ack(client.send_action(
+                rng.choice(HeadlessGame.ACTIONS[1:])))
+            if state['game_over']:
+                break
+        return client.state
+    finally:
+        await client.close()
+
+
+def main():
+    """Command-line entry point; prints the final state as JSON."""
+    parser = argparse.ArgumentParser(description="Play random actions against a game server.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7777)
+    parser.add_argument('--unix', metavar='PATH')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--actions', type=int, default=200)
+    args = parser.parse_args()
+    state = asyncio.run(play(args))
+    print(json.dumps({key: value for key, value in state.items() if key != 'grid'}))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Load generator for the game server.
+
+Opens many client connections from one process, has each send random
+actions at a fixed rate, and reports how many updates arrived and how
+long actions took to be acknowledged. With ``--serve`` it also hosts the
+server in the same event loop, for quick local runs.
+
+Run from the project root:
+    python -m src.server.loadgen --serve --clients 1000 --duration 10
+    python -m src.server.loadgen --port 7777 --clients 200 --rate 10
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from src.engine.headless import HeadlessGame
+from .client import GameClient
+from .server import GameServer
+
+
+class LoadResult(NamedTuple):
+    """Totals of one load-generation run."""
+    clients: int
+    actions: int
+    updates: int
+    errors: int
+    duration: float  # seconds
+    ack_p50_ms: float
+    ack_p99_ms: float
+    ack_max_ms: float
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Return the value at ``fraction`` through the sorted values."""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+async def _run_client(index: int, args: argparse.Namespace, deadline: float,
+                      connecting: asyncio.Semaphore, latencies: List[float],
+                      totals: Dict[str, int]) -> None:
+    """Connect one client and send actions until the deadline."""
+    client = GameClient()
+    try:
+        # Connect in waves so bursts stay within the server's listen backlog
+        async with connecting:
+            await client.connect(args.host, args.port, args.unix)
+            await client.join(args.seed + index)
+    except (OSError, ConnectionError):
+        totals['errors'] += 1
+        return
+
+    sent: Dict[int, float] = {}
+
+    async def read_updates():
+        while True:
+            message = await client.receive()
+            if message.get('type') != 'state':
+                continue
+            totals['updates'] += 1
+            now = time.perf_counter()
+            for seq in [seq for seq in sent if seq <= message['ack']]:
+                latencies.append((now - sent.pop(seq)) * 1000.0)
+            if message['game_over']:
+                await client.join(args.seed + index)
+
+    reader = asyncio.get_running_loop().create_task(read_updates())
+    rng = random.Random(args.seed + index)
+    interval = 1.0 / args.rate
+    # Spread clients out so they do not all send on the same instant
+    await asyncio.sleep(rng.random() * interval)
+    try:
+        while time.perf_counter() < deadline and not reader.done():
+            sent[client.send_action(rng.choice(HeadlessGame.ACTIONS[1:]))] = time.perf_counter()
+            totals['actions'] += 1
+            await asyncio.sleep(interval)
+    except (OSError, ConnectionError):
+        totals['errors'] += 1
+    finally:
+        reader.cancel()
+        try:
+            await reader
+        except (asyncio.CancelledError, OSError, ConnectionError, RuntimeError):
+            pass
+        try:
+            await client.close()
+        except OSError:
+            pass
+
+
+async def generate_load(args: argparse.Namespace) -> LoadResult:
+    """Run the clients described by ``args`` and return the totals."""
+    server: Optional[GameServer] = None
+    server_task = None
+    if args.serve:
+        server = GameServer(tick_rate=args.tick_rate)
+        if args.unix:
+            await server.start_unix(args.unix)
+        else:
+            await server.start_tcp(args.host, args.port)
+        server_task = asyncio.get_running_loop().create_task(server.run())
+
+    latencies: List[float] = []
+    totals = {'actions': 0, 'updates': 0, 'errors': 0}
+    start = time.perf_counter()
+    deadline = start + args.duration
+    connecting = asyncio.Semaphore(args.connect_burst)
+    await asyncio.gather(*(_run_client(i, args, deadline, connecting, latencies, totals)
+                           for i in range(args.clients)))
+    duration = time.perf_counter() - start
+
+    if server is not None:
+        server.stop()
+        await server_task
+    return LoadResult(args.clients, totals['actions'], totals['updates'],
+                      totals['errors'], duration, _percentile(latencies, 0.5),
+                      _percentile(latencies, 0.99), max(latencies, default=0.0))
+
+
+def main():
+    """Command-line entry point; prints the totals as JSON."""
+    parser = argparse.ArgumentParser(description="Generate client load on a game server.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7777)
+    parser.add_argument('--unix', metavar='PATH')
+    parser.add_argument('--serve', action='store_true',
+                        help="host the server in this process too")
+    parser.add_argument('--tick-rate', type=int, default=60)
+    parser.add_argument('--clients', type=int, default=100)
+    parser.add_argument('--rate', type=float, default=5.0,
+                        help="actions per second per client (default: 5)")
+    parser.add_argument('--duration', type=float, default=10.0, help="seconds")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--connect-burst', type=int, default=64,
+                        help="most connection attempts in flight at once (default: 64)")
+    args = parser.parse_args()
+    result = asyncio.run(generate_load(args))
+    print(json.dumps(result._asdict()))
+
+if __name__ == "__main__":
+    main()
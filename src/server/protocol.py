@@ -0,0 +1,93 @@
+"""
+Wire protocol of the game server: newline-delimited JSON messages.
+
+Client to server:
+    {"type": "join", "seed": 7}            start (or restart) a game
+    {"type": "action", "action": "move_left", "seq": 12}
+    {"type": "leave"}
+
+Server to client:
+    {"type": "joined", "session": 3}
+    {"type": "state", "tick": 120, "ack": 12, "score": 0, ...}
+    {"type": "error", "message": "..."}
+
+State messages carry the colour grid (one digit per cell, row by row) only
+when the board changed since the last state sent to that client.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+from src.engine.game_state import GameState
+
+Message = Dict[str, Any]
+
+# Longest line accepted from a client, in bytes
+MAX_LINE = 4096
+
+
+class ProtocolError(ValueError):
+    """Raised for malformed or oversized client messages."""
+
+
+def encode(message: Message) -> bytes:
+    """Encode one message as a line of JSON."""
+    return json.dumps(message, separators=(',', ':')).encode() + b'\n'
+
+
+class LineDecoder:
+    """Splits a byte stream into decoded JSON messages."""
+
+    def __init__(self, max_line: int = MAX_LINE):
+        """Create a decoder rejecting lines longer than ``max_line`` bytes."""
+        self.max_line = max_line
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[Message]:
+        """Add received bytes and return every complete message."""
+        self._buffer += data
+        messages = []
+        while True:
+            end = self._buffer.find(b'\n')
+            if end < 0:
+                break
+            line = bytes(self._buffer[:end])
+            del self._buffer[:end + 1]
+            if line.strip():
+                try:
+                    message = json.loads(line)
+                except ValueError as e:
+                    raise ProtocolError(f"Malformed message: {e}") from None
+                if not isinstance(message, dict):
+                    raise ProtocolError("Messages must be JSON objects")
+                messages.append(message)
+        if len(self._buffer) > self.max_line:
+            raise ProtocolError("Message too long")
+        return messages
+
+
+def encode_grid(game_state: GameState) -> str:
+    """Return the colour grid as one digit per cell, row by row."""
+    return ''.join(''.join(map(str, row)) for row in game_state.board.grid)
+
+
+def state_message(game_state: GameState, tick: int, ack: int,
+                  grid: Optional[str] = None) -> Message:
+    """Build a state update, with the grid if it is given."""
+    piece, next_piece = game_state.current_piece, game_state.next_piece
+    message = {
+        'type': 'state',
+        'tick': tick,
+        'ack': ack,
+        'score': game_state.score,
+        'level': game_state.level,
+        'lines': game_state.lines_cleared,
+        'piece': piece.shape_name if piece else None,
+        'rotation': piece.rotation if piece else 0,
+        'x': game_state.piece_position['x'],
+        'y': game_state.piece_position['y'],
+        'next': next_piece.shape_name if next_piece else None,
+        'game_over': game_state.game_over,
+    }
+    if grid is not None:
+        message['grid'] = grid
+    return message
@@ -0,0 +1,376 @@
+"""
+Asyncio server hosting many game sessions in one process.
+
+One tick loop drives every session: each tick it applies the actions
+queued since the last tick (at most ``actions_per_tick`` per session),
+fires gravity for the sessions due on a shared timer wheel, and sends
+one state update to each session that changed. Connections are plain
+``asyncio.Protocol`` objects, so an idle session costs no task at all.
+
+Backpressure works both ways. A client that sends actions faster than
+they are applied has its socket reads paused until its queue drains. A
+client that reads slowly stops receiving updates while its write buffer
+is full; only its latest state is sent once it catches up, and it is
+disconnected if it stays blocked for ``slow_client_timeout`` seconds.
+
+Run from the project root:
+    python -m src.server.server --port 7777
+    python -m src.server.server --unix /tmp/tetris.sock
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Set, Tuple
+
+from src.engine.game_state import GameState
+from src.engine.headless import HeadlessGame
+from src.engine.randomizer import PieceGenerator
+from .protocol import LineDecoder, Message, ProtocolError, encode, encode_grid, state_message
+from .timer_wheel import TimerWheel
+
+# Actions a client may send: the headless action space plus pausing
+ACTIONS = frozenset(HeadlessGame.ACTIONS) | {'pause'}
+
+
+class Session:
+    """One client connection and the game it plays."""
+
+    __slots__ = ('id', 'protocol', 'game_state', 'pending', 'ack', 'seq', 'sent_board',
+                 'writable', 'blocked_since', 'gravity_token', 'closed')
+
+    def __init__(self, session_id: int, protocol: 'SessionProtocol'):
+        """Create a session with no game yet."""
+        self.id = session_id
+        self.protocol = protocol
+        self.game_state: Optional[GameState] = None
+        self.pending: Deque[Message] = deque()
+        self.ack = 0
+        self.seq = 0  # Highest action sequence number accepted
+        self.sent_board: Optional[int] = None  # Board hash last sent
+        self.writable = True
+        self.blocked_since = 0.0
+        self.gravity_token = 0
+        self.closed = False
+
+
+class SessionProtocol(asyncio.Protocol):
+    """Connection callbacks feeding one session."""
+
+    def __init__(self, server: 'GameServer'):
+        """Create the protocol for a new connection to ``server``."""
+        self.server = server
+        self.decoder = LineDecoder()
+        self.transport: Optional[asyncio.Transport] = None
+        self.session: Optional[Session] = None
+        self.reading = True
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+        transport.set_write_buffer_limits(high=self.server.write_buffer_limit)
+        self.session = self.server.open_session(self)
+
+    def data_received(self, data: bytes) -> None:
+        try:
+            messages = self.decoder.feed(data)
+        except ProtocolError as e:
+            self.send({'type': 'error', 'message': str(e)})
+            self.transport.close()
+            return
+        for message in messages:
+            self.server.handle_message(self.session, message)
+
+    def pause_writing(self) -> None:
+        self.session.writable = False
+        self.session.blocked_since = time.monotonic()
+
+    def resume_writing(self) -> None:
+        self.session.writable = True
+        self.server.mark_dirty(self.session)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.server.close_session(self.session)
+
+    def send(self, message: Message) -> None:
+        """Write a message unless the connection is closing."""
+        if not self.transport.is_closing():
+            self.transport.write(encode(message))
+
+    def pause_reading(self) -> None:
+        """Stop reading from the socket until the action queue drains."""
+        if self.reading:
+            self.reading = False
+            self.transport.pause_reading()
+
+    def resume_reading(self) -> None:
+        """Start reading from the socket again."""
+        if not self.reading and not self.transport.is_closing():
+            self.reading = True
+            self.transport.resume_reading()
+
+
+class GameServer:
+    """Hosts game sessions and advances them all from one tick loop."""
+
+    def __init__(self, tick_rate: int = 60, wheel_size: int = 512,
+                 actions_per_tick: int = 8, max_pending: int = 64,
+                 write_buffer_limit: int = 64 * 1024,
+                 slow_client_timeout: float = 5.0, backlog: int = 1024):
+        """Configure the tick rate, batching and backpressure limits.
+
+        ``backlog`` is the listen queue length; bursts of connections
+        beyond it are refused by the operating system.
+        """
+        if tick_rate <= 0:
+            raise ValueError("tick_rate must be positive")
+        self.tick_rate = tick_rate
+        self.actions_per_tick = actions_per_tick
+        self.max_pending = max_pending
+        self.write_buffer_limit = write_buffer_limit
+        self.slow_client_timeout = slow_client_timeout
+        self.backlog = backlog
+        self.wheel: TimerWheel[Tuple[Session, int]] = TimerWheel(wheel_size)
+        self.sessions: Dict[int, Session] = {}
+        self.tick_count = 0
+        self.stats = {'messages_in': 0, 'messages_out': 0, 'evicted': 0,
+                      'tick_max_ms': 0.0, 'tick_total_ms': 0.0}
+        self._next_id = 1
+        self._queued: Set[Session] = set()
+        self._dirty: Set[Session] = set()
+        self._servers: list = []
+        self._running = False
+
+    # Connections
+
+    async def start_tcp(self, host: str = '127.0.0.1', port: int = 7777) -> asyncio.AbstractServer:
+        """Listen for clients on a TCP port."""
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(lambda: SessionProtocol(self), host, port,
+                                          backlog=self.backlog)
+        self._servers.append(server)
+        return server
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """Listen for clients on a Unix domain socket."""
+        loop = asyncio.get_running_loop()
+        server = await loop.create_unix_server(lambda: SessionProtocol(self), path,
+                                               backlog=self.backlog)
+        self._servers.append(server)
+        return server
+
+    def open_session(self, protocol: SessionProtocol) -> Session:
+        """Register a new connection."""
+        session = Session(self._next_id, protocol)
+        self._next_id += 1
+        self.sessions[session.id] = session
+        return session
+
+    def close_session(self, session: Session) -> None:
+        """Forget a closed connection; its gravity timer lapses on its own."""
+        session.closed = True
+        self.sessions.pop(session.id, None)
+        self._queued.discard(session)
+        self._dirty.discard(session)
+
+    def mark_dirty(self, session: Session) -> None:
+        """Send the session's state at the end of this tick."""
+        if session.game_state is not None:
+            self._dirty.add(session)
+
+    # Messages
+
+    def handle_message(self, session: Session, message: Message) -> None:
+        """Act on one message from a client."""
+        self.stats['messages_in'] += 1
+        kind = message.get('type')
+        if kind == 'action':
+            if message.get('action') not in ACTIONS:
+                session.protocol.send({'type': 'error', 'message': 'Unknown action'})
+                return
+            if 'seq' in message:
+                seq = message['seq']
+                if (not isinstance(seq, int) or isinstance(seq, bool)
+                        or seq < session.seq):
+                    session.protocol.send({'type': 'error', 'message':
+                                           'Sequence number must be an integer '
+                                           'no lower than the last one sent'})
+                    return
+                session.seq = seq
+            session.pending.append(message)
+            self._queued.add(session)
+            if len(session.pending) >= self.max_pending:
+                session.protocol.pause_reading()
+        elif kind == 'join':
+            seed = message.get('seed')
+            # JSON booleans decode as bool, which is an int subclass
+            if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+                session.protocol.send({'type': 'error', 'message': 'Seed must be an integer'})
+                return
+            self._join(session, seed)
+        elif kind == 'leave':
+            session.protocol.transport.close()
+        else:
+            session.protocol.send({'type': 'error', 'message': f'Unknown message type: {kind}'})
+
+    def _join(self, session: Session, seed: Optional[int]) -> None:
+        """Start a new game for the session."""
+        session.game_state = GameState(randomizer=PieceGenerator(seed))
+        session.pending.clear()
+        session.sent_board = None
+        # Invalidate any gravity timer left from a previous game
+        session.gravity_token += 1
+        self._schedule_gravity(session)
+        session.protocol.send({'type': 'joined', 'session': session.id})
+        self.mark_dirty(session)
+
+    def _schedule_gravity(self, session: Session) -> None:
+        """Put the session's next gravity drop on the timer wheel."""
+        delay = session.game_state.get_drop_ticks(self.tick_rate)
+        self.wheel.schedule(delay, (session, session.gravity_token))
+
+    # Ticks
+
+    def tick(self) -> None:
+        """Advance every session by one tick and send the updates."""
+        start = time.perf_counter()
+        self.tick_count += 1
+
+        # Apply queued actions, a bounded batch per session
+        drained = []
+        for session in self._queued:
+            pending, game_state = session.pending, session.game_state
+            for _ in range(min(self.actions_per_tick, len(pending))):
+                message = pending.popleft()
+                session.ack = message.get('seq', session.ack)
+                if game_state is None:
+                    continue
+                action = message['action']
+                if action == 'pause':
+                    game_state.toggle_pause()
+                elif action == 'soft_drop':
+                    game_state.soft_drop()
+                else:
+                    game_state.apply_action(action)
+            self.mark_dirty(session)
+            if len(pending) < self.max_pending // 2:
+                session.protocol.resume_reading()
+            if not pending:
+                drained.append(session)
+        self._queued.difference_update(drained)
+
+        # Gravity for the sessions due this tick
+        for session, token in self.wheel.advance():
+            if session.closed or token != session.gravity_token:
+                continue
+            game_state = session.game_state
+            if not game_state.game_over:
+                if not game_state.game_paused:
+                    game_state.drop_piece()
+                    self.mark_dirty(session)
+                self._schedule_gravity(session)
+
+        self._flush()
+
+        elapsed = (time.perf_counter() - start) * 1000.0
+        self.stats['tick_total_ms'] += elapsed
+        self.stats['tick_max_ms'] = max(self.stats['tick_max_ms'], elapsed)
+
+    def _flush(self) -> None:
+        """Send one state update to every changed session that can take it."""
+        now = time.monotonic()
+        blocked = []
+        for session in self._dirty:
+            if not session.writable:
+                # Keep only the latest state; evict clients stuck too long
+                if now - session.blocked_since > self.slow_client_timeout:
+                    self.stats['evicted'] += 1
+                    session.protocol.transport.abort()
+                else:
+                    blocked.append(session)
+                continue
+            game_state = session.game_state
+            board_hash = game_state.board.hash
+            grid = None
+            if board_hash != session.sent_board:
+                grid = encode_grid(game_state)
+                session.sent_board = board_hash
+            session.protocol.send(state_message(game_state, self.tick_count,
+                                                session.ack, grid))
+            self.stats['messages_out'] += 1
+        self._dirty = set(blocked)
+
+    async def run(self) -> None:
+        """Run the tick loop at a fixed rate until ``stop`` is called."""
+        loop = asyncio.get_running_loop()
+        period = 1.0 / self.tick_rate
+        next_time = loop.time()
+        self._running = True
+        while self._running:
+            self.tick()
+            next_time += period
+            delay = next_time - loop.time()
+            if delay < -period * 10:
+                # Far behind: skip the missed ticks rather than burst through them
+                next_time = loop.time()
+                delay = 0.0
+            await asyncio.sleep(max(0.0, delay))
+
+    def stop(self) -> None:
+        """Stop the tick loop and close the listening sockets."""
+        self._running = False
+        for server in self._servers:
+            server.close()
+        for session in list(self.sessions.values()):
+            session.protocol.transport.close()
+
+
+async def _report(server: GameServer, interval: float) -> None:
+    """Print server load figures every ``interval`` seconds."""
+    last_ticks, last_out = server.tick_count, server.stats['messages_out']
+    last_total = server.stats['tick_total_ms']
+    while True:
+        await asyncio.sleep(interval)
+        stats = server.stats
+        ticks = server.tick_count - last_ticks
+        mean = (stats['tick_total_ms'] - last_total) / ticks if ticks else 0.0
+        sys.stderr.write(
+            f"sessions {len(server.sessions)}  ticks/s {ticks / interval:.1f}  "
+            f"tick {mean:.2f} ms (max {stats['tick_max_ms']:.2f})  "
+            f"updates/s {(stats['messages_out'] - last_out) / interval:.0f}  "
+            f"evicted {stats['evicted']}\n")
+        last_ticks, last_out = server.tick_count, stats['messages_out']
+        last_total = stats['tick_total_ms']
+        stats['tick_max_ms'] = 0.0
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Start the server described by the command-line arguments."""
+    server = GameServer(tick_rate=args.tick_rate)
+    if args.unix:
+        await server.start_unix(args.unix)
+    else:
+        await server.start_tcp(args.host, args.port)
+    if args.report:
+        asyncio.get_running_loop().create_task(_report(server, args.report))
+    await server.run()
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Host Tetris sessions over TCP or a Unix socket.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7777)
+    parser.add_argument('--unix', metavar='PATH', help="listen on a Unix socket instead of TCP")
+    parser.add_argument('--tick-rate', type=int, default=60)
+    parser.add_argument('--report', type=float, default=5.0, metavar='SECONDS',
+                        help="print load figures at this interval, 0 to disable")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+Batch simulation tools for running headless games at scale.
+
+Names are imported on first use, so running a tool with
+``python -m src.sim.<tool>`` does not import it twice.
+"""
+
+from importlib import import_module
+
+_MODULES = {
+    'GameResult': '.selfplay',
+    'play_game': '.selfplay',
+    'random_policy': '.selfplay',
+    'run_selfplay': '.selfplay',
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,81 @@
+"""
+Running contiguous ranges of work across worker processes.
+
+Shared by the batch tools: the self-play runner splits seeds into
+ranges and the replay renderer splits frames. Each worker process runs
+one range and streams what it produces back to the parent as it goes.
+"""
+
+import multiprocessing
+from typing import Any, Callable, Iterable, Iterator, List, Sequence, Tuple
+
+Range = Tuple[int, int]
+
+# Called as target(range, *args); yields the items to stream back
+Target = Callable[..., Iterable[Any]]
+
+
+def partition(count: int, workers: int, start: int = 0) -> List[Range]:
+    """Split ``count`` items from ``start`` into at most ``workers`` (start, stop) ranges.
+
+    Ranges are contiguous and differ in size by at most one.
+    """
+    workers = max(1, min(workers, count))
+    size, extra = divmod(count, workers)
+    ranges = []
+    for index in range(workers):
+        stop = start + size + (1 if index < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _worker(target: Target, work: Range, args: Sequence[Any],
+            results: multiprocessing.Queue) -> None:
+    """Run one range, streaming its items (or its exception) into the queue."""
+    try:
+        for item in target(work, *args):
+            results.put(item)
+    except Exception as e:
+        results.put(e)
+    finally:
+        results.put(None)
+
+
+def run_partitioned(target: Target, ranges: Sequence[Range],
+                    args: Sequence[Any] = ()) -> Iterator[Any]:
+    """Yield the items of ``target(range, *args)`` for every range.
+
+    Each range runs in its own worker process and items are yielded in
+    completion order; a single range runs in this process. The first
+    exception raised by a worker is re-raised here, and stopping early
+    terminates the workers. ``target``, ``args`` and the items must be
+    picklable (e.g. module-level functions), and items must not be None.
+    """
+    if len(ranges) <= 1:
+        for work in ranges:
+            yield from target(work, *args)
+        return
+
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=_worker,
+                                         args=(target, work, args, results),
+                                         daemon=True)
+                 for work in ranges]
+    for process in processes:
+        process.start()
+    try:
+        running = len(processes)
+        while running:
+            item = results.get()
+            if item is None:
+                running -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
@@ -0,0 +1,97 @@
+"""
+Process-pool self-play runner.
+
+Plays complete headless games across CPU cores. Each worker process is
+handed a contiguous range of seeds (see ``src.sim.parallel``) and streams
+one result per game back to the parent as soon as the game ends.
+
+Run from the project root:
+    python -m src.sim.selfplay --games 1000 --workers 8
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Callable, Iterator, NamedTuple, Optional, Tuple, Union
+
+from src.engine.bitboard import BitBoard
+from src.engine.game_state import GameState
+from src.engine.headless import HeadlessGame
+from .parallel import partition, run_partitioned
+
+# A policy maps a game state and a per-game RNG to an action
+Policy = Callable[[GameState, random.Random], Union[int, str]]
+
+
+class GameResult(NamedTuple):
+    """Summary of one finished self-play game."""
+    seed: int
+    score: int
+    lines: int
+    level: int
+    pieces: int
+    steps: int
+    duration: float  # seconds
+
+
+def random_policy(game_state: GameState, rng: random.Random) -> int:
+    """Pick a uniformly random action."""
+    return rng.randrange(len(HeadlessGame.ACTIONS))
+
+
+def play_game(seed: int, policy: Policy = random_policy,
+              gravity_ticks: int = 1, max_steps: int = 100_000) -> GameResult:
+    """Play one headless game to completion from the given seed."""
+    start = time.perf_counter()
+    env = HeadlessGame(gravity_ticks=gravity_ticks, board_factory=BitBoard,
+                       seed=seed)
+    # Keep the policy's randomness independent of the piece sequence
+    policy_rng = random.Random(f"policy:{seed}")
+    state, done, steps = env.game_state, env.game_state.game_over, 0
+    while not done and steps < max_steps:
+        state, _, done = env.step(policy(state, policy_rng))
+        steps += 1
+    return GameResult(seed, state.score, state.lines_cleared, state.level,
+                      state.pieces_placed, steps, time.perf_counter() - start)
+
+
+def _play_range(seed_range: Tuple[int, int], policy: Policy, gravity_ticks: int,
+                max_steps: int) -> Iterator[GameResult]:
+    """Play every seed in the range, yielding each result as its game ends."""
+    for seed in range(*seed_range):
+        yield play_game(seed, policy, gravity_ticks, max_steps)
+
+
+def run_selfplay(num_games: int, policy: Policy = random_policy,
+                 workers: Optional[int] = None, base_seed: int = 0,
+                 gravity_ticks: int = 1,
+                 max_steps: int = 100_000) -> Iterator[GameResult]:
+    """Play ``num_games`` games across worker processes.
+
+    Yields results in completion order. The set of results depends only on
+    ``base_seed`` and the policy, not on the number of workers. The policy
+    must be picklable, e.g. a module-level function.
+    """
+    ranges = partition(num_games, workers or os.cpu_count() or 1, base_seed)
+    return run_partitioned(_play_range, ranges, (policy, gravity_ticks, max_steps))
+
+
+def main():
+    """Command-line entry point; writes one JSON object per game."""
+    parser = argparse.ArgumentParser(description="Run headless self-play games.")
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--gravity-ticks', type=int, default=1)
+    args = parser.parse_args()
+
+    for result in run_selfplay(args.games, workers=args.workers,
+                               base_seed=args.seed,
+                               gravity_ticks=args.gravity_ticks):
+        sys.stdout.write(json.dumps(result._asdict()) + '\n')
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,28 @@
 """
 User interface components including rendering and input handling.
+
+Classes are imported on first use, so picking the terminal backend never
+imports pygame.
 """
 
-from .renderer import Renderer
-from .input_handler import InputHandler
+from importlib import import_module
+
+_MODULES = {
+    'Renderer': '.renderer',
+    'RetainedRenderer': '.retained_renderer',
+    'NullRenderer': '.renderer',
+    'OffscreenRenderer': '.replay_render',
+    'InputHandler': '.input_handler',
+    'TerminalRenderer': '.terminal_renderer',
+    'TerminalInputHandler': '.terminal_input',
+}
+
+__all__ = list(_MODULES)
+
 
-__all__ = ['Renderer', 'InputHandler']
\ No newline at end of file
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
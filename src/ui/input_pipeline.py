@@ -0,0 +1,156 @@
+"""
+Timestamped input pipeline with delayed auto shift (DAS) and auto repeat.
+
+Key presses and releases are queued with the time they were read. Each
+simulation tick then applies every queued input and auto-repeat that falls
+before the end of the tick, in time order, so several inputs in one frame
+keep their relative timing. This module does not import pygame.
+"""
+
+from collections import deque
+from typing import Deque, List, NamedTuple, Optional, Tuple
+from src.engine.game_state import GameState
+from src.engine.instrumentation import Instrumentation
+
+
+class InputEvent(NamedTuple):
+    """A key press or release mapped to a game action."""
+    time: float
+    action: str
+    pressed: bool = True
+
+
+class InputPipeline:
+    """Turns timestamped key state into game actions inside simulation ticks.
+
+    Shifting repeats after ``das_ms`` every ``arr_ms`` (an ``arr_ms`` of 0
+    shifts straight to the wall); the most recently pressed direction
+    wins. Soft drop repeats every ``soft_drop_ms`` while held. Times are
+    in seconds from ``time.perf_counter``.
+    """
+
+    SHIFTS = ('move_left', 'move_right')
+
+    def __init__(self, das_ms: float = 167, arr_ms: float = 33,
+                 soft_drop_ms: float = 50,
+                 instrumentation: Optional[Instrumentation] = None):
+        """Configure repeat timings; latencies go to ``instrumentation``."""
+        if das_ms < 0 or arr_ms < 0 or soft_drop_ms <= 0:
+            raise ValueError("DAS and ARR must be non-negative and the soft "
+                             "drop interval positive")
+        self.das = das_ms / 1000.0
+        self.arr = arr_ms / 1000.0
+        self.soft_drop_interval = soft_drop_ms / 1000.0
+        self.instrumentation = instrumentation
+        self._events: Deque[InputEvent] = deque()
+        self._held: List[str] = []
+        # Charging shift: (action, time pressed, repeats applied)
+        self._shift: Optional[Tuple[str, float, int]] = None
+        # Held soft drop: (time pressed, repeats applied)
+        self._soft_drop: Optional[Tuple[float, int]] = None
+        # (action, input time) applied since the last presented frame
+        self._unpresented: List[Tuple[str, float]] = []
+
+    def push(self, time: float, action: str, pressed: bool = True) -> None:
+        """Queue a key press or release read at ``time``."""
+        self._events.append(InputEvent(time, action, pressed))
+
+    def clear(self) -> None:
+        """Forget queued events and held keys."""
+        self._events.clear()
+        self._held.clear()
+        self._shift = None
+        self._soft_drop = None
+
+    def _next_repeat(self) -> Tuple[Optional[float], Optional[str]]:
+        """Return the time and action of the next auto-repeat, if any."""
+        best_time, best_action = None, None
+        if self._shift is not None and self.arr > 0:
+            action, pressed, repeats = self._shift
+            best_time, best_action = pressed + self.das + repeats * self.arr, action
+        if self._soft_drop is not None:
+            pressed, repeats = self._soft_drop
+            time = pressed + (repeats + 1) * self.soft_drop_interval
+            if best_time is None or time < best_time:
+                best_time, best_action = time, 'soft_drop'
+        return best_time, best_action
+
+    def advance(self, game_state: GameState, until: float) -> None:
+        """Apply every input and auto-repeat due up to time ``until``."""
+        events = self._events
+        while True:
+            repeat_time, repeat_action = self._next_repeat()
+            if repeat_time is not None and repeat_time > until:
+                repeat_time = None
+            if events and events[0].time <= until and (
+                    repeat_time is None or events[0].time <= repeat_time):
+                self._handle_event(game_state, events.popleft())
+            elif repeat_time is not None:
+                self._repeat(game_state, repeat_action, repeat_time)
+            else:
+                break
+
+        # Instant repeat: once charged, keep the piece against the wall
+        if self._shift is not None and self.arr == 0:
+            action, pressed, _ = self._shift
+            if until >= pressed + self.das:
+                while self._apply(game_state, action, pressed + self.das):
+                    pass
+
+    def _handle_event(self, game_state: GameState, event: InputEvent) -> None:
+        """Update key state for an event and apply its initial action."""
+        action = event.action
+        if not event.pressed:
+            if action in self._held:
+                self._held.remove(action)
+            if action == 'soft_drop':
+                self._soft_drop = None
+            elif self._shift is not None and self._shift[0] == action:
+                # Fall back to a still-held direction, charging afresh
+                held = [a for a in self._held if a in self.SHIFTS]
+                self._shift = (held[-1], event.time, 0) if held else None
+            return
+
+        if action in self._held:
+            return
+        if action == 'pause':
+            game_state.toggle_pause()
+            return
+        if action in self.SHIFTS:
+            self._held.append(action)
+            self._shift = (action, event.time, 0)
+        elif action == 'soft_drop':
+            self._held.append(action)
+            self._soft_drop = (event.time, 0)
+        self._apply(game_state, action, event.time)
+
+    def _repeat(self, game_state: GameState, action: str, time: float) -> None:
+        """Apply one auto-repeat and schedule the next."""
+        if action == 'soft_drop':
+            pressed, repeats = self._soft_drop
+            self._soft_drop = (pressed, repeats + 1)
+        else:
+            _, pressed, repeats = self._shift
+            self._shift = (action, pressed, repeats + 1)
+        self._apply(game_state, action, time)
+
+    def _apply(self, game_state: GameState, action: str, time: float) -> bool:
+        """Apply an action to the game, noting it for latency reporting."""
+        if game_state.game_over or game_state.game_paused:
+            return False
+        if action == 'soft_drop':
+            changed = game_state.soft_drop()
+        else:
+            changed = game_state.apply_action(action)
+        if changed and self.instrumentation is not None:
+            self._unpresented.append((action, time))
+        return changed
+
+    def presented(self, time: float) -> None:
+        """Report latencies of the actions shown by a frame presented at ``time``."""
+        if not self._unpresented:
+            return
+        if self.instrumentation is not None:
+            for action, input_time in self._unpresented:
+                self.instrumentation.record_latency(action, (time - input_time) * 1000.0)
+        self._unpresented.clear()
@@ -1,12 +1,26 @@
+import threading
+import time
 import pygame
 from typing import Tuple, Optional
 from src.engine.game_state import GameState
+from src.engine.instrumentation import Instrumentation
 from src.engine.board import Board
 from src.engine.tetromino import Tetromino
+from .sprites import SpriteAtlas, TextCache
+from .viewport import follow_piece
+
+def _open_window(window_size: Tuple[int, int]) -> pygame.Surface:
+    """Open (or resize) the game window and return its surface."""
+    pygame.display.init()
+    screen = pygame.display.set_mode(window_size, pygame.RESIZABLE)
+    pygame.display.set_caption("Tetris")
+    return screen
 
 class Renderer:
     """Handles all game rendering using Pygame."""
 
+    BACKGROUND = (20, 20, 20)
+
     # Colors (R, G, B)
     COLORS = {
         0: (40, 40, 40),    # Empty cell
@@ -17,73 +31,181 @@ class Renderer:
         5: (240, 0, 0),     # Red (Z)
         6: (0, 0, 240),     # Blue (J)
         7: (240, 160, 0),   # Orange (L)
+        8: (120, 120, 120), # Grey (garbage)
     }
+
+    # Below this cell size, tall boards are shown through a scrolling viewport
+    MIN_CELL_SIZE = 8
     
-    def __init__(self, window_size: Tuple[int, int] = (800, 600)):
-        """Initialize the renderer with the given window size."""
-        pygame.init()
+    # Room the score column needs left of the board; wider boards get the
+    # HUD on one line above the board instead
+    HUD_WIDTH = 200
+    
+    # Text rendered into the text cache as soon as the fonts are loaded
+    WARM_TEXTS = ("GAME OVER", "PAUSED", "Score: 0", "Level: 1", "Lines: 0")
+
+    def __init__(self, window_size: Tuple[int, int] = (800, 600),
+                 board_size: Tuple[int, int] = (Board.WIDTH, Board.HEIGHT),
+                 background_assets: bool = False):
+        """Initialize the renderer with the given window and board sizes.
+
+        The layout follows the size of the board being rendered, so
+        ``board_size`` only saves a relayout on the first frame.
+
+        Only SDL's display and font subsystems are started. With
+        ``background_assets`` the fonts are loaded and the text cache is
+        warmed on a background thread; frames drawn before they are ready
+        show the board without text.
+        """
+        pygame.font.init()
+        self.screen = self._open_screen(window_size)
+        
+        # Fonts and text cache, set once loaded (see ``assets_ready``)
+        self.font_big: Optional[pygame.font.Font] = None
+        self.font_small: Optional[pygame.font.Font] = None
+        self.font_stats: Optional[pygame.font.Font] = None
+        self.text_cache = TextCache()
+        self.assets_ms: Optional[float] = None
+        self._assets_loaded = threading.Event()
+        self._assets_thread: Optional[threading.Thread] = None
+        if background_assets:
+            self._assets_thread = threading.Thread(target=self._load_assets,
+                                                   name="renderer-assets", daemon=True)
+            self._assets_thread.start()
+        else:
+            self._load_assets()
+        self.atlas: Optional[SpriteAtlas] = None
+        
+        # Frame stats shown in the corner when set
+        self.instrumentation: Optional[Instrumentation] = None
+        
+        self.board_size = board_size
+        # First board row shown in the viewport
+        self.view_top = 0
+        self._layout(window_size)
+
+    def _load_assets(self) -> None:
+        """Load the fonts and pre-render the HUD and overlay text."""
+        start = time.perf_counter()
+        font_big = pygame.font.Font(None, 48)
+        font_small = pygame.font.Font(None, 36)
+        font_stats = pygame.font.Font(None, 18)
+        text_cache = TextCache()
+        for text in self.WARM_TEXTS:
+            text_cache.render(font_big if text.isupper() else font_small, text)
+        # Published together before the event, which the drawing thread checks first
+        self.font_big, self.font_small, self.font_stats = font_big, font_small, font_stats
+        self.text_cache = text_cache
+        self.assets_ms = (time.perf_counter() - start) * 1000.0
+        self._assets_loaded.set()
+
+    @property
+    def assets_ready(self) -> bool:
+        """Return True once the fonts and text cache are loaded."""
+        return self._assets_loaded.is_set()
+
+    def wait_for_assets(self, timeout: Optional[float] = None) -> bool:
+        """Block until the fonts are loaded; returns False on timeout."""
+        return self._assets_loaded.wait(timeout)
+
+    def close(self) -> None:
+        """Shut the display down, letting a background font load finish first."""
+        self.wait_for_assets(1.0)
+        pygame.quit()
+
+    def _open_screen(self, window_size: Tuple[int, int]) -> pygame.Surface:
+        """Open (or resize) the game window and return its surface."""
+        return _open_window(window_size)
+
+    def _layout(self, window_size: Tuple[int, int]) -> None:
+        """Compute sizes and positions for the window, rebuilding cached surfaces."""
         self.window_size = window_size
-        self.screen = pygame.display.set_mode(window_size)
-        pygame.display.set_caption("Tetris")
         
-        # Calculate cell size based on window height
-        self.cell_size = (window_size[1] - 100) // Board.HEIGHT
+        # Calculate cell size based on window height; boards too tall to
+        # fit at the minimum cell size show only a viewport of their rows
+        width, height = self.board_size
+        space = max(1, window_size[1] - 100)
+        fit = min(space // height, max(1, window_size[0] - 400) // width)
+        self.cell_size = max(min(self.MIN_CELL_SIZE, space), fit)
+        self.view_rows = min(height, max(1, space // self.cell_size))
+        self.view_top = min(self.view_top, height - self.view_rows)
         
         # Calculate board position to center it
-        self.board_offset_x = (window_size[0] - (Board.WIDTH * self.cell_size)) // 2
-        self.board_offset_y = (window_size[1] - (Board.HEIGHT * self.cell_size)) // 2
+        self.board_offset_x = (window_size[0] - (width * self.cell_size)) // 2
+        self.board_offset_y = (window_size[1] - (self.view_rows * self.cell_size)) // 2
+        self.hud_inline = self.board_offset_x < self.HUD_WIDTH
+        
+        if self.atlas is None or self.atlas.cell_size != self.cell_size:
+            self.atlas = SpriteAtlas(self.cell_size, self.COLORS)
         
-        # Load fonts
-        self.font_big = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 36)
+        # Dimming overlay shared by the pause and game over screens
+        self.overlay = pygame.Surface(window_size, pygame.SRCALPHA)
+        self.overlay.fill((0, 0, 0, 128))
         
-        # Debug flag
-        self.debug = True
+        # Top-left corner reserved for the frame stats overlay
+        self.stats_rect = pygame.Rect(0, 0, max(0, self.board_offset_x), 85)
 
-    def draw_cell(self, x: int, y: int, color_idx: int, ghost: bool = False) -> None:
-        """Draw a single cell with the specified color."""
-        color = self.COLORS[color_idx]
-        rect = pygame.Rect(
+    def resize(self, window_size: Tuple[int, int]) -> None:
+        """Adapt the layout to a new window size."""
+        self.screen = self._open_screen(window_size)
+        self._layout(window_size)
+
+    def _fit(self, game_state: GameState) -> None:
+        """Match the layout to the board and scroll the viewport to the piece."""
+        board = game_state.board
+        if (board.width, board.height) != self.board_size:
+            self.board_size = (board.width, board.height)
+            self._layout(self.window_size)
+        self.view_top = follow_piece(self.view_top, self.view_rows, game_state)
+
+    def cell_rect(self, x: int, y: int) -> pygame.Rect:
+        """Return the screen rectangle of the board cell at (x, y)."""
+        return pygame.Rect(
             self.board_offset_x + x * self.cell_size,
             self.board_offset_y + y * self.cell_size,
             self.cell_size,
             self.cell_size
         )
-        
-        if ghost:
-            # Draw ghost piece with transparency
-            surface = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
-            pygame.draw.rect(surface, (*color, 128), surface.get_rect())
-            self.screen.blit(surface, rect)
-        else:
-            pygame.draw.rect(self.screen, color, rect)
-            pygame.draw.rect(self.screen, (100, 100, 100), rect, 1)
 
-    def draw_board(self, game_state: GameState) -> None:
-        """Draw the game board and current piece."""
+    def draw_cell(self, x: int, y: int, color_idx: int, ghost: bool = False) -> None:
+        """Draw a single cell with the specified color."""
+        # Ghost tiles are translucent; solid cells carry an outline
+        style = SpriteAtlas.GHOST if ghost else SpriteAtlas.OUTLINED
+        self.screen.blit(self.atlas.tile(color_idx, style),
+                         (self.board_offset_x + x * self.cell_size,
+                          self.board_offset_y + y * self.cell_size))
+
+    def draw_locked_cells(self, game_state: GameState) -> None:
+        """Draw the board background and every locked cell."""
         # Draw board background
         board_rect = pygame.Rect(
             self.board_offset_x,
             self.board_offset_y,
-            Board.WIDTH * self.cell_size,
-            Board.HEIGHT * self.cell_size
+            self.board_size[0] * self.cell_size,
+            self.view_rows * self.cell_size
         )
         pygame.draw.rect(self.screen, (0, 0, 0), board_rect)
         
-        # Draw grid cells
-        for y, row in enumerate(game_state.board.grid):
+        # Draw grid cells in the viewport
+        top = self.view_top
+        for y, row in enumerate(game_state.board.grid[top:top + self.view_rows]):
             for x, cell in enumerate(row):
                 if cell:
                     self.draw_cell(x, y, cell)
+
+    def draw_board(self, game_state: GameState) -> None:
+        """Draw the game board and current piece."""
+        self.draw_locked_cells(game_state)
         
         # Draw ghost piece
         if game_state.current_piece:
             ghost_pos = game_state.get_ghost_position()
-            self._draw_piece(game_state.current_piece, ghost_pos['x'], ghost_pos['y'], True)
+            self._draw_board_piece(game_state.current_piece,
+                                   ghost_pos['x'], ghost_pos['y'], True)
         
         # Draw current piece
         if game_state.current_piece:
-            self._draw_piece(
+            self._draw_board_piece(
                 game_state.current_piece,
                 game_state.piece_position['x'],
                 game_state.piece_position['y']
@@ -91,26 +213,20 @@ class Renderer:
 
     def _draw_piece(self, piece: Tetromino, x: int, y: int, ghost: bool = False) -> None:
         """Draw a tetromino piece at the specified position."""
-        if self.debug:
-            print(f"Drawing piece at ({x}, {y})")
-            print(f"Piece color: {piece.color}")
-            print(f"Piece shape:\n{piece.shape}")
-            
-        for row_idx, row in enumerate(piece.shape):
-            for col_idx, cell in enumerate(row):
-                if cell:
-                    self.draw_cell(x + col_idx, y + row_idx, piece.color, ghost)
+        for col_idx, row_idx in piece.cells:
+            self.draw_cell(x + col_idx, y + row_idx, piece.color, ghost)
+
+    def _draw_board_piece(self, piece: Tetromino, x: int, y: int,
+                          ghost: bool = False) -> None:
+        """Draw the cells of a piece on the board that fall inside the viewport."""
+        y -= self.view_top
+        for col_idx, row_idx in piece.cells:
+            if 0 <= y + row_idx < self.view_rows:
+                self.draw_cell(x + col_idx, y + row_idx, piece.color, ghost)
 
     def draw_next_piece(self, next_piece: Tetromino) -> None:
         """Draw the next piece preview."""
-        if self.debug:
-            print("\nDrawing next piece preview:")
-            print(f"Next piece: {next_piece}")
-            if next_piece:
-                print(f"Next piece color: {next_piece.color}")
-                print(f"Next piece shape:\n{next_piece.shape}")
-        
-        preview_x = self.board_offset_x + (Board.WIDTH * self.cell_size) + 50
+        preview_x = self.board_offset_x + (self.board_size[0] * self.cell_size) + 50
         preview_y = self.board_offset_y + 50
         
         # Draw preview box background
@@ -123,13 +239,11 @@ class Renderer:
         pygame.draw.rect(self.screen, (40, 40, 40), preview_rect)
         
         if not next_piece:
-            if self.debug:
-                print("No next piece to draw!")
             return
             
         # Draw next piece centered in preview box
-        piece_width = len(next_piece.shape[0])
-        piece_height = len(next_piece.shape)
+        piece_width = next_piece.get_width()
+        piece_height = next_piece.get_height()
         
         x_offset = (4 - piece_width) // 2
         y_offset = (4 - piece_height) // 2
@@ -137,12 +251,6 @@ class Renderer:
         preview_grid_x = preview_x // self.cell_size
         preview_grid_y = preview_y // self.cell_size
         
-        if self.debug:
-            print(f"Preview box position: ({preview_x}, {preview_y})")
-            print(f"Piece dimensions: {piece_width}x{piece_height}")
-            print(f"Offset: ({x_offset}, {y_offset})")
-            print(f"Final grid position: ({preview_grid_x + x_offset}, {preview_grid_y + y_offset})")
-        
         self._draw_piece(
             next_piece,
             preview_grid_x + x_offset,
@@ -151,51 +259,115 @@ class Renderer:
 
     def draw_score(self, game_state: GameState) -> None:
         """Draw score, level, and lines information."""
-        score_x = self.board_offset_x - 200
-        score_y = self.board_offset_y + 50
-        
-        # Draw score
-        score_text = self.font_small.render(f"Score: {game_state.score}", True, (255, 255, 255))
-        self.screen.blit(score_text, (score_x, score_y))
+        if not self.assets_ready:
+            return
+        texts = [self.text_cache.render(self.font_small, text) for text in (
+            f"Score: {game_state.score}",
+            f"Level: {game_state.level}",
+            f"Lines: {game_state.lines_cleared}",
+        )]
         
-        # Draw level
-        level_text = self.font_small.render(f"Level: {game_state.level}", True, (255, 255, 255))
-        self.screen.blit(level_text, (score_x, score_y + 40))
+        if self.hud_inline:
+            # No room left of the board: one line along its top edge
+            x = max(0, self.board_offset_x)
+            for text in texts:
+                self.screen.blit(text, (x, self.board_offset_y - 40))
+                x += text.get_width() + 30
+            return
         
-        # Draw lines cleared
-        lines_text = self.font_small.render(f"Lines: {game_state.lines_cleared}", True, (255, 255, 255))
-        self.screen.blit(lines_text, (score_x, score_y + 80))
+        score_x = self.board_offset_x - self.HUD_WIDTH
+        score_y = self.board_offset_y + 50
+        for i, text in enumerate(texts):
+            self.screen.blit(text, (score_x, score_y + i * 40))
+
+    def draw_stats(self, instrumentation: Instrumentation) -> None:
+        """Draw recent frame timings and event counts in the stats corner."""
+        if not self.assets_ready:
+            return
+        summary = instrumentation.summary()
+        counters = instrumentation.counters
+        lines = (
+            f"frame {summary['total_ms']:.1f} ms (max {summary['max_ms']:.1f})",
+            f"input {summary['input_ms']:.1f}  update {summary['update_ms']:.1f}"
+            f"  render {summary['render_ms']:.1f}",
+            f"spawns {counters['spawns']}  locks {counters['locks']}",
+            f"rotations {counters['rotations']}  kicks {counters['kicks']}",
+            f"input latency {summary['latency_ms']:.1f} ms",
+        )
+        self.screen.set_clip(self.stats_rect)
+        try:
+            for i, line in enumerate(lines):
+                # Rendered directly: these strings change every frame and
+                # would only churn the text cache
+                text = self.font_stats.render(line, True, (160, 160, 160))
+                self.screen.blit(text, (self.stats_rect.x + 5, self.stats_rect.y + 5 + i * 15))
+        finally:
+            self.screen.set_clip(None)
 
     def draw_game_over(self) -> None:
         """Draw game over screen."""
-        overlay = pygame.Surface(self.window_size, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay, (0, 0))
+        if not self.assets_ready:
+            return
         
-        text = self.font_big.render("GAME OVER", True, (255, 255, 255))
+        text = self.text_cache.render(self.font_big, "GAME OVER")
         text_rect = text.get_rect(center=(self.window_size[0] // 2, self.window_size[1] // 2))
         self.screen.blit(text, text_rect)
 
     def draw_pause(self) -> None:
         """Draw pause screen overlay."""
-        overlay = pygame.Surface(self.window_size, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay, (0, 0))
+        if not self.assets_ready:
+            return
         
-        text = self.font_big.render("PAUSED", True, (255, 255, 255))
+        text = self.text_cache.render(self.font_big, "PAUSED")
         text_rect = text.get_rect(center=(self.window_size[0] // 2, self.window_size[1] // 2))
         self.screen.blit(text, text_rect)
 
     def render(self, game_state: GameState) -> None:
         """Render the complete game frame."""
-        self.screen.fill((20, 20, 20))
+        self.draw_frame(game_state)
+        pygame.display.flip()
+
+    def draw_frame(self, game_state: GameState) -> None:
+        """Draw the complete game frame on the screen surface."""
+        self._fit(game_state)
+        self.screen.fill(self.BACKGROUND)
         self.draw_board(game_state)
         self.draw_next_piece(game_state.next_piece)
         self.draw_score(game_state)
+        if self.instrumentation is not None:
+            self.draw_stats(self.instrumentation)
         
         if game_state.game_over:
             self.draw_game_over()
         elif game_state.game_paused:
             self.draw_pause()
-            
-        pygame.display.flip()
\ No newline at end of file
+
+
+class NullRenderer:
+    """Stands in for a Renderer when frames are never drawn.
+
+    The window is still opened, since keyboard input and the close button
+    need one, but no fonts, sprites or layout are loaded and nothing is
+    ever drawn into it.
+    """
+
+    assets_ready = True
+    assets_ms = None
+
+    def __init__(self, window_size: Tuple[int, int] = (800, 600)):
+        """Open the game window."""
+        self.screen = _open_window(window_size)
+        self.instrumentation: Optional[Instrumentation] = None
+
+    def render(self, game_state: GameState) -> None:
+        """Draw nothing."""
+
+    def resize(self, window_size: Tuple[int, int]) -> None:
+        """Follow the window's new size."""
+        self.screen = _open_window(window_size)
+
+    def close(self) -> None:
+        """Shut the display down."""
+        pygame.quit()
@@ -0,0 +1,182 @@
+"""
+Offscreen, multi-process rendering of replays to frames.
+
+Replays a recorded game through ``GameState`` and draws frames with the
+regular ``Renderer`` layout into plain surfaces, with no window. The
+frames are split into contiguous ranges, one per worker process; each
+worker fast-forwards its own ``ReplayPlayer`` to the start of its range
+and writes its frames straight to disk, as numbered PNGs or into one
+shared file of raw RGB frames.
+
+Run from the project root:
+    python -m src.ui.replay_render games.trpl --out frames --workers 8
+    python -m src.ui.replay_render games.trpl --index 3 --format raw --out clip
+    ffmpeg -f rawvideo -pix_fmt rgb24 -s 800x600 -r 60 -i clip/frames.rgb clip.mp4
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+# The totals are printed as JSON on stdout; keep pygame's banner off it
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+from src.engine.board import Board
+from src.engine.game_state import GameState
+from src.engine.replay import Replay, ReplayArchive, ReplayPlayer
+from src.sim.parallel import partition, run_partitioned
+from .renderer import Renderer
+
+FORMATS = ('png', 'raw')
+
+# Name of the raw frame file inside the output directory
+RAW_FILE = 'frames.rgb'
+
+# Frames a worker renders between progress reports
+PROGRESS_EVERY = 32
+
+
+class OffscreenRenderer(Renderer):
+    """Renderer that draws into a plain surface, with no window or display."""
+
+    def _open_screen(self, window_size: Tuple[int, int]) -> pygame.Surface:
+        """Return an off-display surface of the window size."""
+        return pygame.Surface(window_size)
+
+    def render(self, game_state: GameState) -> None:
+        """Draw the frame; there is nothing to present."""
+        self.draw_frame(game_state)
+
+
+class RenderResult(NamedTuple):
+    """Totals of one batch render."""
+    frames: int
+    width: int
+    height: int
+    duration: float  # seconds
+    frames_per_second: float
+    realtime_factor: float  # replay length at the tick rate over the duration
+
+
+def count_frames(replay: Replay, every: int = 1) -> int:
+    """Return the number of frames drawn for a replay, one per ``every`` ticks.
+
+    Frame ``i`` shows the game at the start of tick ``i * every``; the
+    first frame is the initial state and the last is at or before the end.
+    """
+    return replay.header.num_ticks // every + 1
+
+
+def render_frames(replay_data: bytes, frame_range: Tuple[int, int], out: str,
+                  fmt: str = 'png', every: int = 1,
+                  window_size: Tuple[int, int] = (800, 600)) -> Iterator[int]:
+    """Render the frames in ``frame_range`` of a replay to ``out``.
+
+    Yields the index of each frame once it is written. PNGs are named
+    ``frame_NNNNNN.png``; raw frames are written at their own offset in
+    ``RAW_FILE``, which must already exist.
+    """
+    replay = Replay(replay_data)
+    player = ReplayPlayer(replay)
+    renderer = OffscreenRenderer(window_size, (Board.WIDTH, Board.HEIGHT))
+    raw = open(os.path.join(out, RAW_FILE), 'r+b') if fmt == 'raw' else None
+    frame_bytes = window_size[0] * window_size[1] * 3
+    try:
+        for index in range(*frame_range):
+            renderer.render(player.seek(index * every).game_state)
+            if raw is not None:
+                raw.seek(index * frame_bytes)
+                raw.write(pygame.image.tobytes(renderer.screen, 'RGB'))
+            else:
+                pygame.image.save(renderer.screen,
+                                  os.path.join(out, f"frame_{index:06d}.png"))
+            yield index
+    finally:
+        if raw is not None:
+            raw.close()
+
+
+def _render_range(frame_range: Tuple[int, int], replay_data: bytes, out: str,
+                  fmt: str, every: int,
+                  window_size: Tuple[int, int]) -> Iterator[int]:
+    """Render a range of frames, yielding how many were written as it goes."""
+    done = 0
+    for _ in render_frames(replay_data, frame_range, out, fmt, every, window_size):
+        done += 1
+        if done == PROGRESS_EVERY:
+            yield done
+            done = 0
+    if done:
+        yield done
+
+
+def render_replay(replay: Replay, out: str, fmt: str = 'png', every: int = 1,
+                  window_size: Tuple[int, int] = (800, 600),
+                  workers: Optional[int] = None) -> Iterator[int]:
+    """Render every frame of a replay to ``out`` across worker processes.
+
+    Yields how many more frames were written as workers report progress.
+    The frames written do not depend on the number of workers.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown frame format: {fmt}")
+    if every <= 0:
+        raise ValueError("every must be positive")
+    os.makedirs(out, exist_ok=True)
+    num_frames = count_frames(replay, every)
+    if fmt == 'raw':
+        # Sized up front so workers can write their ranges in any order
+        with open(os.path.join(out, RAW_FILE), 'wb') as f:
+            f.truncate(num_frames * window_size[0] * window_size[1] * 3)
+
+    ranges = partition(num_frames, workers or os.cpu_count() or 1)
+    yield from run_partitioned(_render_range, ranges,
+                               (replay.to_bytes(), out, fmt, every, window_size))
+
+
+def _window_size(text: str) -> Tuple[int, int]:
+    """Parse a WIDTHxHEIGHT frame size argument."""
+    try:
+        width, height = (int(part) for part in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid frame size: {text!r}") from None
+    return width, height
+
+
+def main():
+    """Command-line entry point; prints the totals as JSON."""
+    parser = argparse.ArgumentParser(description="Render a replay to image frames.")
+    parser.add_argument('archive', help="replay archive (a single replay file works too)")
+    parser.add_argument('--index', type=int, default=0,
+                        help="replay to render from the archive (default: 0)")
+    parser.add_argument('--out', required=True, metavar='DIR')
+    parser.add_argument('--format', choices=FORMATS, default='png')
+    parser.add_argument('--every', type=int, default=1, metavar='TICKS',
+                        help="ticks between frames (default: 1)")
+    parser.add_argument('--size', type=_window_size, default=(800, 600), metavar='WxH',
+                        help="frame size in pixels (default: 800x600)")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--tick-rate', type=int, default=60, metavar='HZ',
+                        help="ticks per second the game was played at, for the "
+                             "real-time factor (default: 60)")
+    args = parser.parse_args()
+
+    with ReplayArchive(args.archive) as archive:
+        replay = Replay(archive[args.index].to_bytes())
+    start = time.perf_counter()
+    frames = sum(render_replay(replay, args.out, args.format, args.every,
+                               args.size, args.workers))
+    duration = time.perf_counter() - start
+    realtime = replay.header.num_ticks / args.tick_rate
+    result = RenderResult(frames, args.size[0], args.size[1], duration,
+                          frames / duration if duration else 0.0,
+                          realtime / duration if duration else 0.0)
+    sys.stdout.write(json.dumps(result._asdict()) + '\n')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+import pygame
+from typing import Callable, Dict, List, Optional, Tuple
+from src.engine.game_state import GameState
+from src.engine.board import Board
+from .renderer import Renderer
+
+# (color index, ghost) drawn on top of a board cell
+CellStyle = Tuple[int, bool]
+
+
+class RetainedRenderer(Renderer):
+    """Renderer that only redraws and presents what changed since the last frame.
+
+    Locked cells, the next piece preview and the HUD are kept on a cached
+    background surface, and each is redrawn only when its inputs change
+    (the board hash, the next piece, the score values). The active and
+    ghost pieces are drawn on top, and only the cells they entered or left
+    are sent to ``pygame.display.update``. Frames with no changes are
+    skipped entirely.
+    """
+
+    def __init__(self, window_size: Tuple[int, int] = (800, 600),
+                 board_size: Tuple[int, int] = (Board.WIDTH, Board.HEIGHT),
+                 background_assets: bool = False):
+        """Initialize the renderer and its cached background."""
+        super().__init__(window_size, board_size, background_assets)
+
+    def _layout(self, window_size: Tuple[int, int]) -> None:
+        """Compute the layout and reset the cached background for it."""
+        super()._layout(window_size)
+        self.background = pygame.Surface(window_size)
+        self.background.fill(self.BACKGROUND)
+
+        board_rect = pygame.Rect(
+            self.board_offset_x,
+            self.board_offset_y,
+            self.board_size[0] * self.cell_size,
+            self.view_rows * self.cell_size
+        )
+        self.board_rect = board_rect
+        if self.hud_inline:
+            # The HUD runs along the top, so the preview starts below it
+            self.hud_rect = pygame.Rect(0, 0, window_size[0], board_rect.top)
+            top = board_rect.top
+        else:
+            self.hud_rect = pygame.Rect(0, 0, board_rect.left, window_size[1])
+            top = 0
+        self.preview_rect = pygame.Rect(board_rect.right, top,
+                                        window_size[0] - board_rect.right,
+                                        window_size[1] - top)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Force every layer to be rebuilt on the next frame."""
+        self._board_key: Optional[Tuple[int, int]] = None
+        self._next_piece: Optional[str] = None
+        self._hud: Optional[Tuple[int, int, int]] = None
+        self._mode: Optional[str] = None
+        self._assets_drawn = False
+        self._cells: Dict[Tuple[int, int], CellStyle] = {}
+
+    def _redraw_region(self, rect: pygame.Rect, draw: Callable[[], None]) -> None:
+        """Clear a region of the background and redraw it, clipped to the region."""
+        screen = self.screen
+        self.screen = self.background
+        self.background.set_clip(rect)
+        self.background.fill(self.BACKGROUND, rect)
+        try:
+            draw()
+        finally:
+            self.background.set_clip(None)
+            self.screen = screen
+
+    def _piece_cells(self, game_state: GameState) -> Dict[Tuple[int, int], CellStyle]:
+        """Return the viewport cells covered by the ghost and active pieces."""
+        cells: Dict[Tuple[int, int], CellStyle] = {}
+        piece = game_state.current_piece
+        if piece:
+            top, rows = self.view_top, self.view_rows
+            ghost = game_state.get_ghost_position()
+            for dx, dy in piece.cells:
+                if 0 <= ghost['y'] + dy - top < rows:
+                    cells[(ghost['x'] + dx, ghost['y'] + dy - top)] = (piece.color, True)
+            x, y = game_state.piece_position['x'], game_state.piece_position['y'] - top
+            for dx, dy in piece.cells:
+                if 0 <= y + dy < rows:
+                    cells[(x + dx, y + dy)] = (piece.color, False)
+        return cells
+
+    def _draw_cells(self, cells: Dict[Tuple[int, int], CellStyle]) -> None:
+        """Draw piece cells on the screen, ghosts first."""
+        for (x, y), (color, ghost) in cells.items():
+            if ghost:
+                self.draw_cell(x, y, color, True)
+        for (x, y), (color, ghost) in cells.items():
+            if not ghost:
+                self.draw_cell(x, y, color)
+
+    def render(self, game_state: GameState) -> None:
+        """Render the frame, presenting only the changed regions."""
+        dirty: List[pygame.Rect] = []
+        self._fit(game_state)
+        if not self._assets_drawn and self.assets_ready:
+            # Text layers drawn before the fonts loaded are missing their text
+            self._hud = None
+            self._mode = None
+            self._assets_drawn = True
+
+        # Rebuild background layers whose inputs changed
+        board_key = (game_state.board.hash, self.view_top)
+        if board_key != self._board_key:
+            self._redraw_region(self.board_rect,
+                                lambda: self.draw_locked_cells(game_state))
+            self._board_key = board_key
+            dirty.append(self.board_rect)
+
+        next_piece = game_state.next_piece
+        next_key = (next_piece.shape_name if next_piece else None)
+        if next_key != self._next_piece:
+            self._redraw_region(self.preview_rect,
+                                lambda: self.draw_next_piece(next_piece))
+            self._next_piece = next_key
+            dirty.append(self.preview_rect)
+
+        hud = (game_state.score, game_state.level, game_state.lines_cleared)
+        if hud != self._hud:
+            self._redraw_region(self.hud_rect, lambda: self.draw_score(game_state))
+            self._hud = hud
+            dirty.append(self.hud_rect)
+
+        cells = self._piece_cells(game_state)
+        mode = ('game_over' if game_state.game_over
+                else 'paused' if game_state.game_paused else 'playing')
+
+        # Cells the active and ghost pieces entered or left
+        previous = self._cells
+        changed = [cell for cell in previous.keys() | cells.keys()
+                   if previous.get(cell) != cells.get(cell)]
+        self._cells = cells
+
+        # Mode changes, and any change under an overlay, repaint everything
+        if mode != self._mode or (mode != 'playing' and (dirty or changed)):
+            self.screen.blit(self.background, (0, 0))
+            self._draw_cells(cells)
+            if self.instrumentation is not None:
+                self.draw_stats(self.instrumentation)
+            if mode == 'game_over':
+                self.draw_game_over()
+            elif mode == 'paused':
+                self.draw_pause()
+            pygame.display.flip()
+            self._mode = mode
+            return
+
+        stats = self.instrumentation
+        if not dirty and not changed and stats is None:
+            return
+
+        for rect in dirty:
+            self.screen.blit(self.background, rect, rect)
+        for x, y in changed:
+            rect = self.cell_rect(x, y)
+            self.screen.blit(self.background, rect, rect)
+            dirty.append(rect)
+
+        if self.board_rect in dirty:
+            self._draw_cells(cells)
+        else:
+            # Only the changed cells were restored, so only they need pieces
+            self._draw_cells({cell: cells[cell] for cell in changed if cell in cells})
+
+        # The stats overlay changes every frame and is drawn over everything
+        if stats is not None:
+            self.screen.blit(self.background, self.stats_rect, self.stats_rect)
+            self.draw_stats(stats)
+            dirty.append(self.stats_rect)
+
+        pygame.display.update(dirty)
@@ -0,0 +1,73 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, Hashable, Tuple
+
+Color = Tuple[int, int, int]
+
+
+class SpriteAtlas:
+    """Cell tiles for every colour, pre-rendered once for a cell size.
+
+    All tiles live on one surface: one row per style and one column per
+    colour index. Drawing a cell is then a single blit of a subsurface.
+    """
+
+    SOLID = 0
+    OUTLINED = 1
+    GHOST = 2
+
+    OUTLINE_COLOR = (100, 100, 100)
+    GHOST_ALPHA = 128
+
+    def __init__(self, cell_size: int, colors: Dict[int, Color]):
+        """Render solid, outlined and ghost tiles for each colour index."""
+        self.cell_size = cell_size
+        self.surface = pygame.Surface((cell_size * len(colors), cell_size * 3),
+                                      pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+
+        self.tiles: Tuple[Dict[int, pygame.Surface], ...] = ({}, {}, {})
+        for column, (color_idx, color) in enumerate(sorted(colors.items())):
+            for style in (self.SOLID, self.OUTLINED, self.GHOST):
+                rect = pygame.Rect(column * cell_size, style * cell_size,
+                                   cell_size, cell_size)
+                if style == self.GHOST:
+                    self.surface.fill((*color, self.GHOST_ALPHA), rect)
+                else:
+                    self.surface.fill((*color, 255), rect)
+                    if style == self.OUTLINED:
+                        pygame.draw.rect(self.surface, self.OUTLINE_COLOR, rect, 1)
+                self.tiles[style][color_idx] = self.surface.subsurface(rect)
+
+    def tile(self, color_idx: int, style: int = OUTLINED) -> pygame.Surface:
+        """Return the tile for a colour index and style."""
+        return self.tiles[style][color_idx]
+
+
+class TextCache:
+    """Least-recently-used cache of rendered text surfaces."""
+
+    def __init__(self, max_entries: int = 64):
+        """Create an empty cache holding at most ``max_entries`` surfaces."""
+        self.max_entries = max_entries
+        self._surfaces: 'OrderedDict[Hashable, pygame.Surface]' = OrderedDict()
+
+    def render(self, font: pygame.font.Font, text: str,
+               color: Color = (255, 255, 255)) -> pygame.Surface:
+        """Return the rendered text, rendering it only on a cache miss."""
+        key = (id(font), text, color)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._surfaces[key] = surface
+            if len(self._surfaces) > self.max_entries:
+                self._surfaces.popitem(last=False)
+        else:
+            self._surfaces.move_to_end(key)
+        return surface
+
+    def clear(self) -> None:
+        """Drop every cached surface."""
+        self._surfaces.clear()
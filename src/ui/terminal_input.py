@@ -0,0 +1,56 @@
+import curses
+import time
+from typing import Dict, Optional, Tuple
+from src.engine.game_state import GameState
+from .input_pipeline import InputPipeline
+
+class TerminalInputHandler:
+    """Reads keys from a curses window and queues their actions.
+
+    Terminals report key presses only, never releases, so each key read
+    is queued as a press immediately followed by a release. Holding a key
+    repeats it at the terminal's own auto-repeat rate instead of DAS/ARR.
+    """
+
+    def __init__(self, window, pipeline: Optional[InputPipeline] = None):
+        """Read keys from ``window`` without blocking."""
+        self.window = window
+        window.nodelay(True)
+        self.pipeline = pipeline if pipeline is not None else InputPipeline()
+
+        # Key bindings
+        self.controls: Dict[int, str] = {
+            curses.KEY_LEFT: 'move_left',
+            curses.KEY_RIGHT: 'move_right',
+            curses.KEY_DOWN: 'soft_drop',
+            curses.KEY_UP: 'rotate_clockwise',
+            ord('z'): 'rotate_counterclockwise',
+            ord(' '): 'hard_drop',
+            ord('p'): 'pause',
+            ord('q'): 'quit',
+            27: 'quit',  # Escape
+        }
+
+        # New terminal size (columns, rows) after a resize, if any
+        self.resize_request: Optional[Tuple[int, int]] = None
+
+    def handle_input(self, game_state: GameState) -> bool:
+        """
+        Read pending keys and queue their actions on the pipeline.
+        Returns False if the game should quit, True otherwise.
+        """
+        while True:
+            key = self.window.getch()
+            now = time.perf_counter()
+            if key == -1:
+                return True
+            if key == curses.KEY_RESIZE:
+                rows, cols = self.window.getmaxyx()
+                self.resize_request = (cols, rows)
+                continue
+            action = self.controls.get(key)
+            if action == 'quit':
+                return False
+            if action:
+                self.pipeline.push(now, action, True)
+                self.pipeline.push(now, action, False)
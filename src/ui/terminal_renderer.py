@@ -0,0 +1,227 @@
+"""
+Text renderer drawing the game in a terminal with curses.
+
+Each frame is composed into a character buffer the size of the terminal
+and compared with the previous one; only the runs of character cells
+that changed are written. Steady frames therefore send a few bytes, which
+keeps the renderer cheap over SSH and serial consoles. This module does
+not import pygame.
+"""
+
+import curses
+import os
+from typing import Dict, List, Optional, Tuple
+from src.engine.board import Board
+from src.engine.game_state import GameState
+from src.engine.instrumentation import Instrumentation
+from src.engine.tetromino import Tetromino
+from .viewport import follow_piece
+
+# Curses colour of each cell colour index; curses has no orange, so L is white
+_CURSES_COLORS = {
+    1: 'COLOR_CYAN',     # I
+    2: 'COLOR_YELLOW',   # O
+    3: 'COLOR_MAGENTA',  # T
+    4: 'COLOR_GREEN',    # S
+    5: 'COLOR_RED',      # Z
+    6: 'COLOR_BLUE',     # J
+    7: 'COLOR_WHITE',    # L
+    8: 'COLOR_WHITE',    # Garbage
+}
+
+
+class TerminalRenderer:
+    """Draws the board, ghost, next piece and score as text with curses.
+
+    Offers the same ``render(game_state)`` as ``Renderer``. Boards two
+    characters per cell wider or taller than the terminal are clipped or
+    shown through a viewport that follows the active piece.
+
+    Pass a curses ``window`` to draw into it; otherwise the renderer sets
+    up the terminal itself and ``close`` restores it.
+    """
+
+    CELL = '[]'
+    GHOST = '::'
+    EMPTY = ' .'
+
+    # Character columns between the board's right border and the side panel
+    PANEL_GAP = 3
+
+    # No fonts to load in the background, unlike ``Renderer``
+    assets_ready = True
+    assets_ms = None
+
+    def __init__(self, window=None,
+                 board_size: Tuple[int, int] = (Board.WIDTH, Board.HEIGHT)):
+        """Draw into ``window``, or into the whole terminal if None."""
+        self._owns_terminal = window is None
+        if window is None:
+            # Let a lone Escape through quickly instead of waiting for a sequence
+            os.environ.setdefault('ESCDELAY', '25')
+            window = curses.initscr()
+            curses.noecho()
+            curses.cbreak()
+            window.keypad(True)
+            try:
+                curses.curs_set(0)
+            except curses.error:
+                pass  # Terminals that cannot hide the cursor
+        self.window = window
+        self._attrs = self._color_attrs()
+
+        # Frame stats shown under the score when set
+        self.instrumentation: Optional[Instrumentation] = None
+
+        self.board_size = board_size
+        # First board row shown in the viewport
+        self.view_top = 0
+        # Characters and attributes on screen, one list per terminal row
+        self._chars: Optional[List[List[str]]] = None
+        self._cell_attrs: Optional[List[List[int]]] = None
+
+    def _color_attrs(self) -> Dict[int, int]:
+        """Return the curses attribute of each cell colour index."""
+        attrs = dict.fromkeys(range(len(_CURSES_COLORS) + 1), 0)
+        try:
+            if not curses.has_colors():
+                return attrs
+            curses.start_color()
+        except curses.error:
+            return attrs  # curses not set up by the caller, or no colour support
+        for color_idx, name in _CURSES_COLORS.items():
+            curses.init_pair(color_idx, getattr(curses, name), curses.COLOR_BLACK)
+            attrs[color_idx] = curses.color_pair(color_idx)
+        attrs[8] |= curses.A_DIM
+        return attrs
+
+    def close(self) -> None:
+        """Restore the terminal if this renderer set it up."""
+        if self._owns_terminal:
+            self.window.keypad(False)
+            curses.nocbreak()
+            curses.echo()
+            curses.endwin()
+
+    def resize(self, window_size: Tuple[int, int]) -> None:
+        """Repaint everything on the next frame, after the terminal was resized."""
+        self._chars = None
+
+    def render(self, game_state: GameState) -> None:
+        """Render the frame, writing only the character cells that changed."""
+        rows, cols = self.window.getmaxyx()
+        chars = [[' '] * cols for _ in range(rows)]
+        attrs = [[0] * cols for _ in range(rows)]
+        self._compose(game_state, chars, attrs)
+
+        previous, previous_attrs = self._chars, self._cell_attrs
+        if previous is None or len(previous) != rows or len(previous[0]) != cols:
+            # Start from a blank screen, so only non-blank cells are written
+            self.window.erase()
+            previous = [[' '] * cols for _ in range(rows)]
+            previous_attrs = [[0] * cols for _ in range(rows)]
+        self._chars, self._cell_attrs = chars, attrs
+
+        written = False
+        for y in range(rows):
+            row, row_attrs = chars[y], attrs[y]
+            old, old_attrs = previous[y], previous_attrs[y]
+            if row == old and row_attrs == old_attrs:
+                continue
+            x = 0
+            while x < cols:
+                if row[x] == old[x] and row_attrs[x] == old_attrs[x]:
+                    x += 1
+                    continue
+                # Extend the run while cells keep changing and share an attribute
+                start, attr = x, row_attrs[x]
+                x += 1
+                while (x < cols and row_attrs[x] == attr
+                       and (row[x] != old[x] or row_attrs[x] != old_attrs[x])):
+                    x += 1
+                self._write(y, start, ''.join(row[start:x]), attr)
+                written = True
+        if written:
+            self.window.refresh()
+
+    def _write(self, y: int, x: int, text: str, attr: int) -> None:
+        """Write a run of characters to the terminal."""
+        try:
+            self.window.addstr(y, x, text, attr)
+        except curses.error:
+            # Writing the bottom-right cell moves the cursor off screen,
+            # which curses reports after drawing the text
+            pass
+
+    def _compose(self, game_state: GameState, chars: List[List[str]],
+                 attrs: List[List[int]]) -> None:
+        """Lay the whole frame out into the character and attribute buffers."""
+        rows = len(chars)
+        board = game_state.board
+        width = board.width
+        self.board_size = (width, board.height)
+        # One row below the board is its border
+        view_rows = max(1, min(board.height, rows - 1))
+        self.view_top = follow_piece(self.view_top, view_rows, game_state)
+        top = self.view_top
+
+        def put(y: int, x: int, text: str, attr: int = 0) -> None:
+            if 0 <= y < rows:
+                row, row_attrs = chars[y], attrs[y]
+                for i, char in enumerate(text[:max(0, len(row) - x)]):
+                    row[x + i] = char
+                    row_attrs[x + i] = attr
+
+        # Locked cells inside a |...| border
+        for y, grid_row in enumerate(board.grid[top:top + view_rows]):
+            put(y, 0, '|')
+            for x, cell in enumerate(grid_row):
+                if cell:
+                    put(y, 1 + 2 * x, self.CELL, self._attrs[cell])
+                else:
+                    put(y, 1 + 2 * x, self.EMPTY)
+            put(y, 1 + 2 * width, '|')
+        put(view_rows, 0, '+' + '-' * (2 * width) + '+')
+
+        # Ghost, then the active piece over it
+        piece = game_state.current_piece
+        if piece:
+            attr = self._attrs[piece.color]
+            ghost_y = game_state.get_ghost_position()['y']
+            x, y = game_state.piece_position['x'], game_state.piece_position['y']
+            for py, text, piece_attr in ((ghost_y, self.GHOST, attr | curses.A_DIM),
+                                         (y, self.CELL, attr)):
+                for dx, dy in piece.cells:
+                    if 0 <= py + dy - top < view_rows:
+                        put(py + dy - top, 1 + 2 * (x + dx), text, piece_attr)
+
+        # Side panel: next piece, score and status
+        panel = 2 * width + 2 + self.PANEL_GAP
+        put(0, panel, "Next:")
+        self._put_piece(put, game_state.next_piece, 1, panel)
+        put(6, panel, f"Score: {game_state.score}")
+        put(7, panel, f"Level: {game_state.level}")
+        put(8, panel, f"Lines: {game_state.lines_cleared}")
+        if game_state.game_over:
+            put(10, panel, "GAME OVER", curses.A_BOLD)
+        elif game_state.game_paused:
+            put(10, panel, "PAUSED", curses.A_BOLD)
+        if self.instrumentation is not None:
+            self._put_stats(put, self.instrumentation, 12, panel)
+
+    def _put_piece(self, put, piece: Optional[Tetromino], y: int, x: int) -> None:
+        """Lay out the next piece preview with its top-left corner at (x, y)."""
+        if not piece:
+            return
+        attr = self._attrs[piece.color]
+        for dx, dy in piece.cells:
+            put(y + dy, x + 2 * dx, self.CELL, attr)
+
+    @staticmethod
+    def _put_stats(put, instrumentation: Instrumentation, y: int, x: int) -> None:
+        """Lay out recent frame timings and event counts."""
+        summary = instrumentation.summary()
+        counters = instrumentation.counters
+        put(y, x, f"frame {summary['total_ms']:.1f} ms (max {summary['max_ms']:.1f})")
+        put(y + 1, x, f"render {summary['render_ms']:.1f} ms")
+        put(y + 2, x, f"locks {counters['locks']}  lines {counters['lines']}")
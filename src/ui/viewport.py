@@ -0,0 +1,25 @@
+"""
+Scrolling of board viewports, shared by the renderers.
+
+Boards taller than the screen are shown through a window of rows that
+follows the active piece. This module does not import pygame.
+"""
+
+from src.engine.game_state import GameState
+
+
+def follow_piece(view_top: int, view_rows: int, game_state: GameState) -> int:
+    """Return the first board row to show so the active piece stays in view.
+
+    The viewport only moves when the piece nears its top or bottom edge,
+    and then recentres a third of the way down, so it scrolls in steps
+    rather than every row.
+    """
+    height = game_state.board.height
+    if view_rows >= height or not game_state.current_piece:
+        return max(0, min(view_top, height - view_rows))
+    y = game_state.piece_position['y']
+    margin = view_rows // 4
+    if not view_top + margin <= y < view_top + view_rows - margin - 4:
+        view_top = min(max(0, y - view_rows // 3), height - view_rows)
+    return view_top
@@ -0,0 +1,76 @@
+import unittest
+from src.ai.player import AIPlayer, board_features, lock_piece, rows_hash
+from src.ai.transposition import TranspositionTable
+from src.engine.bitboard import BitBoard
+from src.engine.game_state import GameState
+from src.engine.randomizer import PieceGenerator
+
+class TestAIPlayer(unittest.TestCase):
+    def test_transposition_table_evicts_lru(self):
+        """The least recently used entry is evicted first."""
+        table = TranspositionTable(max_entries=2)
+        table.put('a', 1.0)
+        table.put('b', 2.0)
+        self.assertEqual(table.get('a'), 1.0)
+        table.put('c', 3.0)
+        self.assertIsNone(table.get('b'))
+        self.assertEqual(len(table), 2)
+
+    def test_board_features(self):
+        """Heights, holes and bumpiness are read from row masks."""
+        rows = [0] * 17 + [0b0000000011, 0b0000000001, 0b0000000111]
+        self.assertEqual(board_features(rows, 10), (3 + 3 + 1, 1, 0 + 2 + 1))
+
+    def test_plays_and_clears_lines(self):
+        """The AI survives and clears lines within a bounded node budget."""
+        game = GameState(board=BitBoard(), randomizer=PieceGenerator(2, 'bag'))
+        ai = AIPlayer(depth=2, beam_width=3, node_budget=200)
+        for _ in range(60):
+            self.assertTrue(ai.play_piece(game))
+        self.assertFalse(game.game_over)
+        self.assertGreaterEqual(game.lines_cleared, 15)
+        self.assertGreater(ai.table.hits, 0)
+
+    def test_lock_piece_updates_hash(self):
+        """The hash returned by lock_piece matches hashing the new rows."""
+        game = GameState(board=BitBoard(), randomizer=PieceGenerator(4, 'bag'))
+        ai = AIPlayer(depth=1)
+        for _ in range(40):
+            rows = tuple(game.board.get_row_masks())
+            piece = game.current_piece
+            for placement in game.get_placements():
+                locked = lock_piece(rows, 10, piece.shape_name, placement.rotation,
+                                    placement.x, placement.y, rows_hash(rows))
+                if locked is not None:
+                    self.assertEqual(locked[2], rows_hash(locked[0]))
+            ai.play_piece(game)
+
+    def test_node_budget_is_checked_every_placement(self):
+        """Search never scores more than one placement past its node budget."""
+        for budget in (0, 5, 40, 100):
+            ai = AIPlayer(depth=2, beam_width=8, node_budget=budget)
+            # The second game runs with a warm table
+            for _ in range(2):
+                game = GameState(board=BitBoard(), randomizer=PieceGenerator(2, 'bag'))
+                for _ in range(15):
+                    if not ai.play_piece(game):
+                        break
+                    self.assertLessEqual(ai.nodes, max(budget, 1))
+
+    def test_budgeted_search_ignores_cache_contents(self):
+        """With a node budget, a warm table chooses the same moves as a cold one."""
+        def moves(ai, seed):
+            game = GameState(board=BitBoard(), randomizer=PieceGenerator(seed, 'bag'))
+            chosen = []
+            for _ in range(25):
+                placement = ai.choose(game)
+                chosen.append((placement.rotation, placement.x, placement.y))
+                ai.play_piece(game)
+            return chosen
+
+        warm = AIPlayer(depth=2, beam_width=8, node_budget=60)
+        cold = moves(warm, 5)
+        self.assertEqual(moves(warm, 5), cold)
+
+if __name__ == '__main__':
+    unittest.main()
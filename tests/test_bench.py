@@ -0,0 +1,30 @@
+import unittest
+from src.bench.fixtures import midgame, tetris_ready_board
+from src.bench.suite import BENCHMARKS, compare, run_benchmarks, to_json
+from src.engine.bitboard import BitBoard
+from src.engine.board import Board
+
+class TestBenchmarks(unittest.TestCase):
+    def test_fixtures_are_deterministic(self):
+        """Fixtures depend only on their seed and agree across board types."""
+        self.assertEqual(midgame(Board, seed=3).board.grid,
+                         midgame(BitBoard, seed=3).board.grid)
+        board = tetris_ready_board(BitBoard)
+        self.assertEqual(board.grid, tetris_ready_board(Board).grid)
+        self.assertEqual(board.clear_lines(), 4)
+
+    def test_run_and_compare(self):
+        """Results round-trip through JSON and slowdowns are flagged."""
+        names = [name for name in BENCHMARKS if name.startswith('board.')]
+        results = list(run_benchmarks(names, repeats=1, scale=0.01))
+        self.assertEqual([r.name for r in results], names)
+        baseline = to_json(results)
+        self.assertEqual(compare(baseline, results), [])
+
+        slower = [r._replace(ns_per_op=r.ns_per_op * 2) for r in results]
+        regressions = compare(baseline, slower, threshold=0.5)
+        self.assertEqual([r.name for r in regressions], names)
+        self.assertAlmostEqual(regressions[0].ratio, 2.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,240 @@
+import random
+import unittest
+from unittest import mock
+from src.engine import board as board_module
+from src.engine.board import Board
+from src.engine.bitboard import BitBoard
+from src.engine.game_state import GameState
+from src.engine.randomizer import PieceGenerator
+from src.engine.tetromino import Tetromino
+
+def check_derived_state(test, board):
+    """Assert column tops, hash and row masks all match the cells."""
+    grid = board.get_grid_copy()
+    expected = [next((y for y in range(board.height) if grid[y][x]),
+                     board.height) for x in range(board.width)]
+    test.assertEqual(board.column_tops, expected)
+    test.assertEqual(board.hash, board.compute_hash())
+    if isinstance(board, BitBoard):
+        test.assertEqual(board.rows, Board.get_row_masks(board))
+
+class TestBitBoard(unittest.TestCase):
+    def test_collision_matches_board(self):
+        """BitBoard collision checks agree with the list-based Board."""
+        board, bitboard = Board(), BitBoard()
+        for name in ('I', 'T', 'L'):
+            piece = Tetromino(name)
+            board.place_piece(piece, 3, 17)
+            bitboard.place_piece(piece, 3, 17)
+        for name in Tetromino.SHAPES:
+            piece = Tetromino(name)
+            for x in range(-3, Board.WIDTH + 1):
+                for y in range(-2, Board.HEIGHT + 1):
+                    self.assertEqual(board.is_valid_move(piece, x, y),
+                                     bitboard.is_valid_move(piece, x, y),
+                                     (name, x, y))
+
+    def test_clear_lines_matches_board(self):
+        """Line clears leave identical grids on both board types."""
+        rng = random.Random(7)
+        board, bitboard = Board(), BitBoard()
+        for y in range(12, Board.HEIGHT):
+            full = rng.random() < 0.5
+            for x in range(Board.WIDTH):
+                if full or rng.random() < 0.7:
+                    board.set_cell(x, y, 3)
+                    bitboard.set_cell(x, y, 3)
+        self.assertEqual(board.clear_lines(), bitboard.clear_lines())
+        self.assertEqual(board.get_grid_copy(), bitboard.get_grid_copy())
+        for y, row in enumerate(bitboard.grid):
+            mask = sum(1 << x for x, cell in enumerate(row) if cell)
+            self.assertEqual(bitboard.rows[y], mask)
+
+    def test_game_over(self):
+        """A filled top row ends the game."""
+        bitboard = BitBoard()
+        self.assertFalse(bitboard.is_game_over())
+        bitboard.place_piece(Tetromino('O'), 4, -1)
+        self.assertTrue(bitboard.is_game_over())
+
+class TestColumnTops(unittest.TestCase):
+    def test_tops_and_ghost_match_brute_force(self):
+        """Column tops stay exact and ghost drops match a row-by-row scan."""
+        for board_type in (Board, BitBoard):
+            game = GameState(board=board_type(), randomizer=PieceGenerator(4, 'bag'))
+            rng = random.Random(4)
+            while not game.game_over and game.pieces_placed < 300:
+                board = game.board
+                expected = [next((y for y in range(Board.HEIGHT)
+                                  if board.grid[y][x]), Board.HEIGHT)
+                            for x in range(Board.WIDTH)]
+                self.assertEqual(board.column_tops, expected)
+
+                piece, pos = game.current_piece, game.piece_position
+                for x in range(-2, Board.WIDTH):
+                    for y in range(-1, Board.HEIGHT):
+                        if not board.is_valid_move(piece, x, y):
+                            continue
+                        ghost_y = y
+                        while board.is_valid_move(piece, x, ghost_y + 1):
+                            ghost_y += 1
+                        self.assertEqual(board.get_ghost_position(piece, x, y), ghost_y)
+
+                # Mostly low drops so lines clear, with stray slides that
+                # leave overhangs and holes
+                lowest = max(game.get_placements(),
+                             key=lambda p: (p.y, rng.random()))
+                for action in lowest.path:
+                    game.apply_action(action)
+                if rng.random() < 0.3:
+                    game.apply_action(rng.choice(['move_left', 'move_right']))
+            self.assertGreater(game.lines_cleared, 0)
+
+class TestZobristHash(unittest.TestCase):
+    def test_incremental_hash_matches_full_rehash(self):
+        """Placing pieces and clearing lines keeps the hash exact."""
+        for board_type in (Board, BitBoard):
+            game = GameState(board=board_type(), randomizer=PieceGenerator(9))
+            rng = random.Random(9)
+            while not game.game_over and game.lines_cleared < 3:
+                game.apply_action(rng.choice(['move_left', 'move_right',
+                                              'rotate_clockwise', 'hard_drop']))
+                self.assertEqual(game.board.hash, game.board.compute_hash())
+            self.assertNotEqual(game.board.hash, 0)
+
+            board = board_type()
+            board.place_piece(Tetromino('T'), 3, 15)
+            board.place_piece(Tetromino('I'), 0, 18)
+            board.place_piece(Tetromino('I'), 4, 18)
+            board.place_piece(Tetromino('O'), 8, 18)
+            self.assertEqual(board.clear_lines(), 1)
+            self.assertEqual(board.hash, board.compute_hash())
+        self.assertEqual(Board().hash, 0)
+
+    def test_equal_positions_hash_equal(self):
+        """Both board types hash the same contents identically."""
+        board, bitboard = Board(), BitBoard()
+        for target in (board, bitboard):
+            target.place_piece(Tetromino('T'), 2, 18)
+        self.assertEqual(board.hash, bitboard.hash)
+        board.place_piece(Tetromino('O'), 6, 18)
+        self.assertNotEqual(board.hash, bitboard.hash)
+
+    def test_game_state_hash_includes_piece(self):
+        """Moving or rotating the active piece changes the position hash."""
+        game = GameState(randomizer=PieceGenerator(1))
+        start = game.hash
+        game.move_piece(1, 0)
+        self.assertNotEqual(game.hash, start)
+        game.move_piece(-1, 0)
+        self.assertEqual(game.hash, start)
+
+class TestBoardSize(unittest.TestCase):
+    def test_sizes_are_per_instance(self):
+        """Boards of any supported size play with exact derived state."""
+        for board_type in (Board, BitBoard):
+            for width, height in ((4, 8), (13, 37), (64, 1000)):
+                board = board_type(width, height)
+                self.assertEqual((len(board.grid), len(board.grid[0])), (height, width))
+                game = GameState(board=board, randomizer=PieceGenerator(6))
+                self.assertEqual(game.piece_position['x'],
+                                 (width - game.current_piece.get_width()) // 2)
+                rng = random.Random(6)
+                while not game.game_over and game.pieces_placed < 60:
+                    for _ in range(rng.randrange(width)):
+                        game.move_piece(rng.choice((-1, 1)), 0)
+                    game.hard_drop()
+                    if game.pieces_placed % 5 == 0:
+                        game.add_garbage([rng.randrange(width)])
+                    check_derived_state(self, board)
+        # The standard board stays the default
+        self.assertEqual((Board().width, Board().height), (Board.WIDTH, Board.HEIGHT))
+        for size in ((3, 20), (65, 20), (10, 3)):
+            with self.assertRaises(ValueError):
+                Board(*size)
+
+    def test_clear_on_tall_board(self):
+        """Clears on a tall, wide board shift only what sits above them."""
+        for board_type in (Board, BitBoard):
+            board = board_type(64, 10_000)
+            for y in (9_996, 9_998):
+                for x in range(1, 64):
+                    board.set_cell(x, y, 8)
+            board.set_cell(5, 9_995, 3)
+            board.clear_lines()
+            vertical_i = Tetromino('I')
+            vertical_i.rotate()
+            board.place_piece(vertical_i, -2, 9_996)
+            self.assertEqual(board.clear_lines(), 2)
+            self.assertEqual(board.grid[9_997][5], 3)
+            self.assertEqual(board.grid[9_999][0], 1)
+            check_derived_state(self, board)
+
+    def test_clear_cost_independent_of_stack_height(self):
+        """Clears near the floor or the stack top rehash as few rows on any stack."""
+        vertical_i = Tetromino('I')
+        vertical_i.rotate()
+
+        def rows_hashed(board_type, stack, clear_at_top):
+            board = board_type(64, 2_000)
+            holes = [1 + y % 63 for y in range(stack - 4)] + [0] * 4
+            if clear_at_top:
+                holes = holes[-4:] + holes[:-4]
+            board.add_garbage(holes)
+            hashed = []
+            def block_key(row_hashes, y):
+                hashed.append(len(row_hashes))
+                return real_block_key(row_hashes, y)
+            y = board.height - (stack if clear_at_top else 4)
+            with mock.patch.object(board_module, 'block_key', block_key):
+                board.place_piece(vertical_i, -2, y)
+                self.assertEqual(board.clear_lines(), 4)
+                board.add_garbage([3, 5])
+            check_derived_state(self, board)
+            return sum(hashed)
+
+        real_block_key = board_module.block_key
+        for board_type in (Board, BitBoard):
+            for clear_at_top in (False, True):
+                costs = [rows_hashed(board_type, stack, clear_at_top)
+                         for stack in (8, 200, 1_600)]
+                self.assertEqual(len(set(costs)), 1, costs)
+                self.assertLessEqual(costs[0], 24)
+
+class TestGarbage(unittest.TestCase):
+    def test_garbage_and_clears_keep_state_exact(self):
+        """Interleaved garbage, placements and clears keep derived state exact."""
+        for board_type in (Board, BitBoard):
+            game = GameState(board=board_type(), randomizer=PieceGenerator(2))
+            rng = random.Random(2)
+            while not game.game_over and game.pieces_placed < 200:
+                placement = rng.choice(game.get_placements())
+                for action in placement.path:
+                    game.apply_action(action)
+                if rng.random() < 0.3:
+                    game.add_garbage([rng.randrange(Board.WIDTH)
+                                      for _ in range(rng.randint(1, 3))])
+                check_derived_state(self, game.board)
+
+    def test_garbage_lifts_stack(self):
+        """Garbage rows enter at the bottom with one hole and lift the stack."""
+        for board_type in (Board, BitBoard):
+            board = board_type()
+            board.place_piece(Tetromino('O'), 0, 18)
+            self.assertFalse(board.add_garbage([3, 7]))
+            self.assertEqual(board.grid[16][:2], [2, 2])
+            self.assertEqual(board.grid[19][7], Board.EMPTY_CELL)
+            self.assertEqual(sum(1 for cell in board.grid[18] if cell), Board.WIDTH - 1)
+            check_derived_state(self, board)
+            # Filling the bottom row's hole clears it and drops everything back
+            vertical_i = Tetromino('I')
+            vertical_i.rotate()
+            board.place_piece(vertical_i, 5, 16)
+            self.assertEqual(board.clear_lines(), 1)
+            self.assertEqual(board.grid[19][3], Board.EMPTY_CELL)
+            check_derived_state(self, board)
+            self.assertTrue(board.add_garbage([0] * 18))
+            check_derived_state(self, board)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+import unittest
+from src.engine.bitboard import BitBoard
+from src.engine.headless import HeadlessGame
+
+class TestHeadlessGame(unittest.TestCase):
+    def test_step_returns_reward_and_done(self):
+        """Hard drops until game over report score deltas and a done flag."""
+        env = HeadlessGame(board_factory=BitBoard)
+        total, done, steps = 0, False, 0
+        while not done:
+            score_before = env.game_state.score
+            state, reward, done = env.step('hard_drop')
+            self.assertEqual(reward, state.score - score_before)
+            total += reward
+            steps += 1
+            self.assertLess(steps, 1000)
+        self.assertEqual(total, env.game_state.score)
+        self.assertEqual(env.step(0), (env.game_state, 0, True))
+
+    def test_gravity_ticks(self):
+        """A no-op step advances the piece by the configured gravity."""
+        env = HeadlessGame(gravity_ticks=3)
+        start_y = env.game_state.piece_position['y']
+        state, _, _ = env.step('noop')
+        self.assertEqual(state.piece_position['y'], start_y + 3)
+
+    def test_seed_reproduces_game(self):
+        """Two environments with the same seed play out identically."""
+        games = [HeadlessGame(seed=42), HeadlessGame(seed=42)]
+        for action in [6, 1, 6, 4, 2, 6, 5, 6] * 3:
+            results = [env.step(action)[1:] for env in games]
+            self.assertEqual(results[0], results[1])
+        self.assertEqual(games[0].game_state.board.grid,
+                         games[1].game_state.board.grid)
+
+    def test_engine_does_not_import_pygame(self):
+        """The engine package can be driven without pygame."""
+        code = ("import sys; import src.engine; "
+                "src.engine.HeadlessGame().step('hard_drop'); "
+                "sys.exit('pygame' in sys.modules)")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(subprocess.call([sys.executable, '-c', code], cwd=root), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from src.engine.game_state import GameState
+from src.engine.instrumentation import Instrumentation
+from src.engine.randomizer import PieceGenerator
+from src.ui.input_pipeline import InputPipeline
+
+def new_game():
+    game = GameState(randomizer=PieceGenerator(0))
+    game.current_piece.reset('O')
+    game.piece_position = {'x': 4, 'y': 5}
+    return game
+
+class TestInputPipeline(unittest.TestCase):
+    def test_das_then_arr(self):
+        """A held shift moves once, waits for DAS, then repeats at ARR."""
+        game = new_game()
+        pipeline = InputPipeline(das_ms=100, arr_ms=20)
+        pipeline.push(1.0, 'move_left')
+        pipeline.advance(game, 1.05)
+        self.assertEqual(game.piece_position['x'], 3)
+        pipeline.advance(game, 1.099)
+        self.assertEqual(game.piece_position['x'], 3)
+        pipeline.advance(game, 1.145)
+        # Repeats at 1.100, 1.120 and 1.140
+        self.assertEqual(game.piece_position['x'], 0)
+
+    def test_release_stops_repeat(self):
+        """Releasing before DAS expires gives a single move."""
+        game = new_game()
+        pipeline = InputPipeline(das_ms=100, arr_ms=20)
+        pipeline.push(1.0, 'move_right')
+        pipeline.push(1.05, 'move_right', pressed=False)
+        pipeline.advance(game, 2.0)
+        self.assertEqual(game.piece_position['x'], 5)
+
+    def test_inputs_in_one_tick_keep_their_order(self):
+        """Several inputs inside one tick are applied in timestamp order."""
+        game = new_game()
+        game.current_piece.reset('I')
+        game.piece_position = {'x': 3, 'y': 5}
+        pipeline = InputPipeline()
+        pipeline.push(1.000, 'rotate_clockwise')
+        pipeline.push(1.004, 'move_right')
+        pipeline.push(1.008, 'move_right', pressed=False)
+        pipeline.push(1.012, 'hard_drop')
+        pipeline.advance(game, 1.016)
+        self.assertEqual(game.pieces_placed, 1)
+        # The vertical I sits in column 6 (x 4 + offset 2)
+        self.assertTrue(all(game.board.grid[y][6] for y in range(16, 20)))
+
+    def test_instant_arr_reaches_wall(self):
+        """An ARR of 0 shifts to the wall once DAS has charged."""
+        game = new_game()
+        pipeline = InputPipeline(das_ms=100, arr_ms=0)
+        pipeline.push(1.0, 'move_right')
+        pipeline.advance(game, 1.1)
+        self.assertEqual(game.piece_position['x'], 8)
+
+    def test_latency_reported_on_present(self):
+        """Applied actions report the time until the next presented frame."""
+        stats = Instrumentation()
+        game = new_game()
+        pipeline = InputPipeline(instrumentation=stats)
+        pipeline.push(1.0, 'move_left')
+        pipeline.advance(game, 1.01)
+        pipeline.presented(1.025)
+        self.assertEqual(len(stats.latencies), 1)
+        action, latency_ms = stats.latencies[0]
+        self.assertEqual(action, 'move_left')
+        self.assertAlmostEqual(latency_ms, 25.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import json
+import os
+import tempfile
+import unittest
+from src.engine.game_state import GameState
+from src.engine.instrumentation import Instrumentation
+from src.engine.randomizer import PieceGenerator
+
+class TestInstrumentation(unittest.TestCase):
+    def test_counts_game_events(self):
+        """Spawns, locks and lines match the game's own totals."""
+        stats = Instrumentation()
+        game = GameState(randomizer=PieceGenerator(6, 'bag'), instrumentation=stats)
+        for _ in range(30):
+            if game.game_over:
+                break
+            game.rotate_piece()
+            game.hard_drop()
+        self.assertEqual(stats.counters['locks'], game.pieces_placed)
+        self.assertEqual(stats.counters['spawns'], game.pieces_placed + 1)
+        self.assertEqual(stats.counters['lines'], game.lines_cleared)
+        self.assertGreater(stats.counters['rotations'], 0)
+
+    def test_kicks_counted_against_walls(self):
+        """A rotation that only fits after a kick counts as a kick."""
+        stats = Instrumentation()
+        game = GameState(randomizer=PieceGenerator(0), instrumentation=stats)
+        game.current_piece.reset('I')
+        game.rotate_piece()
+        while game.move_piece(1, 0):
+            pass
+        game.rotate_piece()
+        self.assertEqual(stats.counters['rotations'], 2)
+        self.assertEqual(stats.counters['kicks'], 1)
+
+    def test_frame_ring_buffer(self):
+        """Only the most recent frames are kept, and they dump to JSON."""
+        stats = Instrumentation(history=5)
+        for _ in range(12):
+            stats.begin_frame()
+            for phase in Instrumentation.PHASES:
+                stats.lap(phase)
+            stats.end_frame()
+        self.assertEqual([f.frame for f in stats.frames], list(range(7, 12)))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'stats.json')
+            stats.dump_json(path)
+            with open(path) as f:
+                data = json.load(f)
+        self.assertEqual(len(data['frames']), 5)
+        self.assertIn('render_ms', data['summary'])
+
+    def test_disabled_by_default(self):
+        """Games carry no instrumentation unless one is attached."""
+        self.assertIsNone(GameState().instrumentation)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from src.engine.bitboard import BitBoard
+from src.engine.game_state import GameState
+from src.engine.randomizer import PieceGenerator
+from src.engine.tetromino import Tetromino
+
+def new_game(seed=0):
+    game = GameState(board=BitBoard(), randomizer=PieceGenerator(seed, 'bag'))
+    return game
+
+class TestPlacements(unittest.TestCase):
+    def test_empty_board_counts(self):
+        """Every column of every distinct rotation is reachable."""
+        expected = {'I': 17, 'O': 9, 'T': 34, 'S': 17, 'Z': 17, 'J': 34, 'L': 34}
+        for name, count in expected.items():
+            game = new_game()
+            game.current_piece = Tetromino(name)
+            self.assertEqual(len(game.get_placements()), count, name)
+
+    def test_paths_reach_placements(self):
+        """Replaying each path locks the piece where the placement says."""
+        game = new_game(4)
+        for _ in range(6):
+            game.hard_drop()
+        for placement in game.get_placements():
+            trial = new_game(4)
+            for _ in range(6):
+                trial.hard_drop()
+            piece = trial.current_piece
+            for action in placement.path[:-1]:
+                self.assertTrue(trial.apply_action(action), placement)
+            self.assertEqual((piece.rotation, trial.piece_position['x'],
+                              trial.get_ghost_position()['y']),
+                             placement[:3])
+
+    def test_tuck_under_overhang(self):
+        """Soft drops and sideways moves reach slots under overhangs."""
+        game = new_game()
+        board = game.board
+        # A roof over the four left columns of the bottom two rows
+        for x in range(0, 4):
+            board.grid[17][x] = 1
+            board.rows[17] |= 1 << x
+        game.current_piece = Tetromino('O')
+        tucked = [p for p in game.get_placements() if p.y == 18 and p.x < 3]
+        self.assertTrue(tucked)
+        self.assertIn('soft_drop', tucked[0].path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+from src.engine.game_state import GameState
+from src.engine.randomizer import PieceGenerator
+from src.engine.tetromino import Tetromino
+
+class TestPieceGenerator(unittest.TestCase):
+    def test_seed_reproduces_sequence(self):
+        """Generators with the same seed and policy agree."""
+        for policy in PieceGenerator.POLICIES:
+            a = PieceGenerator(5, policy, block_size=10)
+            b = PieceGenerator(5, policy, block_size=10)
+            self.assertEqual([a.next() for _ in range(50)],
+                             [b.next() for _ in range(50)])
+
+    def test_bag_contains_every_shape(self):
+        """Each consecutive bag of seven holds all shapes once."""
+        generator = PieceGenerator(1, 'bag', block_size=20)
+        for _ in range(10):
+            bag = [generator.next() for _ in range(7)]
+            self.assertEqual(sorted(bag), sorted(Tetromino.SHAPES))
+
+    def test_spawn_recycles_pieces(self):
+        """Spawning reuses the outgoing piece object for the preview."""
+        game = GameState(randomizer=PieceGenerator(3, 'bag'))
+        first, second = game.current_piece, game.next_piece
+        game.hard_drop()
+        self.assertIs(game.current_piece, second)
+        self.assertIs(game.next_piece, first)
+        self.assertEqual(game.next_piece.rotation, 0)
+
+if __name__ == '__main__':
+    unittest.main()
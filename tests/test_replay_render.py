@@ -0,0 +1,80 @@
+import os
+import random
+import tempfile
+import unittest
+from src.engine.board import Board
+from src.engine.game_state import GameState
+from src.engine.randomizer import PieceGenerator
+from src.engine.replay import Replay, ReplayPlayer, ReplayRecorder
+
+try:
+    import pygame
+    from src.ui.replay_render import (RAW_FILE, OffscreenRenderer, count_frames,
+                                      render_replay)
+except ImportError:  # pygame is only needed by the UI
+    pygame = None
+
+SIZE = (480, 360)
+
+def record_replay(seed, ticks=150):
+    """Record a game of random actions, returning the replay."""
+    rng = random.Random(seed)
+    recorder = ReplayRecorder(seed, piece_policy='bag')
+    game = recorder.make_game()
+    for _ in range(ticks):
+        action = rng.choice([0] * 4 + list(range(1, 7)))
+        recorder.record(action)
+        game.step(action)
+    return Replay(recorder.to_bytes())
+
+def expected_frame(replay, tick):
+    """Return the raw RGB frame of the game at the start of ``tick``."""
+    renderer = OffscreenRenderer(SIZE)
+    renderer.render(ReplayPlayer(replay).seek(tick).game_state)
+    return pygame.image.tobytes(renderer.screen, 'RGB')
+
+@unittest.skipIf(pygame is None, "pygame is not installed")
+class TestReplayRender(unittest.TestCase):
+    def test_raw_frames_independent_of_workers(self):
+        """Workers write the same raw frames as a single process."""
+        replay = record_replay(4)
+        frames = []
+        with tempfile.TemporaryDirectory() as out:
+            for workers in (1, 3):
+                path = os.path.join(out, str(workers))
+                written = sum(render_replay(replay, path, 'raw', every=5,
+                                            window_size=SIZE, workers=workers))
+                self.assertEqual(written, count_frames(replay, 5))
+                with open(os.path.join(path, RAW_FILE), 'rb') as f:
+                    frames.append(f.read())
+        self.assertEqual(frames[0], frames[1])
+        frame_bytes = SIZE[0] * SIZE[1] * 3
+        self.assertEqual(len(frames[0]), count_frames(replay, 5) * frame_bytes)
+        self.assertEqual(frames[0][7 * frame_bytes:8 * frame_bytes],
+                         expected_frame(replay, 35))
+
+    def test_png_frames(self):
+        """PNG frames are numbered by frame and show the replayed game."""
+        replay = record_replay(9)
+        with tempfile.TemporaryDirectory() as out:
+            sum(render_replay(replay, out, 'png', every=50, window_size=SIZE,
+                              workers=2))
+            names = sorted(os.listdir(out))
+            self.assertEqual(names, [f"frame_{i:06d}.png" for i in range(4)])
+            image = pygame.image.load(os.path.join(out, names[2]))
+        self.assertEqual(pygame.image.tobytes(image, 'RGB'), expected_frame(replay, 100))
+
+    def test_hud_fits_wide_boards(self):
+        """Boards with no room for the score column get the HUD above them."""
+        renderer = OffscreenRenderer((800, 600), (64, 20))
+        self.assertTrue(renderer.hud_inline)
+        renderer.render(GameState(board=Board(64, 20), randomizer=PieceGenerator(1)))
+        strip = renderer.screen.subsurface(pygame.Rect(
+            renderer.board_offset_x, renderer.board_offset_y - 40,
+            64 * renderer.cell_size, 30))
+        self.assertNotEqual(pygame.transform.average_color(strip)[:3],
+                            renderer.BACKGROUND)
+        self.assertFalse(OffscreenRenderer((800, 600)).hud_inline)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+import random
+import unittest
+from src.engine.game_state import GameState
+from src.engine.headless import HeadlessGame
+from src.engine.randomizer import PieceGenerator
+from src.engine.tetromino import Tetromino
+from src.net.rollback import DesyncError, RollbackSession, predict_repeat
+from src.net.versus import VersusMatch
+
+def random_inputs(rng, ticks):
+    """Return mostly idle per-tick inputs with occasional actions."""
+    return [rng.choice(HeadlessGame.ACTIONS) if rng.random() < 0.2 else 'noop'
+            for _ in range(ticks)]
+
+def play_over_link(seed, ticks, max_delay, predict=None):
+    """Play both peers of a match over a link with random per-input delay.
+
+    Returns the two sessions, the inputs each player made and every
+    checksum each peer sent.
+    """
+    rng = random.Random(seed)
+    kwargs = {'predict': predict} if predict else {}
+    sessions = [RollbackSession(VersusMatch(seed), player, **kwargs)
+                for player in (0, 1)]
+    inputs = [random_inputs(rng, ticks), random_inputs(rng, ticks)]
+    in_flight = []  # (arrival time, receiver, kind, tick, value)
+    sent_checksums = [{}, {}]
+    now = 0
+    while min(session.tick for session in sessions) < ticks:
+        now += 1
+        arrived = [message for message in in_flight if message[0] <= now]
+        in_flight = [message for message in in_flight if message[0] > now]
+        for _, receiver, kind, tick, value in arrived:
+            if kind == 'input':
+                sessions[receiver].add_remote_input(tick, value)
+            else:
+                sessions[receiver].add_remote_checksum(tick, value)
+        for player, session in enumerate(sessions):
+            if session.tick >= ticks:
+                continue
+            tick = session.add_local_input(inputs[player][session.tick])
+            in_flight.append((now + rng.randint(0, max_delay), 1 - player,
+                              'input', tick, inputs[player][tick]))
+            session.advance()
+            for tick in range(session.confirmed_tick + 1):
+                checksum = session.checksum(tick)
+                if checksum is not None and tick not in sent_checksums[player]:
+                    sent_checksums[player][tick] = checksum
+                    in_flight.append((now + rng.randint(0, max_delay), 1 - player,
+                                      'checksum', tick, checksum))
+    for _, receiver, kind, tick, value in in_flight:
+        if kind == 'input':
+            sessions[receiver].add_remote_input(tick, value)
+    for session in sessions:
+        session.synchronize()
+    return sessions, inputs, sent_checksums
+
+class TestDeterminism(unittest.TestCase):
+    def test_pieces_ignore_global_random(self):
+        """Pieces never draw from, or depend on, the global random module."""
+        random.seed(5)
+        state = random.getstate()
+        Tetromino()
+        game = GameState(randomizer=PieceGenerator(3))
+        for _ in range(20):
+            game.hard_drop()
+        self.assertEqual(random.getstate(), state)
+
+        def sequence():
+            game = GameState(randomizer=PieceGenerator(3))
+            names = []
+            for _ in range(20):
+                names.append(game.current_piece.shape_name)
+                random.random()
+                game.hard_drop()
+            return names
+        random.seed(1)
+        first = sequence()
+        random.seed(2)
+        self.assertEqual(sequence(), first)
+
+    def test_match_is_a_function_of_seed_and_inputs(self):
+        """The same seed and inputs give the same checksums, tick by tick."""
+        inputs = list(zip(random_inputs(random.Random(1), 600),
+                          random_inputs(random.Random(2), 600)))
+        checksums = []
+        for _ in range(2):
+            match = VersusMatch(9)
+            seen = []
+            for tick_inputs in inputs:
+                match.step(tick_inputs)
+                seen.append(match.checksum())
+            checksums.append(seen)
+        self.assertEqual(checksums[0], checksums[1])
+        self.assertEqual(len(set(checksums[0])), len(checksums[0]))
+
+    def test_snapshot_restore_round_trip(self):
+        """Restoring a match snapshot restores its checksum and future."""
+        match = VersusMatch(4)
+        rng = random.Random(0)
+        for _ in range(200):
+            match.step((rng.choice(HeadlessGame.ACTIONS), 'noop'))
+        snapshot = match.snapshot()
+        checksum = match.checksum()
+        future = random_inputs(rng, 100)
+        for action in future:
+            match.step((action, action))
+        after = match.checksum()
+        match.restore(snapshot)
+        self.assertEqual(match.checksum(), checksum)
+        for action in future:
+            match.step((action, action))
+        self.assertEqual(match.checksum(), after)
+
+class TestRollbackSession(unittest.TestCase):
+    def test_peers_converge_over_laggy_link(self):
+        """Both peers end in the state the true inputs produce, without desyncs."""
+        for predict in (None, predict_repeat):
+            sessions, inputs, sent = play_over_link(3, 900, 6, predict)
+            reference = VersusMatch(3)
+            for tick_inputs in zip(*inputs):
+                reference.step(tick_inputs)
+            for session in sessions:
+                self.assertEqual(session.match.checksum(), reference.checksum())
+                self.assertGreater(session.rollbacks, 0)
+            common = sent[0].keys() & sent[1].keys()
+            self.assertGreater(len(common), 800)
+            self.assertTrue(all(sent[0][tick] == sent[1][tick] for tick in common))
+
+    def test_stalls_at_rollback_limit(self):
+        """A peer never predicts more than max_rollback ticks ahead."""
+        session = RollbackSession(VersusMatch(0), 0, max_rollback=4)
+        self.assertEqual([session.advance() for _ in range(6)],
+                         [True] * 4 + [False] * 2)
+        self.assertEqual(session.tick, 4)
+        session.add_remote_input(0, 'hard_drop')
+        self.assertTrue(session.advance())
+        self.assertEqual((session.rollbacks, session.resimulated_ticks), (1, 4))
+        self.assertEqual(session.tick, 5)
+
+    def test_desync_is_detected(self):
+        """A peer whose state diverges fails the next checksum comparison."""
+        sessions = [RollbackSession(VersusMatch(1), player) for player in (0, 1)]
+        for tick in range(10):
+            for player, session in enumerate(sessions):
+                session.add_local_input('noop')
+                sessions[1 - player].add_remote_input(tick, 'noop')
+            for session in sessions:
+                session.advance()
+        sessions[1].add_remote_checksum(3, sessions[0].checksum(3))
+        sessions[1].match.games[0].score += 1
+        sessions[0].add_local_input('noop')
+        sessions[1].add_remote_input(10, 'noop')
+        sessions[0].add_remote_input(10, 'noop')
+        for session in sessions:
+            session.advance()
+        with self.assertRaises(DesyncError) as raised:
+            sessions[0].add_remote_checksum(10, sessions[1].checksum(10))
+        self.assertEqual(raised.exception.tick, 10)
+
+if __name__ == '__main__':
+    unittest.main()
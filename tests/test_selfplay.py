@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+import unittest
+from src.sim.parallel import partition, run_partitioned
+from src.sim.selfplay import play_game, run_selfplay
+
+def failing_range(part, bad):
+    """Yield the range's items, raising on ``bad``."""
+    for item in range(*part):
+        if item == bad:
+            raise ValueError(item)
+        yield item
+
+class TestSelfPlay(unittest.TestCase):
+    def test_partition_covers_seeds(self):
+        """Seed ranges are contiguous and cover every game exactly once."""
+        ranges = partition(10, 4, start=100)
+        self.assertEqual(len(ranges), 4)
+        seeds = [seed for start, stop in ranges for seed in range(start, stop)]
+        self.assertEqual(seeds, list(range(100, 110)))
+        self.assertEqual(partition(2, 8), [(0, 1), (1, 2)])
+
+    def test_worker_errors_reach_caller(self):
+        """An exception in one worker is re-raised by ``run_partitioned``."""
+        self.assertEqual(sorted(run_partitioned(failing_range, partition(6, 2), (-1,))),
+                         list(range(6)))
+        with self.assertRaises(ValueError):
+            list(run_partitioned(failing_range, partition(6, 2), (4,)))
+
+    def test_results_independent_of_workers(self):
+        """Parallel runs reproduce the single-process results."""
+        def key(result):
+            return result._replace(duration=0)
+        serial = sorted(map(key, run_selfplay(6, workers=1)))
+        parallel = sorted(map(key, run_selfplay(6, workers=3)))
+        self.assertEqual(serial, parallel)
+        self.assertEqual([r.seed for r in parallel], list(range(6)))
+        self.assertEqual(key(play_game(3)), key(play_game(3)))
+
+    def test_cli_runs_without_runpy_warning(self):
+        """The package does not import the runner before ``-m`` executes it."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        command = [sys.executable, '-W', 'error::RuntimeWarning', '-m',
+                   'src.sim.selfplay', '--games', '1', '--workers', '1']
+        self.assertEqual(subprocess.call(command, cwd=root,
+                                         stdout=subprocess.DEVNULL), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import asyncio
+import unittest
+from src.server.client import GameClient
+from src.server.protocol import LineDecoder, ProtocolError, encode
+from src.server.server import GameServer
+from src.server.timer_wheel import TimerWheel
+
+class TestTimerWheel(unittest.TestCase):
+    def test_fires_after_delay(self):
+        """Items fire on exactly the tick they were scheduled for, even past a lap."""
+        wheel = TimerWheel(size=8)
+        wheel.schedule(3, 'a')
+        wheel.schedule(8, 'b')
+        wheel.schedule(20, 'c')
+        fired = {}
+        for tick in range(1, 25):
+            for item in wheel.advance():
+                fired[item] = tick
+        self.assertEqual(fired, {'a': 3, 'b': 8, 'c': 20})
+        self.assertEqual(len(wheel), 0)
+
+class TestProtocol(unittest.TestCase):
+    def test_decoder_splits_lines(self):
+        """Messages split across reads are reassembled."""
+        decoder = LineDecoder()
+        data = encode({'type': 'join'}) + encode({'type': 'leave'})
+        self.assertEqual(decoder.feed(data[:5]), [])
+        self.assertEqual(decoder.feed(data[5:]), [{'type': 'join'}, {'type': 'leave'}])
+        with self.assertRaises(ProtocolError):
+            LineDecoder(max_line=10).feed(b'x' * 11)
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = GameServer(tick_rate=240, max_pending=4)
+        listener = await self.server.start_tcp('127.0.0.1', 0)
+        self.port = listener.sockets[0].getsockname()[1]
+        self.ticks = asyncio.get_running_loop().create_task(self.server.run())
+
+    async def asyncTearDown(self):
+        self.server.stop()
+        await self.ticks
+
+    async def test_actions_and_gravity(self):
+        """Actions are acknowledged in state updates and gravity moves the piece."""
+        client = GameClient()
+        await client.connect('127.0.0.1', self.port)
+        await client.join(seed=3)
+        state = await client.wait_for_ack(client.send_action('move_left'))
+        self.assertEqual(len(client.grid), 200)
+        start_y, x = state['y'], state['x']
+        while client.state['y'] == start_y:
+            await client.receive()
+        self.assertEqual(client.state['x'], x)
+        state = await client.wait_for_ack(client.send_action('hard_drop'))
+        self.assertNotEqual(client.grid, '0' * 200)
+        await client.close()
+
+    async def test_join_rejects_non_integer_seed(self):
+        """A join with a seed that is not an integer is answered with an error."""
+        client = GameClient()
+        await client.connect('127.0.0.1', self.port)
+        for seed in ('7', 1.5, True, [1]):
+            client.writer.write(encode({'type': 'join', 'seed': seed}))
+            with self.assertRaises(RuntimeError):
+                await client.receive()
+        self.assertIsNone(next(iter(self.server.sessions.values())).game_state)
+        await client.join(seed=None)
+        await client.close()
+
+    async def test_action_rejects_bad_sequence_numbers(self):
+        """Actions whose seq is not an integer or goes backwards are answered with an error."""
+        client = GameClient()
+        await client.connect('127.0.0.1', self.port)
+        await client.join(seed=2)
+        client.seq = 5
+        await client.wait_for_ack(client.send_action('noop'))
+        session = next(iter(self.server.sessions.values()))
+        for seq in ('7', 7.5, True, None, -1, 4):
+            client.writer.write(encode({'type': 'action', 'action': 'noop', 'seq': seq}))
+            # Gravity may send states ahead of the error
+            with self.assertRaises(RuntimeError):
+                while True:
+                    await client.receive()
+        self.assertEqual(session.ack, 6)
+        await client.wait_for_ack(client.send_action('noop'))
+        self.assertEqual(session.ack, 7)
+        await client.close()
+
+    async def test_many_sessions_share_one_tick_loop(self):
+        """Concurrent sessions all advance from the shared timer wheel."""
+        clients = [GameClient() for _ in range(20)]
+        for seed, client in enumerate(clients):
+            await client.connect('127.0.0.1', self.port)
+            await client.join(seed)
+        for client in clients:
+            await client.wait_for_ack(client.send_action('hard_drop'))
+        self.assertEqual(len(self.server.sessions), 20)
+        self.assertEqual(len(self.server.wheel), 20)
+        for client in clients:
+            await client.close()
+
+    async def test_action_flood_pauses_reading(self):
+        """A client queueing more actions than the limit is read more slowly."""
+        client = GameClient()
+        await client.connect('127.0.0.1', self.port)
+        await client.join(seed=1)
+        session = next(iter(self.server.sessions.values()))
+        self.server.handle_message(session, {'type': 'action', 'action': 'noop'})
+        for _ in range(3):
+            self.server.handle_message(session, {'type': 'action', 'action': 'noop'})
+        self.assertFalse(session.protocol.reading)
+        self.server.tick()
+        self.assertTrue(session.protocol.reading)
+        await client.close()
+
+if __name__ == '__main__':
+    unittest.main()
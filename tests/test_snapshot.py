@@ -0,0 +1,73 @@
+import random
+import unittest
+from src.engine.bitboard import BitBoard
+from src.engine.board import Board
+from src.engine.game_state import GameState
+from src.engine.randomizer import PieceGenerator
+from src.engine.snapshot import SnapshotRing
+
+ACTIONS = ('move_left', 'move_right', 'soft_drop', 'rotate_clockwise', 'hard_drop')
+
+def play(game, rng, steps):
+    """Apply random actions with periodic gravity; return the states seen."""
+    seen = []
+    for step in range(steps):
+        if game.game_over:
+            break
+        game.apply_action(rng.choice(ACTIONS))
+        if step % 3 == 0:
+            game.drop_piece()
+        seen.append((game.hash, game.score, game.board.get_grid_copy()))
+    return seen
+
+class TestSnapshot(unittest.TestCase):
+    def test_restore_replays_identically(self):
+        """After restoring, the same inputs reproduce the same future."""
+        for board_type in (Board, BitBoard):
+            game = GameState(board=board_type(),
+                             randomizer=PieceGenerator(8, block_size=16))
+            play(game, random.Random(1), 40)
+            snapshot = game.snapshot()
+            first = play(game, random.Random(2), 150)
+            game.restore(snapshot)
+            self.assertEqual(game.snapshot(), snapshot)
+            second = play(game, random.Random(2), 150)
+            self.assertEqual(first, second)
+
+    def test_restore_rebuilds_derived_state(self):
+        """Column tops, row masks and hashes match the restored cells."""
+        game = GameState(board=BitBoard(), randomizer=PieceGenerator(4, 'bag'))
+        snapshot = game.snapshot()
+        play(game, random.Random(3), 200)
+        game.restore(snapshot)
+        board = game.board
+        self.assertEqual(board.hash, board.compute_hash())
+        self.assertEqual(board.rows, [0] * Board.HEIGHT)
+        self.assertEqual(board.column_tops, [Board.HEIGHT] * Board.WIDTH)
+
+    def test_board_snapshot_shared_until_change(self):
+        """Snapshots share the board part until a piece locks."""
+        game = GameState(randomizer=PieceGenerator(5))
+        before = game.snapshot()
+        game.move_piece(1, 0)
+        self.assertIs(game.snapshot().board, before.board)
+        game.hard_drop()
+        self.assertIsNot(game.snapshot().board, before.board)
+
+    def test_ring_is_bounded(self):
+        """The ring keeps only the most recent snapshots."""
+        game = GameState(randomizer=PieceGenerator(6))
+        ring = SnapshotRing(8)
+        for tick in range(20):
+            ring.push(tick, game.snapshot())
+            game.drop_piece()
+        self.assertEqual(len(ring), 8)
+        self.assertIsNone(ring.get(11))
+        self.assertIsNotNone(ring.get(12))
+        ring.discard_after(15)
+        self.assertEqual(ring.newest, 15)
+        self.assertNotIn(16, ring)
+        self.assertIn(15, ring)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+import threading
+import unittest
+from src.engine.game_state import GameState
+from src.engine.randomizer import PieceGenerator
+
+try:
+    import pygame
+    from src.main import StartupProfile, TetrisGame
+    from src.ui.renderer import NullRenderer
+    from src.ui.retained_renderer import RetainedRenderer
+except ImportError:  # pygame is only needed by the UI
+    pygame = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class TestImports(unittest.TestCase):
+    def test_headless_packages_do_not_import_pygame(self):
+        """Engine, tools, server and benchmarks import without pygame."""
+        code = ("import sys; import src.engine, src.ai, src.bench, src.net, "
+                "src.server, src.sim; sys.exit('pygame' in sys.modules)")
+        self.assertEqual(subprocess.call([sys.executable, '-c', code], cwd=ROOT), 0)
+
+@unittest.skipIf(pygame is None, "pygame is not installed")
+class TestStartup(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_importing_main_leaves_path_alone(self):
+        """Only running main.py as a script adds the project root to sys.path."""
+        code = ("import sys; path = list(sys.path); import src.main; "
+                "sys.exit(sys.path != path)")
+        self.assertEqual(subprocess.call([sys.executable, '-c', code], cwd=ROOT), 0)
+
+    def test_background_assets(self):
+        """Frames render before the fonts load; text appears once they have."""
+        renderer = RetainedRenderer((800, 600), background_assets=True)
+        self.assertFalse(pygame.mixer.get_init())
+        self.assertFalse(pygame.joystick.get_init())
+        state = GameState(randomizer=PieceGenerator(1))
+        renderer.render(state)
+        self.assertTrue(renderer.wait_for_assets(5.0))
+        self.assertIsNotNone(renderer.assets_ms)
+        # The stats font comes from the loader thread, not the first draw_stats
+        self.assertIsNotNone(renderer.font_stats)
+        renderer.render(state)
+        # The HUD layer was redrawn with text after the fonts arrived
+        hud = renderer.background.subsurface(renderer.hud_rect)
+        self.assertNotEqual(pygame.transform.average_color(hud)[:3],
+                            renderer.BACKGROUND)
+
+    def test_no_render_loads_nothing_to_draw_with(self):
+        """A game that never renders opens its window but loads no fonts."""
+        game = TetrisGame(turbo=True, render_every=0, max_ticks=200, seed=1)
+        self.assertIsInstance(game.renderer, NullRenderer)
+        self.assertNotIn('renderer-assets', [t.name for t in threading.enumerate()])
+        self.assertFalse(pygame.font.get_init())
+        with self.assertRaises(SystemExit):
+            game.run()
+        self.assertEqual(game.ticks, 200)
+
+    def test_profile_report(self):
+        """Phases are reported in order with the background load time."""
+        profile = StartupProfile(10.0)
+        profile.lap('import pygame', 10.25)
+        profile.lap('first frame', 10.5)
+        report = profile.report(background_ms=3.0)
+        self.assertAlmostEqual(profile.total_ms, 500.0)
+        self.assertLess(report.index('import pygame'), report.index('first frame'))
+        self.assertIn('250.0 ms', report)
+        self.assertIn('(background): 3.0 ms', report)
+        self.assertNotIn('background', profile.report())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+from src.engine.board import Board
+from src.engine.game_state import GameState
+from src.engine.randomizer import PieceGenerator
+from src.ui import terminal_input
+from src.ui.terminal_renderer import TerminalRenderer
+
+class ScreenWindow:
+    """Stand-in for a curses window that records what was written to it."""
+
+    def __init__(self, rows=24, cols=80):
+        self.rows, self.cols = rows, cols
+        self.erase()
+        self.writes = []
+
+    def getmaxyx(self):
+        return self.rows, self.cols
+
+    def erase(self):
+        self.screen = [[' '] * self.cols for _ in range(self.rows)]
+
+    def addstr(self, y, x, text, attr=0):
+        self.writes.append((y, x, text))
+        self.screen[y][x:x + len(text)] = text
+
+    def refresh(self):
+        pass
+
+    def text(self):
+        return [''.join(row).rstrip() for row in self.screen]
+
+class KeyWindow:
+    """Stand-in for a curses window returning queued keys from getch."""
+
+    def __init__(self, keys):
+        self.keys = list(keys)
+
+    def nodelay(self, flag):
+        pass
+
+    def getch(self):
+        return self.keys.pop(0) if self.keys else -1
+
+class RecordingPipeline:
+    """Stand-in for an InputPipeline that records what is pushed."""
+
+    def __init__(self):
+        self.events = []
+
+    def push(self, time, action, pressed=True):
+        self.events.append((time, action, pressed))
+
+def render_fresh(game_state, rows=24, cols=80):
+    """Return the screen a new renderer draws for ``game_state``."""
+    window = ScreenWindow(rows, cols)
+    TerminalRenderer(window).render(game_state)
+    return window.text()
+
+class TestTerminalRenderer(unittest.TestCase):
+    def test_draws_board_piece_and_score(self):
+        """The board, active and ghost pieces, preview and score are drawn."""
+        state = GameState(randomizer=PieceGenerator(1))
+        screen = render_fresh(state)
+        self.assertEqual(screen[Board.HEIGHT], '+' + '-' * 20 + '+')
+        self.assertTrue(all(row.startswith('|') for row in screen[:Board.HEIGHT]))
+        self.assertIn('[]', screen[0] + screen[1])
+        self.assertIn('::', screen[Board.HEIGHT - 1])
+        self.assertIn('Next:', screen[0])
+        self.assertIn('Score: 0', screen[6])
+
+        state.toggle_pause()
+        self.assertIn('PAUSED', render_fresh(state)[10])
+
+    def test_only_changed_cells_are_written(self):
+        """Unchanged frames write nothing and a move writes only what moved."""
+        state = GameState(randomizer=PieceGenerator(2))
+        window = ScreenWindow()
+        renderer = TerminalRenderer(window)
+        renderer.render(state)
+        window.writes.clear()
+        renderer.render(state)
+        self.assertEqual(window.writes, [])
+
+        for action in ('move_left', 'rotate_clockwise', 'hard_drop', 'soft_drop'):
+            state.apply_action(action)
+            renderer.render(state)
+            self.assertEqual(window.text(), render_fresh(state))
+        window.writes.clear()
+        state.move_piece(1, 0)
+        renderer.render(state)
+        # The piece and its ghost each shift one cell: a few short runs
+        self.assertLess(sum(len(text) for _, _, text in window.writes), 40)
+
+    def test_tall_board_and_small_terminal(self):
+        """Tall boards scroll to the piece and small terminals clip the frame."""
+        state = GameState(board=Board(12, 200), randomizer=PieceGenerator(3))
+        window = ScreenWindow(rows=10, cols=20)
+        renderer = TerminalRenderer(window)
+        for _ in range(100):
+            state.drop_piece()
+            renderer.render(state)
+        self.assertEqual(window.text(), render_fresh(state, rows=10, cols=20))
+        y = state.piece_position['y']
+        self.assertLessEqual(renderer.view_top, y)
+        self.assertLess(y, renderer.view_top + 9)
+
+        # A resize repaints the whole terminal at its new size
+        window.rows, window.cols = 30, 100
+        renderer.render(state)
+        self.assertEqual(window.text(), render_fresh(state, rows=30, cols=100))
+
+    def test_each_key_is_stamped_when_read(self):
+        """Keys read in one batch keep the time each was read at."""
+        pipeline = RecordingPipeline()
+        window = KeyWindow([ord('z'), ord(' ')])
+        handler = terminal_input.TerminalInputHandler(window, pipeline)
+        clock = iter([1.0, 2.0, 3.0])
+        with mock.patch.object(terminal_input.time, 'perf_counter', lambda: next(clock)):
+            self.assertTrue(handler.handle_input(None))
+        self.assertEqual(pipeline.events, [
+            (1.0, 'rotate_counterclockwise', True), (1.0, 'rotate_counterclockwise', False),
+            (2.0, 'hard_drop', True), (2.0, 'hard_drop', False)])
+
+    def test_terminal_backend_does_not_import_pygame(self):
+        """Choosing the terminal backend never imports pygame."""
+        code = ("import sys; import src.main, src.ui; "
+                "from src.ui import TerminalInputHandler, TerminalRenderer; "
+                "sys.exit('pygame' in sys.modules)")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(subprocess.call([sys.executable, '-c', code], cwd=root), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from ..src.engine.tetromino import Tetromino
+from src.engine.tetromino import Tetromino
 
 class TestTetromino(unittest.TestCase):
     def test_tetromino_creation(self):
@@ -27,5 +27,25 @@ class TestTetromino(unittest.TestCase):
             piece.shape = piece.rotate_clockwise()
         self.assertEqual(piece.shape, original_shape)
 
+    def test_rotation_tables(self):
+        """Rotation states are shared, immutable and hold four cells each."""
+        for name, states in Tetromino.ROTATIONS.items():
+            self.assertEqual(len(states), 4)
+            for state in states:
+                self.assertEqual(len(state.cells), 4)
+                for dx, dy in state.cells:
+                    self.assertEqual(state.matrix[dy][dx], 1)
+            self.assertIs(Tetromino(name).states, states)
+
+    def test_rotate_only_changes_index(self):
+        """Rotating steps the index and selects the precomputed state."""
+        piece = Tetromino('L')
+        piece.rotate()
+        self.assertEqual(piece.rotation, 1)
+        self.assertIs(piece.state, Tetromino.ROTATIONS['L'][1])
+        piece.rotate(clockwise=False)
+        piece.rotate(clockwise=False)
+        self.assertEqual(piece.rotation, 3)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
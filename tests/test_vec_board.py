@@ -0,0 +1,39 @@
+import unittest
+
+try:
+    import numpy as np
+    from src.engine.vec_board import VecBoard
+except ImportError:  # NumPy is optional
+    np = None
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestVecBoard(unittest.TestCase):
+    def test_masks_track_colours(self):
+        """Row bitmasks stay consistent with the colour grid while playing."""
+        vec = VecBoard(64, seed=3)
+        rng = np.random.default_rng(3)
+        for _ in range(200):
+            vec.step(rng.integers(0, len(VecBoard.ACTIONS), vec.num_games))
+            vec.reset(vec.game_over)
+        weights = 1 << np.arange(VecBoard.WIDTH)
+        masks = ((vec.colors != 0) * weights).sum(axis=2)
+        np.testing.assert_array_equal(masks, vec.rows)
+        self.assertFalse((vec.rows == VecBoard.FULL_ROW).any())
+
+    def test_hard_drop_clears_line(self):
+        """An I piece dropped into a one-wide gap clears and scores."""
+        vec = VecBoard(2, seed=0, gravity_ticks=0)
+        vec.rows[:, -1] = VecBoard.FULL_ROW & ~0b1111
+        vec.colors[:, -1, 4:] = 5
+        vec.piece[:] = VecBoard.PIECE_NAMES.index('I')
+        vec.x[:] = 0
+        rewards, done = vec.step([VecBoard.ACTIONS.index('hard_drop'),
+                                  VecBoard.ACTIONS.index('noop')])
+        # The I piece falls 18 rows from y=0 with its cells on row 1
+        self.assertEqual(rewards.tolist(), [18 * 2 + 100, 0])
+        self.assertEqual(vec.lines_cleared.tolist(), [1, 0])
+        self.assertEqual(vec.rows[0, -1], 0)
+        self.assertFalse(done.any())
+
+if __name__ == '__main__':
+    unittest.main()